@@ -1,57 +1,305 @@
+import copy
+import functools
+import logging
 import os
+import pickle
+import tempfile
 import yaml
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one if
+# PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Plain stdlib logger: src.utils.logger imports this module, so it can't be used here.
+logger = logging.getLogger(__name__)
+logger.debug("YAML loader: %s", _SafeLoader.__name__)
+
+# Lowercased strings accepted as true by _parse_bool
+_TRUTHY = frozenset(('true', '1', 'yes', 'on'))
+
+
+def _parse_bool(value: Any) -> bool:
+    """Parse boolean value from various formats."""
+    if value is True or value is False:
+        return value
+    if isinstance(value, str):
+        return value.lower() in _TRUTHY
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return False
+
+
+@functools.lru_cache(maxsize=128)
+def _cast_int(value: Any) -> int:
+    """int() with the result memoized; env vars and YAML repeat the same few values."""
+    return int(value)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_bool(value: Any) -> bool:
+    return _parse_bool(value)
+
+
+def _cast_bool(value: Any) -> bool:
+    """Memoized _parse_bool; unhashable values bypass the cache."""
+    try:
+        return _cached_bool(value)
+    except TypeError:
+        return _parse_bool(value)
+
+
+# Parsed YAML keyed by (path, mtime_ns, size) so repeated loads of an
+# unchanged file skip the parser entirely.
+_PARSE_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# Settings that environment variables can override:
+# (dotted config path, environment variable, cast, default)
+_ENV_SCHEMA = (
+    ('logging.level',        'LOG_LEVEL',        str,       'INFO'),
+    ('logging.file',         'LOG_FILE',         str,       'logs/pa_stats.log'),
+    ('logging.max_bytes',    'LOG_MAX_BYTES',    _cast_int, 10485760),
+    ('logging.backup_count', 'LOG_BACKUP_COUNT', _cast_int, 5),
+    ('query.max_retries',    'PA_MAX_RETRIES',   _cast_int, 3),
+    ('query.retry_delay',    'PA_RETRY_DELAY',   _cast_int, 5),
+)
+
+# _ENV_SCHEMA regrouped per config section: {section: {key: default}} and
+# {section: {key: cast}}
+_SECTION_DEFAULTS: Dict[str, Dict[str, Any]] = {}
+_SECTION_CASTS: Dict[str, Dict[str, Any]] = {}
+for _path, _, _cast, _default in _ENV_SCHEMA:
+    _section, _key = _path.split('.')
+    _SECTION_DEFAULTS.setdefault(_section, {})[_key] = _default
+    _SECTION_CASTS.setdefault(_section, {})[_key] = _cast
+del _path, _cast, _default, _section, _key
+
+# Environment variables that override the first configured firewall:
+# (environment variable, firewall key, cast, default). Keys with a default
+# are always written so YAML values get the same cast as env values.
+_FIREWALL_ENV_SCHEMA = (
+    ('PA_HOST',       'host',       str,        None),
+    ('PA_PORT',       'port',       _cast_int,  443),
+    ('PA_API_KEY',    'api_key',    str,        None),
+    ('PA_VERIFY_SSL', 'verify_ssl', _cast_bool, True),
+    ('PA_TIMEOUT',    'timeout',    _cast_int,  30),
+)
+
+# Marks a missing key in Settings.get lookups (None is a valid config value)
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _flatten(value: Mapping[str, Any], prefix: str = ''):
+    """Yield (dotted key, value) for every node of a nested config mapping.
+    
+    Lazily normalized firewall tables are yielded but not descended into;
+    Settings.get() resolves keys below them on demand.
+    """
+    for k, v in value.items():
+        path = f'{prefix}.{k}' if prefix else str(k)
+        yield path, v
+        if isinstance(v, (dict, MappingProxyType)):
+            yield from _flatten(v, path)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted config key into its path components."""
+    return tuple(key.split('.'))
+
+
+class _FirewallTable(Mapping):
+    """Read-only firewall name -> config mapping that normalizes entries on first access.
+    
+    Iteration, len() and membership only look at the raw keys, so listing
+    firewall names never pays for normalizing their configs.
+    """
+    
+    __slots__ = ('_raw', '_defaults', '_overrides', '_first', '_resolved')
+    
+    def __init__(self, raw: Dict[str, Dict[str, Any]], defaults: Dict[str, Any],
+                 overrides: Tuple[Tuple[str, Any, Optional[str], Any], ...]):
+        self._raw = raw
+        self._defaults = defaults
+        self._overrides = overrides
+        self._first = next(iter(raw), None)
+        self._resolved: Dict[str, Mapping[str, Any]] = {}
+    
+    def __getitem__(self, name: str) -> Mapping[str, Any]:
+        firewall = self._resolved.get(name)
+        if firewall is None:
+            firewall = self._resolved[name] = self._normalize(name, self._raw[name])
+        return firewall
+    
+    def __iter__(self):
+        return iter(self._raw)
+    
+    def __len__(self) -> int:
+        return len(self._raw)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._raw
+    
+    def _normalize(self, name: str, raw: Dict[str, Any]) -> Mapping[str, Any]:
+        """Apply defaults and, for the first firewall, environment overrides."""
+        firewall = self._defaults | raw
+        if name == self._first:
+            # host/api_key are only touched when the env var is set; keys with
+            # a default are always cast so YAML values match env values.
+            for cfg_key, cast, value, default in self._overrides:
+                if value is None:
+                    if default is None:
+                        continue
+                    value = firewall.get(cfg_key, default)
+                firewall[cfg_key] = cast(value)
+        return _freeze(firewall)
+
 
 class Settings:
     """Configuration management for Palo Alto stats application."""
     
+    __slots__ = (
+        'config_file', '_config', '_flat',
+        '_firewalls', '_default_firewall_name', '_firewall_names',
+    )
+    
     def __init__(self, config_file: Optional[str] = None):
         self.config_file = config_file or os.getenv('PA_CONFIG_FILE', 'config/config.yaml')
         self.config = self._load_config()
+    
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """Loaded configuration (read-only after load)."""
+        return self._config
+    
+    @config.setter
+    def config(self, value: Mapping[str, Any]):
+        self._config = value
+        # Every dotted key resolved up front so get() is a single dict lookup
+        self._flat: Dict[str, Any] = dict(_flatten(value))
         
-    def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file and environment variables."""
-        config = {}
+        # Firewall lookup tables, resolved once per config
+        self._firewalls = value.get('firewalls', {})
+        default_name = value.get('default_firewall')
+        if default_name not in self._firewalls:
+            default_name = next(iter(self._firewalls), None)
+        self._default_firewall_name = default_name
+        self._firewall_names = tuple(self._firewalls)
         
+    def _load_config(self) -> Mapping[str, Any]:
+        """Load configuration from YAML file and environment variables."""
         # Load from YAML file if exists
-        if os.path.exists(self.config_file):
-            with open(self.config_file, 'r') as f:
-                config = yaml.safe_load(f) or {}
+        try:
+            config = self._read_yaml()
+        except FileNotFoundError:
+            config = {}
         
         # Handle firewall configuration (support both old and new formats)
         firewall_config = self._load_firewall_config(config)
         
-        # Override with environment variables
-        config.update({
-            'firewalls': firewall_config,
-            'logging': {
-                'level': os.getenv('LOG_LEVEL', config.get('logging', {}).get('level', 'INFO')),
-                'file': os.getenv('LOG_FILE', config.get('logging', {}).get('file', 'logs/pa_stats.log')),
-                'max_bytes': int(os.getenv('LOG_MAX_BYTES', config.get('logging', {}).get('max_bytes', 10485760))),
-                'backup_count': int(os.getenv('LOG_BACKUP_COUNT', config.get('logging', {}).get('backup_count', 5))),
-            },
-            'query': {
-                'max_retries': int(os.getenv('PA_MAX_RETRIES', config.get('query', {}).get('max_retries', 3))),
-                'retry_delay': int(os.getenv('PA_RETRY_DELAY', config.get('query', {}).get('retry_delay', 5))),
-            }
-        })
+        # Merge each section as defaults | YAML | environment, then cast
+        env = os.environ
+        overrides: Dict[str, Dict[str, Any]] = {}
+        for path, env_var, _, _ in _ENV_SCHEMA:
+            value = env.get(env_var)
+            if value is not None:
+                section, key = _split_key(path)
+                overrides.setdefault(section, {})[key] = value
+        
+        for section, defaults in _SECTION_DEFAULTS.items():
+            merged = defaults | (config.get(section) or {}) | overrides.get(section, {})
+            for key, cast in _SECTION_CASTS[section].items():
+                merged[key] = cast(merged[key])
+            config[section] = merged
+        config['firewalls'] = firewall_config
         
-        return config
+        # Nothing should mutate the loaded config; freezing it also keeps
+        # the flattened get() index valid for the lifetime of the instance.
+        return _freeze(config)
+    
+    def _read_yaml(self) -> Dict[str, Any]:
+        """Parse the YAML config file, reusing the cached result if the file is unchanged.
+        
+        Besides the in-process cache, the parsed document is pickled to
+        '<config_file>.pkl' so later processes can skip YAML parsing too.
+        Set PA_DISABLE_CONFIG_CACHE=true to always parse the YAML file.
+        """
+        st = os.stat(self.config_file)
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = (os.path.abspath(self.config_file),) + stamp
+        
+        if key not in _PARSE_CACHE:
+            use_disk_cache = not _cast_bool(os.environ.get('PA_DISABLE_CONFIG_CACHE', False))
+            parsed = self._read_pickle(stamp) if use_disk_cache else None
+            if parsed is None:
+                with open(self.config_file, 'r') as f:
+                    parsed = yaml.load(f, Loader=_SafeLoader) or {}
+                if use_disk_cache:
+                    self._write_pickle(stamp, parsed)
+            _PARSE_CACHE[key] = parsed
+        
+        # Hand out a copy: _load_config mutates the result in place
+        return copy.deepcopy(_PARSE_CACHE[key])
+    
+    def _read_pickle(self, stamp: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """Return the pickled config if it was written for this version of the YAML file."""
+        try:
+            with open(f"{self.config_file}.pkl", 'rb') as f:
+                cached_stamp, parsed = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable config cache for %s: %s", self.config_file, e)
+            return None
+        return parsed if cached_stamp == stamp else None
+    
+    def _write_pickle(self, stamp: Tuple[int, int], parsed: Dict[str, Any]):
+        """Atomically write the parsed config next to the YAML file (best effort)."""
+        cache_file = f"{self.config_file}.pkl"
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file) or '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump((stamp, parsed), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            # A read-only config directory just means no disk cache
+            logger.debug("Could not write config cache %s: %s", cache_file, e)
     
-    def _load_firewall_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Load firewall configuration supporting both old and new formats."""
+    def _load_firewall_config(self, config: Dict[str, Any]) -> '_FirewallTable':
+        """Load firewall configuration supporting both old and new formats.
+        
+        Entries are normalized lazily by _FirewallTable on first access.
+        """
         firewalls = {}
+        defaults = {}
         
         # Check for new multi-firewall format
         if 'firewalls' in config:
             firewalls = config['firewalls']
             # Ensure routing_mode and enabled are set for each firewall
-            for firewall_name, firewall_config in firewalls.items():
-                if 'routing_mode' not in firewall_config:
-                    firewall_config['routing_mode'] = 'auto'  # Default to auto-detection
-                if 'enabled' not in firewall_config:
-                    firewall_config['enabled'] = True  # Default to enabled
+            defaults = {
+                'routing_mode': 'auto',  # Default to auto-detection
+                'enabled': True,  # Default to enabled
+            }
         # Check for old single firewall format (backward compatibility)
         elif 'firewall' in config:
             # Convert old format to new format
@@ -67,28 +315,18 @@ class Settings:
                 'location': 'Unknown'
             }
         
-        # Override with environment variables if they exist
-        # Environment variables will override the first firewall in the list
-        if firewalls:
-            first_firewall_key = list(firewalls.keys())[0]
-            first_firewall = firewalls[first_firewall_key]
-            
-            # Override with environment variables
-            first_firewall.update({
-                'host': os.getenv('PA_HOST', first_firewall.get('host')),
-                'port': int(os.getenv('PA_PORT', first_firewall.get('port', 443))),
-                'api_key': os.getenv('PA_API_KEY', first_firewall.get('api_key')),
-                'verify_ssl': self._parse_bool(os.getenv('PA_VERIFY_SSL', first_firewall.get('verify_ssl', True))),
-                'timeout': int(os.getenv('PA_TIMEOUT', first_firewall.get('timeout', 30))),
-            })
-            
-            firewalls[first_firewall_key] = first_firewall
-        
-        return firewalls
+        # Environment variables will override the first firewall in the list.
+        # They are read now so later changes to os.environ don't leak in.
+        env = os.environ
+        overrides = tuple(
+            (cfg_key, cast, env.get(env_key), default)
+            for env_key, cfg_key, cast, default in _FIREWALL_ENV_SCHEMA
+        )
+        return _FirewallTable(firewalls, defaults, overrides)
     
-    def get_firewalls(self) -> Dict[str, Any]:
+    def get_firewalls(self) -> Mapping[str, Any]:
         """Get all configured firewalls (including disabled ones)."""
-        return self.config.get('firewalls', {})
+        return self._firewalls
     
     def get_enabled_firewalls(self) -> Dict[str, Any]:
         """Get only enabled firewalls for polling."""
@@ -113,24 +351,12 @@ class Settings:
     
     def get_firewall(self, name: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get a specific firewall configuration by name (regardless of enabled status)."""
-        firewalls = self.get_firewalls()
-        
-        if not firewalls:
-            return None
-        
         # If no name specified, use default or first available
-        if not name:
-            default_name = self.config.get('default_firewall')
-            if default_name and default_name in firewalls:
-                return firewalls[default_name]
-            # Return first firewall if no default specified
-            return firewalls[list(firewalls.keys())[0]]
-        
-        return firewalls.get(name)
+        return self._firewalls.get(name or self._default_firewall_name)
     
-    def get_firewall_names(self) -> List[str]:
-        """Get list of all configured firewall names (including disabled ones)."""
-        return list(self.get_firewalls().keys())
+    def get_firewall_names(self) -> Tuple[str, ...]:
+        """Get all configured firewall names (including disabled ones)."""
+        return self._firewall_names
     
     def get_enabled_firewall_names(self) -> List[str]:
         """Get list of enabled firewall names only."""
@@ -138,26 +364,39 @@ class Settings:
     
     def _parse_bool(self, value: Any) -> bool:
         """Parse boolean value from various formats."""
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ('true', '1', 'yes', 'on')
-        if isinstance(value, (int, float)):
-            return bool(value)
-        return False
+        return _cast_bool(value)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation."""
-        keys = key.split('.')
-        value = self.config
+        value = self._flat.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
         
-        for k in keys:
-            if isinstance(value, dict) and k in value:
+        # Keys below a lazily normalized firewall table aren't pre-flattened
+        value = self.config
+        for k in _split_key(key):
+            if isinstance(value, Mapping) and k in value:
                 value = value[k]
             else:
                 return default
         
+        self._flat[key] = value
         return value
 
-# Global settings instance
-settings = Settings()
\ No newline at end of file
+
+class _LazySettings:
+    """Proxy for the global Settings instance that defers loading until first use."""
+    
+    __slots__ = ('_instance',)
+    
+    def __init__(self):
+        self._instance = None
+    
+    def __getattr__(self, name: str) -> Any:
+        if self._instance is None:
+            self._instance = Settings()
+        return getattr(self._instance, name)
+
+
+# Global settings instance (config is read on first attribute access, not at import)
+settings = _LazySettings()
\ No newline at end of file
@@ -22,34 +22,602 @@ Usage:
     
     # Export schema to file
     python data_analyzer.py --input stats.json --export schema.json
+    
+    # Stream a large file one firewall at a time (requires ijson)
+    python data_analyzer.py --input stats.json --stream
 
 Note: This analyzer uses 'hostname' tags throughout the schema proposals.
 The actual converter (influxdb_converter.py) extracts the firewall's real hostname
 from system data and uses it consistently across all measurements.
 """
 
+import functools
+import gzip
+import importlib.util
 import json
 import sys
-from typing import Dict, Any, List, Tuple
-from collections import defaultdict
+from typing import Dict, Any, DefaultDict, Iterator, List, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
+
+# rich is only needed for terminal output, so it is imported where it is used;
+# runs that never print a table don't pay for importing it.
+RICH_AVAILABLE = importlib.util.find_spec('rich') is not None
+if not RICH_AVAILABLE:
+    print("Note: Install 'rich' for better formatting: pip install rich")
 
+# orjson is optional; it parses and serializes large all-stats payloads
+# several times faster than the stdlib json module.
 try:
-    from tabulate import tabulate
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich import box
-    from rich.markdown import Markdown
-    RICH_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    RICH_AVAILABLE = False
-    print("Note: Install 'rich' for better formatting: pip install rich")
+    ORJSON_AVAILABLE = False
+
+# ijson is optional; it enables --stream mode, which parses one firewall at
+# a time instead of loading the whole document.
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def _json_loads(raw):
+    """
+    Parse JSON from bytes or str, using orjson when available.
+    
+    Both parsers already hand back one shared str object for each repeated
+    object key (orjson's key cache, json's per-call memo), so keys such as
+    'protocol' on thousands of routes are not stored once per route.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dump(obj: Any, output_file: str, compress: bool = False):
+    """
+    Write obj to output_file as indented JSON, using orjson when available.
+    
+    The file is gzip-compressed when compress is set or its name ends in .gz.
+    """
+    opener = gzip.open if compress or str(output_file).endswith('.gz') else open
+    if ORJSON_AVAILABLE:
+        with opener(output_file, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with opener(output_file, 'wt', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2)
+
+
+# Shared read-only default for dict lookups, so misses don't allocate a new {}
+_EMPTY = MappingProxyType({})
+
+# InfluxDB data type by exact Python type (JSON only yields these builtins);
+# anything else is stored as a string
+_TYPE_MAP = {bool: "boolean", int: "integer", float: "float", str: "string"}
+
+# Marks an absent key where None is a legitimate value
+_MISSING = object()
+
+# PAN-OS 'yes'/'no' flags as booleans (anything else maps to None)
+_YESNO = {'yes': True, 'no': False}
+
+# Legacy BGP peer field names and their advanced routing equivalents
+_PEER_RENAME = {
+    'status': 'state',
+    'status-duration': 'status-time',
+    'peer-group': 'peer-group-name',
+    'peer-address': 'peer-ip',
+    'local-address': 'local-ip',
+}
+
+# Separators for the plain-text report
+_SEP_EQ = '=' * 80
+_SEP_DASH = '-' * 80
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Wrap a single XML-derived entry in a list; an empty (None) entry becomes []."""
+    if type(value) is list:
+        return value
+    return [] if value is None else [value]
+
+
+def _scale(value: Any, divisor: float, ndigits: int = 2) -> Any:
+    """Divide and round a metric, passing a missing (None) value through untouched."""
+    return round(value / divisor, ndigits) if value is not None else None
+
+
+def _dig(data: Any, *keys: str, default: Any = None) -> Any:
+    """Follow keys through nested dicts; default if a step is missing, None or not a dict."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+def _entries(node: Any) -> List[Any]:
+    """Return the node['entries']['entry'] list of a PAN-OS table; [] if absent or empty."""
+    return _as_list(_dig(node, 'entries', 'entry'))
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings used as grouping keys; a few VRF names repeat across thousands of routes."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _strip_xml_attributes(entry: Dict[str, Any]):
+    """Remove XML attribute keys ('@name') from a parsed entry in place."""
+    for k in [k for k in entry if k[:1] == '@']:
+        del entry[k]
+
+
+# Static proposal layouts, interpreted by _build_proposal().
+# tags:   (tag, source key, description)
+# fields: (field, source key, unit, description[, converter])
+_SYSTEM_IDENTITY_SCHEMA = {
+    'tags': (
+        ('hostname', 'hostname', 'Device hostname (primary identifier)'),
+        ('model', 'model', 'Device model'),
+        ('family', 'family', 'Device family'),
+        ('serial', 'serial', 'Serial number'),
+    ),
+    'fields': (
+        ('sw_version', 'sw-version', '', 'Software version'),
+        ('vm_cores', 'vm-cores', 'cores', 'Number of VM cores'),
+        ('vm_mem_mb', 'vm-mem', 'MiB', 'VM memory', lambda v: _scale(v, 1024)),
+        ('operational_mode', 'operational-mode', '', 'Operational mode'),
+        ('advanced_routing', 'advanced-routing', '', 'Advanced routing status'),
+        ('multi_vsys', 'multi-vsys', '', 'Multi-vsys capability status'),
+        ('ip_address', 'ip-address', '', 'Management IP address'),
+        ('mac_address', 'mac-address', '', 'Management MAC address'),
+        ('ipv6_address', 'ipv6-address', '', 'Management IPv6 address'),
+        # Convert yes/no to boolean for display
+        ('is_dhcp', 'is-dhcp', '', 'Using DHCP for IPv4', _YESNO.get),
+        ('is_dhcp6', 'is-dhcp6', '', 'Using DHCP for IPv6', _YESNO.get),
+    ),
+}
+
+_CONTENT_VERSIONS_SCHEMA = {
+    'tags': (
+        ('hostname', 'hostname', ''),
+    ),
+    'fields': (
+        ('app_version', 'app-version', '', 'Application and threat content version'),
+        ('av_version', 'av-version', '', 'Anti-virus content version (0 = not installed)'),
+        ('threat_version', 'threat-version', '', 'Threat prevention content version (0 = not installed)'),
+        ('wf_private_version', 'wf-private-version', '', 'WildFire private cloud version'),
+        ('wildfire_version', 'wildfire-version', '', 'WildFire content version'),
+        ('wildfire_rt', 'wildfire-rt', '', 'WildFire real-time status'),
+        ('url_filtering_version', 'url-filtering-version', '', 'URL filtering database version'),
+        ('url_db', 'url-db', '', 'URL database source'),
+        ('logdb_version', 'logdb-version', '', 'Log database version'),
+        ('device_dictionary_version', 'device-dictionary-version', '', 'Device dictionary version'),
+        ('global_protect_client_package_version', 'global-protect-client-package-version', '',
+         'GlobalProtect client package version'),
+    ),
+}
+
+
+def _normalize_legacy_routing(routing_data: Dict[str, Any]) -> None:
+    """
+    Convert one firewall's legacy routing data to the advanced routing layout, in place.
+    
+    Kept as a plain, fully annotated function: it is the hot loop on large
+    routing tables and has no dependency on analyzer state.
+    """
+    # Normalize bgp_summary
+    if 'bgp_summary' in routing_data:
+        bgp_summary = routing_data['bgp_summary']
+        if bgp_summary and 'entry' in bgp_summary and isinstance(bgp_summary['entry'], dict):
+            entry = bgp_summary['entry']
+            vrf_name = _intern(entry.get('@virtual-router', 'default'))
+            _strip_xml_attributes(entry)
+            routing_data['bgp_summary'] = {vrf_name: entry}
+    
+    # Normalize bgp_peer_status
+    if 'bgp_peer_status' in routing_data:
+        bgp_peers = routing_data['bgp_peer_status']
+        if bgp_peers and 'entry' in bgp_peers:
+            entries = _as_list(bgp_peers['entry'])
+            
+            normalized: Dict[str, Dict[str, Any]] = {}
+            for entry in entries:
+                if isinstance(entry, dict):
+                    peer_name = _intern(entry.get('@peer', entry.get('peer-name', 'unknown')))
+                    _strip_xml_attributes(entry)
+                    # Map legacy field names to advanced format
+                    for old, new in _PEER_RENAME.items():
+                        value = entry.pop(old, _MISSING)
+                        if value is not _MISSING:
+                            entry[new] = value
+                    normalized[peer_name] = entry
+            
+            routing_data['bgp_peer_status'] = normalized
+    
+    # Normalize routing_table, bgp_routes, static_routes
+    for collection_name in ['routing_table', 'bgp_routes', 'static_routes']:
+        if collection_name in routing_data:
+            routes = routing_data[collection_name]
+            if routes and 'entry' in routes:
+                entries = _as_list(routes['entry'])
+                
+                # Group by VRF, then destination (a list handles multiple routes per destination)
+                vrf_routes: DefaultDict[str, DefaultDict[str, List[Dict[str, Any]]]] = defaultdict(
+                    lambda: defaultdict(list)
+                )
+                for entry in entries:
+                    if isinstance(entry, dict):
+                        vrf_name = _intern(entry.get('virtual-router', 'default'))
+                        destination = _intern(entry.get('destination', 'unknown'))
+                        
+                        # Reuse the entry, minus the virtual-router field
+                        entry.pop('virtual-router', None)
+                        vrf_routes[vrf_name][destination].append(entry)
+                
+                # Plain dicts so later lookups of missing keys don't insert them
+                routing_data[collection_name] = {
+                    vrf_name: dict(destinations) for vrf_name, destinations in vrf_routes.items()
+                }
+
+
+def _count_routes(vrf_collection: Dict[str, Any]) -> int:
+    """Count routes in a {vrf: {destination: [route, ...]}} collection, skipping non-list values."""
+    return sum(
+        len(route_list)
+        for vrf_routes in vrf_collection.values()
+        for route_list in vrf_routes.values() if isinstance(route_list, list)
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_protocol(protocol: Any) -> str:
+    """Lowercase, strip and underscore a protocol name; the same few names repeat on every firewall."""
+    return str(protocol).lower().strip().replace(' ', '_')
+
+
+def _count_protocols(vrf_routes: Dict[str, Any]) -> Dict[str, int]:
+    """Count one VRF's routing_table routes per normalized protocol, in first-seen order."""
+    raw_counts = Counter(
+        route.get('protocol', 'unknown')
+        for route_list in vrf_routes.values() if isinstance(route_list, list)
+        for route in route_list
+    )
+    # Different raw names can normalize to the same key
+    counts: Dict[str, int] = {}
+    for protocol, count in raw_counts.items():
+        protocol_normalized = _normalize_protocol(protocol)
+        counts[protocol_normalized] = counts.get(protocol_normalized, 0) + count
+    return counts
+
+
+# Hardware sensor sections of the environmental data, interpreted by
+# iter_environmental_proposals(). count_note takes the sensor count; the
+# notes tuple is shared as-is by every firewall's proposal.
+# fields: (field, source key, unit, description)
+_ENV_SENSOR_SCHEMAS = (
+    {
+        'section': 'thermal',
+        'measurement': 'palo_alto_env_thermal',
+        'description': 'Thermal sensor temperature readings',
+        'sensor_description': 'Sensor description/location',
+        'fields': (
+            ('temperature_c', 'DegreesC', '°C', 'Current temperature'),
+            ('min_temp_c', 'min', '°C', 'Minimum threshold'),
+            ('max_temp_c', 'max', '°C', 'Maximum threshold'),
+            ('alarm', 'alarm', '', 'Alarm status'),
+        ),
+        'cardinality': 'medium',
+        'count_note': 'One data point per thermal sensor ({count} sensors detected)',
+        'notes': (
+            'Monitor for temperature approaching max threshold',
+            'Alert on alarm=true or temperature >90% of max threshold',
+        ),
+    },
+    {
+        'section': 'fan',
+        'measurement': 'palo_alto_env_fan',
+        'description': 'Fan speed measurements',
+        'sensor_description': 'Fan description/location',
+        'fields': (
+            ('rpm', 'RPMs', 'RPM', 'Current fan speed'),
+            ('min_rpm', 'min', 'RPM', 'Minimum threshold'),
+            ('alarm', 'alarm', '', 'Alarm status'),
+        ),
+        'cardinality': 'medium',
+        'count_note': 'One data point per fan ({count} fans detected)',
+        'notes': (
+            'Monitor for RPM falling below minimum threshold',
+            'Alert on alarm=true or RPM below minimum',
+        ),
+    },
+    {
+        'section': 'power',
+        'measurement': 'palo_alto_env_power',
+        'description': 'Voltage sensor readings',
+        'sensor_description': 'Voltage sensor description',
+        'fields': (
+            ('volts', 'Volts', 'V', 'Current voltage'),
+            ('min_volts', 'min', 'V', 'Minimum threshold'),
+            ('max_volts', 'max', 'V', 'Maximum threshold'),
+            ('alarm', 'alarm', '', 'Alarm status'),
+        ),
+        'cardinality': 'medium',
+        'count_note': 'One data point per voltage sensor ({count} sensors detected)',
+        'notes': (
+            'Monitor for voltage outside min/max range',
+            'Alert on alarm=true or voltage out of range',
+        ),
+    },
+    {
+        'section': 'power-supply',
+        'measurement': 'palo_alto_env_power_supply',
+        'description': 'Power supply status and presence',
+        'sensor_description': 'Power supply description',
+        'fields': (
+            ('inserted', 'Inserted', '', 'Power supply inserted/present'),
+            ('min_required', 'min', '', 'Minimum required status'),
+            ('alarm', 'alarm', '', 'Alarm status'),
+        ),
+        'cardinality': 'low',
+        'count_note': 'One data point per power supply ({count} supplies detected)',
+        'notes': (
+            'Monitor for power supply removal or failure',
+            'Alert on alarm=true or inserted=false',
+        ),
+    },
+)
+
+# Fields copied from a single source entry, added with add_fields_bulk().
+# (field, source key, unit, description)
+_CPU_USAGE_FIELDS = (
+    ('cpu_user', 'cpu_user', '%', 'User CPU time'),
+    ('cpu_system', 'cpu_system', '%', 'System CPU time'),
+    ('cpu_nice', 'cpu_nice', '%', 'Nice CPU time'),
+    ('cpu_idle', 'cpu_idle', '%', 'Idle CPU time'),
+    ('cpu_iowait', 'cpu_iowait', '%', 'IO wait time'),
+    ('cpu_hardware_interrupt', 'cpu_hardware_interrupt', '%', 'Hardware interrupt time'),
+    ('cpu_software_interrupt', 'cpu_software_interrupt', '%', 'Software interrupt time'),
+    ('cpu_steal', 'cpu_steal', '%', 'Steal time'),
+)
+
+_MEMORY_USAGE_FIELDS = (
+    ('memory_total_mib', 'memory_total_mib', 'MiB', 'Total memory'),
+    ('memory_free_mib', 'memory_free_mib', 'MiB', 'Free memory'),
+    ('memory_used_mib', 'memory_used_mib', 'MiB', 'Used memory'),
+    ('memory_buff_cache_mib', 'memory_buff_cache_mib', 'MiB', 'Buffer/cache memory'),
+    ('memory_available_mib', 'memory_available_mib', 'MiB', 'Available memory'),
+)
+
+_SWAP_USAGE_FIELDS = (
+    ('swap_total_mib', 'swap_total_mib', 'MiB', 'Total swap'),
+    ('swap_free_mib', 'swap_free_mib', 'MiB', 'Free swap'),
+    ('swap_used_mib', 'swap_used_mib', 'MiB', 'Used swap'),
+    ('swap_usage_percent', 'swap_usage_percent', '%', 'Swap usage percentage'),
+)
+
+_TASK_STATS_FIELDS = (
+    ('tasks_total', 'tasks_total', '', 'Total tasks'),
+    ('tasks_running', 'tasks_running', '', 'Running tasks'),
+    ('tasks_sleeping', 'tasks_sleeping', '', 'Sleeping tasks'),
+    ('tasks_stopped', 'tasks_stopped', '', 'Stopped tasks'),
+    ('tasks_zombie', 'tasks_zombie', '', 'Zombie tasks'),
+)
+
+_DATAPLANE_TASK_FIELDS = (
+    ('task_flow_lookup', 'flow_lookup', '%', 'Flow lookup task CPU'),
+    ('task_flow_fastpath', 'flow_fastpath', '%', 'Flow fastpath task CPU'),
+    ('task_flow_slowpath', 'flow_slowpath', '%', 'Flow slowpath task CPU'),
+    ('task_flow_forwarding', 'flow_forwarding', '%', 'Flow forwarding task CPU'),
+    ('task_flow_mgmt', 'flow_mgmt', '%', 'Flow management task CPU'),
+    ('task_flow_ctrl', 'flow_ctrl', '%', 'Flow control task CPU'),
+    ('task_nac_result', 'nac_result', '%', 'NAC result task CPU'),
+    ('task_flow_np', 'flow_np', '%', 'Flow network processor task CPU'),
+    ('task_dfa_result', 'dfa_result', '%', 'DFA result task CPU'),
+    ('task_module_internal', 'module_internal', '%', 'Module internal task CPU'),
+    ('task_aho_result', 'aho_result', '%', 'Aho-Corasick result task CPU'),
+    ('task_zip_result', 'zip_result', '%', 'Compression result task CPU'),
+    ('task_pktlog_forwarding', 'pktlog_forwarding', '%', 'Packet log forwarding task CPU'),
+    ('task_send_out', 'send_out', '%', 'Send out task CPU'),
+    ('task_flow_host', 'flow_host', '%', 'Flow host task CPU'),
+    ('task_send_host', 'send_host', '%', 'Send host task CPU'),
+    ('task_fpga_result', 'fpga_result', '%', 'FPGA result task CPU'),
+)
+
+# Dataplane resource utilization fields (field, description); averaged over 60s
+_DATAPLANE_RESOURCE_FIELDS = (
+    ('resource_session_avg', 'Session resource utilization (60s avg)'),
+    ('resource_packet_buffer_avg', 'Packet buffer utilization (60s avg)'),
+    ('resource_packet_descriptor_avg', 'Packet descriptor utilization (60s avg)'),
+    ('resource_sw_tags_descriptor_avg', 'SW tags descriptor utilization (60s avg)'),
+)
+
+_INTERFACE_INFO_FIELDS = (
+    ('state', 'state', '', 'Interface state (up/down)'),
+    ('speed', 'speed', 'Mbps', 'Interface speed'),
+    ('duplex', 'duplex', '', 'Duplex mode'),
+    ('mac', 'mac', '', 'MAC address'),
+    ('mode', 'mode', '', 'Interface mode'),
+    ('fec', 'fec', '', 'FEC status'),
+)
+
+_INTERFACE_IFNET_FIELDS = (
+    ('ip', 'ip', '', 'IP address/mask'),
+    ('fwd', 'fwd', '', 'Forwarding (routing) info'),
+    ('tag', 'tag', '', 'VLAN tag'),
+)
+
+_INTERFACE_PORT_COUNTER_FIELDS = (
+    # Port-level RX counters
+    ('rx_bytes', 'rx-bytes', 'bytes', 'Received bytes (port level)'),
+    ('rx_unicast', 'rx-unicast', 'packets', 'Received unicast packets'),
+    ('rx_multicast', 'rx-multicast', 'packets', 'Received multicast packets'),
+    ('rx_broadcast', 'rx-broadcast', 'packets', 'Received broadcast packets'),
+    ('rx_error', 'rx-error', 'packets', 'Receive errors'),
+    ('rx_discards', 'rx-discards', 'packets', 'Receive discards'),
+
+    # Port-level TX counters
+    ('tx_bytes', 'tx-bytes', 'bytes', 'Transmitted bytes (port level)'),
+    ('tx_unicast', 'tx-unicast', 'packets', 'Transmitted unicast packets'),
+    ('tx_multicast', 'tx-multicast', 'packets', 'Transmitted multicast packets'),
+    ('tx_broadcast', 'tx-broadcast', 'packets', 'Transmitted broadcast packets'),
+    ('tx_error', 'tx-error', 'packets', 'Transmit errors'),
+    ('tx_discards', 'tx-discards', 'packets', 'Transmit discards'),
+    ('link_down_count', 'link-down', '', 'Link down count'),
+)
+
+_INTERFACE_HW_COUNTER_FIELDS = (
+    ('ibytes', 'ibytes', 'bytes', 'Input bytes'),
+    ('obytes', 'obytes', 'bytes', 'Output bytes'),
+    ('ipackets', 'ipackets', 'packets', 'Input packets'),
+    ('opackets', 'opackets', 'packets', 'Output packets'),
+    ('ierrors', 'ierrors', 'packets', 'Input errors'),
+    ('idrops', 'idrops', 'packets', 'Input drops'),
+)
+
+_INTERFACE_LOGICAL_COUNTER_FIELDS = (
+    # Basic traffic counters
+    ('ibytes', 'ibytes', 'bytes', 'Input bytes (firewall level)'),
+    ('obytes', 'obytes', 'bytes', 'Output bytes (firewall level)'),
+    ('ipackets', 'ipackets', 'packets', 'Input packets'),
+    ('opackets', 'opackets', 'packets', 'Output packets'),
+    ('ierrors', 'ierrors', 'packets', 'Input errors'),
+    ('idrops', 'idrops', 'packets', 'Input drops'),
+
+    # Firewall processing counters
+    ('flowstate', 'flowstate', 'packets', 'Flow state drops'),
+    ('ifwderrors', 'ifwderrors', 'packets', 'Forwarding errors'),
+
+    # Routing/forwarding drops
+    ('noroute', 'noroute', 'packets', 'No route drops'),
+    ('noarp', 'noarp', 'packets', 'No ARP entry drops'),
+    ('noneigh', 'noneigh', 'packets', 'No neighbor drops'),
+    ('neighpend', 'neighpend', 'packets', 'Neighbor pending drops'),
+    ('nomac', 'nomac', 'packets', 'No MAC drops'),
+
+    # Security drops
+    ('zonechange', 'zonechange', 'packets', 'Zone change drops'),
+    ('land', 'land', 'packets', 'LAND attack drops'),
+    ('pod', 'pod', 'packets', 'Ping of death drops'),
+    ('teardrop', 'teardrop', 'packets', 'Teardrop attack drops'),
+    ('ipspoof', 'ipspoof', 'packets', 'IP spoofing drops'),
+    ('macspoof', 'macspoof', 'packets', 'MAC spoofing drops'),
+    ('icmp_frag', 'icmp_frag', 'packets', 'ICMP fragment drops'),
+
+    # Encapsulation
+    ('l2_encap', 'l2_encap', 'packets', 'L2 encapsulation'),
+    ('l2_decap', 'l2_decap', 'packets', 'L2 decapsulation'),
+
+    # Connection counters
+    ('tcp_conn', 'tcp_conn', 'connections', 'TCP connections'),
+    ('udp_conn', 'udp_conn', 'connections', 'UDP connections'),
+    ('sctp_conn', 'sctp_conn', 'connections', 'SCTP connections'),
+    ('other_conn', 'other_conn', 'connections', 'Other connections'),
+)
+
+_BGP_MESSAGE_STATS_FIELDS = (
+    ('messages_sent', 'totalSent', '', 'Total messages sent'),
+    ('messages_received', 'totalRecv', '', 'Total messages received'),
+    ('updates_sent', 'updatesSent', '', 'Update messages sent'),
+    ('updates_received', 'updatesRecv', '', 'Update messages received'),
+    ('keepalives_sent', 'keepalivesSent', '', 'Keepalives sent'),
+    ('keepalives_received', 'keepalivesRecv', '', 'Keepalives received'),
+    ('notifications_sent', 'notificationsSent', '', 'Notifications sent'),
+    ('notifications_received', 'notificationsRecv', '', 'Notifications received'),
+)
+
+_IPSEC_FLOW_FIELDS = (
+    ('flow_id', 'id', '', 'Flow ID'),
+    ('gateway_id', 'gwid', '', 'Associated gateway ID'),
+    ('inner_interface', 'inner-if', '', 'Inner (logical) interface'),
+    ('outer_interface', 'outer-if', '', 'Outer (physical) interface'),
+    ('state', 'state', '', 'Flow state (active/down)'),
+    ('ipsec_mode', 'ipsec-mode', '', 'IPsec mode (tunnel/transport)'),
+    ('local_ip', 'localip', '', 'Local endpoint IP address'),
+    ('peer_ip', 'peerip', '', 'Peer endpoint IP address'),
+    ('monitoring', 'mon', '', 'Path monitoring status (on/off)'),
+    ('owner', 'owner', '', 'Owner ID'),
+)
+
+_VPN_TUNNEL_FIELDS = (
+    ('tunnel_id', 'id', '', 'Tunnel ID'),
+    ('protocol', 'proto', '', 'IPsec protocol (ESP/AH)'),
+    ('mode', 'mode', '', 'Tunnel mode'),
+    ('dh_group', 'dh', '', 'Diffie-Hellman group for PFS'),
+    ('encryption', 'enc', '', 'Encryption algorithm'),
+    ('hash', 'hash', '', 'Hash algorithm'),
+    ('lifetime', 'life', 's', 'SA lifetime in seconds'),
+    ('kb_limit', 'kb', 'KB', 'KB limit (0 = unlimited)'),
+)
+
+_IPSEC_SA_FIELDS = (
+    ('gateway_id', 'gwid', '', 'Gateway ID'),
+    ('tunnel_id', 'tid', '', 'Tunnel ID'),
+    ('remote_ip', 'remote', '', 'Remote peer IP address'),
+    ('protocol', 'proto', '', 'IPsec protocol'),
+    ('encryption', 'enc', '', 'Encryption algorithm'),
+    ('hash', 'hash', '', 'Hash algorithm'),
+    ('inbound_spi', 'i_spi', '', 'Inbound SPI (Security Parameter Index)'),
+    ('outbound_spi', 'o_spi', '', 'Outbound SPI'),
+)
+
+# GlobalProtect summary sections, interpreted by iter_globalprotect_proposals().
+# Each yields one proposal, using the section's first entry as the example.
+# tags: (tag, source key, description); fields: (field, source key, unit, description)
+_GLOBALPROTECT_SCHEMAS = (
+    {
+        'section': 'gateway_summary',
+        'measurement': 'palo_alto_gp_gateway',
+        'description': 'GlobalProtect gateway statistics',
+        'tags': (
+            ('gateway_name', 'name', 'Gateway name'),
+        ),
+        'fields': (
+            ('current_users', 'CurrentUsers', '', 'Current connected users'),
+            ('previous_users', 'PreviousUsers', '', 'Previous user count'),
+            ('max_concurrent_tunnels', 'gateway_max_concurrent_tunnel', '', 'Max concurrent tunnels'),
+            ('successful_ipsec_connections', 'gateway_successful_ip_sec_connections', '', 'Successful IPsec connections'),
+            ('total_tunnel_count', 'record_gateway_tunnel_count', '', 'Total tunnel count'),
+        ),
+        'cardinality': 'low to medium',
+        'notes': (
+            'One data point per GlobalProtect gateway',
+        ),
+    },
+    {
+        'section': 'portal_summary',
+        'measurement': 'palo_alto_gp_portal',
+        'description': 'GlobalProtect portal statistics',
+        'tags': (
+            ('portal_name', 'name', 'Portal name'),
+        ),
+        'fields': (
+            ('successful_connections', 'successful_connections', '', 'Successful connections'),
+        ),
+        'cardinality': 'low',
+        'notes': (),
+    },
+)
 
 
 class InfluxDBSchemaProposal:
     """A proposal for an InfluxDB measurement schema."""
     
+    # Analyses create one instance per measurement per firewall; the attribute
+    # set is fixed, so skip the per-instance __dict__.
+    __slots__ = (
+        'measurement', 'description', 'category', 'tags', 'fields', 'cardinality',
+        'update_frequency', 'notes', 'data_points_per_collection',
+    )
+    
     def __init__(self, measurement: str, description: str, category: str):
         self.measurement = measurement
         self.description = description
@@ -59,7 +627,6 @@ class InfluxDBSchemaProposal:
         self.cardinality = "low"
         self.update_frequency = "frequently (every collection)"
         self.notes = []
-        self.example_values = {}
         self.data_points_per_collection = 1
     
     def add_tag(self, key: str, example_value: Any, description: str = ""):
@@ -79,21 +646,77 @@ class InfluxDBSchemaProposal:
             'description': description
         }
     
+    def add_fields_bulk(self, specs: List[Tuple[str, Any, str, str]]):
+        """Add several fields at once from (key, example_value, unit, description) tuples."""
+        self.fields.update({
+            key: {
+                'example': value,
+                'type': _TYPE_MAP.get(type(value), "string"),
+                'unit': unit,
+                'description': description
+            }
+            for key, value, unit, description in specs
+        })
+    
+    def add_tags_bulk(self, specs: List[Tuple[str, Any, str]]):
+        """Add several tags at once from (key, example_value, description) tuples."""
+        self.tags.update({
+            key: {
+                'example': value,
+                'type': _TYPE_MAP.get(type(value), "string"),
+                'description': description
+            }
+            for key, value, description in specs
+        })
+    
+    @classmethod
+    def build(cls, measurement: str, description: str, category: str, *,
+              tags: List[Tuple[str, Any, str]] = (),
+              fields: List[Tuple[str, Any, str, str]] = (),
+              notes: List[str] = (),
+              cardinality: str = None,
+              data_points_per_collection: int = None) -> 'InfluxDBSchemaProposal':
+        """
+        Create a complete proposal in one call.
+        
+        Args:
+            tags: (key, example_value, description) tuples
+            fields: (key, example_value, unit, description) tuples
+            notes: Notes in display order
+            cardinality: Overrides the default "low" when given
+            data_points_per_collection: Overrides the default 1 when given
+        """
+        proposal = cls(measurement, description, category)
+        proposal.add_tags_bulk(tags)
+        proposal.add_fields_bulk(fields)
+        proposal.notes = list(notes)
+        if cardinality is not None:
+            proposal.cardinality = cardinality
+        if data_points_per_collection is not None:
+            proposal.data_points_per_collection = data_points_per_collection
+        return proposal
+    
+    def finalize(self):
+        """
+        Put tags in sorted key order, the canonical InfluxDB line protocol order.
+        
+        Writers that emit tags pre-sorted skip the server-side sort, so the
+        exported schema lists them the way they should be written.
+        """
+        self.tags = dict(sorted(self.tags.items()))
+    
     def _get_data_type(self, value: Any) -> str:
         """Determine InfluxDB data type."""
-        if isinstance(value, bool):
-            return "boolean"
-        elif isinstance(value, int):
-            return "integer"
-        elif isinstance(value, float):
-            return "float"
-        elif isinstance(value, str):
-            return "string"
-        else:
-            return "string"
+        return _TYPE_MAP.get(type(value), "string")
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary for export."""
+        """
+        Convert to dictionary for export.
+        
+        Not cached: proposals are still mutated after creation (notes, counts),
+        and export_schema() calls this exactly once per proposal. The tags,
+        fields and notes containers are shared with the proposal, not copied.
+        """
         return {
             'measurement': self.measurement,
             'description': self.description,
@@ -107,18 +730,76 @@ class InfluxDBSchemaProposal:
         }
 
 
+def _build_proposal(measurement: str, description: str, category: str,
+                    schema: Dict[str, Tuple], source: Dict[str, Any]) -> InfluxDBSchemaProposal:
+    """Create a proposal whose tags and fields are read from source as laid out in schema."""
+    return InfluxDBSchemaProposal.build(
+        measurement, description, category,
+        tags=[
+            (key, source.get(source_key), tag_description)
+            for key, source_key, tag_description in schema.get('tags', ())
+        ],
+        fields=[
+            (key, convert[0](source.get(source_key)) if convert else source.get(source_key), unit, field_description)
+            for key, source_key, unit, field_description, *convert in schema.get('fields', ())
+        ],
+    )
+
+
+def _new_proposal(measurement: str, description: str, category: str,
+                  hostname: str, hostname_description: str = "") -> InfluxDBSchemaProposal:
+    """Create a proposal already carrying the firewall's hostname tag."""
+    proposal = InfluxDBSchemaProposal(measurement, description, category)
+    proposal.add_tag('hostname', hostname, hostname_description)
+    return proposal
+
+
+class _StreamedModule:
+    """Read-once stand-in for a module's {firewall: result} dict, fed by a parser."""
+    
+    __slots__ = ('_items',)
+    
+    def __init__(self, items):
+        self._items = items
+    
+    def items(self):
+        return self._items
+
+
 class ComprehensiveDataAnalyzer:
     """Comprehensive analyzer for all Palo Alto firewall data modules."""
     
+    # (top-level data module, proposal generator) in analyze_all() order
+    MODULE_ANALYZERS = (
+        ('system', 'iter_system_proposals'),
+        ('system', 'iter_environmental_proposals'),
+        ('interfaces', 'iter_interface_proposals'),
+        ('routing', 'iter_routing_proposals'),
+        ('counters', 'iter_counters_proposals'),
+        ('global_protect', 'iter_globalprotect_proposals'),
+        ('vpn', 'iter_vpn_proposals'),
+    )
+    
+    firewall_tag_note = (
+        "Note: All measurements use 'hostname' tags "
+        "(the firewall's actual hostname from system data) for consistent identification"
+    )
+    
     def __init__(self, data: Dict[str, Any]):
         """Initialize with complete stats data."""
         self.data = self._normalize_routing_data(data)
-        self.console = Console() if RICH_AVAILABLE else None
+        self._console = None
+        self._hostnames = None
+        # Filled a module at a time with extend(); report code indexes it
         self.proposals = []
-        self.firewall_tag_note = (
-            "Note: All measurements use 'hostname' tags "
-            "(the firewall's actual hostname from system data) for consistent identification"
-        )
+    
+    @property
+    def console(self):
+        """Rich console for formatted output, created on first use (None without rich)."""
+        if self._console is None and RICH_AVAILABLE:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
     
     def _normalize_routing_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -148,83 +829,29 @@ class ComprehensiveDataAnalyzer:
             if routing_mode != 'legacy':
                 continue
             
-            # Normalize bgp_summary
-            if 'bgp_summary' in routing_data:
-                bgp_summary = routing_data['bgp_summary']
-                if bgp_summary and 'entry' in bgp_summary and isinstance(bgp_summary['entry'], dict):
-                    entry = bgp_summary['entry']
-                    vrf_name = entry.get('@virtual-router', 'default')
-                    normalized_entry = {k: v for k, v in entry.items() if not k.startswith('@')}
-                    routing_data['bgp_summary'] = {vrf_name: normalized_entry}
-            
-            # Normalize bgp_peer_status
-            if 'bgp_peer_status' in routing_data:
-                bgp_peers = routing_data['bgp_peer_status']
-                if bgp_peers and 'entry' in bgp_peers:
-                    entries = bgp_peers['entry']
-                    if not isinstance(entries, list):
-                        entries = [entries]
-                    
-                    normalized = {}
-                    for entry in entries:
-                        if isinstance(entry, dict):
-                            peer_name = entry.get('@peer', entry.get('peer-name', 'unknown'))
-                            normalized_entry = {}
-                            for k, v in entry.items():
-                                if k.startswith('@'):
-                                    continue
-                                # Map legacy field names to advanced format
-                                if k == 'status':
-                                    normalized_entry['state'] = v
-                                elif k == 'status-duration':
-                                    normalized_entry['status-time'] = v
-                                elif k == 'peer-group':
-                                    normalized_entry['peer-group-name'] = v
-                                elif k == 'peer-address':
-                                    normalized_entry['peer-ip'] = v
-                                elif k == 'local-address':
-                                    normalized_entry['local-ip'] = v
-                                else:
-                                    normalized_entry[k] = v
-                            normalized[peer_name] = normalized_entry
-                    
-                    routing_data['bgp_peer_status'] = normalized
-            
-            # Normalize routing_table, bgp_routes, static_routes
-            for collection_name in ['routing_table', 'bgp_routes', 'static_routes']:
-                if collection_name in routing_data:
-                    routes = routing_data[collection_name]
-                    if routes and 'entry' in routes:
-                        entries = routes['entry']
-                        if not isinstance(entries, list):
-                            entries = [entries]
-                        
-                        # Group by VRF
-                        vrf_routes = {}
-                        for entry in entries:
-                            if isinstance(entry, dict):
-                                vrf_name = entry.get('virtual-router', 'default')
-                                destination = entry.get('destination', 'unknown')
-                                
-                                if vrf_name not in vrf_routes:
-                                    vrf_routes[vrf_name] = {}
-                                
-                                # Create route entry without virtual-router field
-                                route_entry = {k: v for k, v in entry.items() if k != 'virtual-router'}
-                                
-                                # Store as list to handle multiple routes per destination
-                                if destination not in vrf_routes[vrf_name]:
-                                    vrf_routes[vrf_name][destination] = []
-                                vrf_routes[vrf_name][destination].append(route_entry)
-                        
-                        routing_data[collection_name] = vrf_routes
+            _normalize_legacy_routing(routing_data)
         
         return data
     
+    def _resolve_hostname(self, firewall_name: str) -> Any:
+        """Look up a firewall's hostname in the system module data (None if unavailable)."""
+        # Built on first use for all firewalls; reset whenever self.data is replaced
+        if self._hostnames is None:
+            self._hostnames = {
+                name: _dig(sys_data['data']['system_info'], 'system', 'hostname', default=name)
+                for name, sys_data in self.data.get('system', _EMPTY).items()
+                if sys_data and sys_data.get('success') and 'system_info' in sys_data.get('data', _EMPTY)
+            }
+        return self._hostnames.get(firewall_name)
+    
     # ==================== SYSTEM MODULE ====================
     
     def analyze_system_module(self):
         """Analyze the system module."""
+        self.proposals.extend(self.iter_system_proposals())
+    
+    def iter_system_proposals(self) -> Iterator[InfluxDBSchemaProposal]:
+        """Yield the system module's schema proposals."""
         if 'system' not in self.data:
             return
         
@@ -234,252 +861,218 @@ class ComprehensiveDataAnalyzer:
             
             data = fw_data['data']
             
+            # Looked up once per firewall and shared by the proposals below
+            system = _dig(data, 'system_info', 'system')
+            resources = data.get('resource_usage')
+            if system is not None:
+                hostname, model, family = system.get('hostname'), system.get('model'), system.get('family')
+            else:
+                hostname = model = family = None
+            
             # System Identity
-            if 'system_info' in data and data['system_info'] and 'system' in data['system_info']:
-                system = data['system_info']['system']
-                
-                proposal = InfluxDBSchemaProposal(
+            if system is not None:
+                proposal = _build_proposal(
                     'palo_alto_system_identity',
                     'System identification and static configuration information',
-                    'system'
+                    'system',
+                    _SYSTEM_IDENTITY_SCHEMA,
+                    system
                 )
-                proposal.add_tag('hostname', system.get('hostname'), 'Device hostname (primary identifier)')
-                proposal.add_tag('model', system.get('model'), 'Device model')
-                proposal.add_tag('family', system.get('family'), 'Device family')
-                proposal.add_tag('serial', system.get('serial'), 'Serial number')
-                
-                proposal.add_field('sw_version', system.get('sw-version'), '', 'Software version')
-                proposal.add_field('vm_cores', system.get('vm-cores'), 'cores', 'Number of VM cores')
-                proposal.add_field('vm_mem_mb', round(system.get('vm-mem', 0) / 1024, 2), 'MiB', 'VM memory')
-                proposal.add_field('operational_mode', system.get('operational-mode'), '', 'Operational mode')
-                proposal.add_field('advanced_routing', system.get('advanced-routing'), '', 'Advanced routing status')
-                proposal.add_field('multi_vsys', system.get('multi-vsys'), '', 'Multi-vsys capability status')
-                proposal.add_field('ip_address', system.get('ip-address'), '', 'Management IP address')
-                proposal.add_field('mac_address', system.get('mac-address'), '', 'Management MAC address')
-                proposal.add_field('ipv6_address', system.get('ipv6-address'), '', 'Management IPv6 address')
-                
-                # Convert yes/no to boolean for display
-                is_dhcp = system.get('is-dhcp')
-                is_dhcp_bool = True if is_dhcp == 'yes' else False if is_dhcp == 'no' else None
-                proposal.add_field('is_dhcp', is_dhcp_bool, '', 'Using DHCP for IPv4')
-                
-                is_dhcp6 = system.get('is-dhcp6')
-                is_dhcp6_bool = True if is_dhcp6 == 'yes' else False if is_dhcp6 == 'no' else None
-                proposal.add_field('is_dhcp6', is_dhcp6_bool, '', 'Using DHCP for IPv6')
                 
                 proposal.update_frequency = 'rarely (on system change)'
-                proposal.notes.append('Static system information that rarely changes')
-                proposal.notes.append('Network configuration fields (IP, MAC) help with asset tracking')
-                self.proposals.append(proposal)
+                proposal.notes.extend((
+                    'Static system information that rarely changes',
+                    'Network configuration fields (IP, MAC) help with asset tracking',
+                ))
+                yield proposal
             
             # System Uptime
-            if 'system_info' in data and data['system_info'] and 'system' in data['system_info']:
-                system = data['system_info']['system']
-                
-                proposal = InfluxDBSchemaProposal(
+            if system is not None:
+                proposal = _new_proposal(
                     'palo_alto_system_uptime',
                     'System uptime metrics',
-                    'system'
+                    'system',
+                    hostname
                 )
-                proposal.add_tag('hostname', system.get('hostname'))
                 
                 proposal.add_field('uptime_seconds', system.get('_uptime_seconds'), 's', 'Uptime in seconds')
-                proposal.add_field('uptime_days', round(system.get('_uptime_seconds', 0) / 86400, 2), 'days', 'Uptime in days')
+                proposal.add_field('uptime_days', _scale(system.get('_uptime_seconds'), 86400), 'days', 'Uptime in days')
                 
-                self.proposals.append(proposal)
+                yield proposal
             
             # Content Versions
-            if 'system_info' in data and data['system_info'] and 'system' in data['system_info']:
-                system = data['system_info']['system']
-                
-                proposal = InfluxDBSchemaProposal(
+            if system is not None:
+                proposal = _build_proposal(
                     'palo_alto_content_versions',
                     'Content and security package versions',
-                    'system'
+                    'system',
+                    _CONTENT_VERSIONS_SCHEMA,
+                    system
                 )
-                proposal.add_tag('hostname', system.get('hostname'))
-                
-                proposal.add_field('app_version', system.get('app-version'), '', 'Application and threat content version')
-                proposal.add_field('av_version', system.get('av-version'), '', 'Anti-virus content version (0 = not installed)')
-                proposal.add_field('threat_version', system.get('threat-version'), '', 'Threat prevention content version (0 = not installed)')
-                proposal.add_field('wf_private_version', system.get('wf-private-version'), '', 'WildFire private cloud version')
-                proposal.add_field('wildfire_version', system.get('wildfire-version'), '', 'WildFire content version')
-                proposal.add_field('wildfire_rt', system.get('wildfire-rt'), '', 'WildFire real-time status')
-                proposal.add_field('url_filtering_version', system.get('url-filtering-version'), '', 'URL filtering database version')
-                proposal.add_field('url_db', system.get('url-db'), '', 'URL database source')
-                proposal.add_field('logdb_version', system.get('logdb-version'), '', 'Log database version')
-                proposal.add_field('device_dictionary_version', system.get('device-dictionary-version'), '', 'Device dictionary version')
-                proposal.add_field('global_protect_client_package_version', system.get('global-protect-client-package-version'), '', 'GlobalProtect client package version')
                 
                 proposal.update_frequency = 'frequently (with content updates - typically daily/weekly)'
-                proposal.notes.append('Critical for security compliance monitoring')
-                proposal.notes.append('Alert on outdated content versions')
-                proposal.notes.append('Version 0 typically indicates the feature is not licensed or not installed')
-                self.proposals.append(proposal)
+                proposal.notes.extend((
+                    'Critical for security compliance monitoring',
+                    'Alert on outdated content versions',
+                    'Version 0 typically indicates the feature is not licensed or not installed',
+                ))
+                yield proposal
             
             # MAC Count
-            if 'system_info' in data and data['system_info'] and 'system' in data['system_info']:
-                system = data['system_info']['system']
-                
+            if system is not None:
                 # VM firewalls use 'vm-mac-count', hardware firewalls use 'mac_count'
                 mac_count = system.get('vm-mac-count') or system.get('mac_count')
                 
                 if mac_count is not None:
-                    proposal = InfluxDBSchemaProposal(
+                    proposal = _new_proposal(
                         'palo_alto_mac_count',
                         'MAC address allocation count',
-                        'system'
+                        'system',
+                        hostname, 'Device hostname'
                     )
-                    proposal.add_tag('hostname', system.get('hostname'), 'Device hostname')
-                    proposal.add_tag('model', system.get('model'), 'Device model')
-                    proposal.add_tag('family', system.get('family'), 'Device family')
+                    proposal.add_tag('model', model, 'Device model')
+                    proposal.add_tag('family', family, 'Device family')
                     
                     proposal.add_field('mac_count', mac_count, 'addresses', 'Number of MAC addresses allocated to the device')
                     
                     proposal.update_frequency = 'rarely (on system change)'
-                    proposal.notes.append('MAC address allocation for the firewall')
-                    proposal.notes.append('Hardware firewalls report as "mac_count", VM firewalls as "vm-mac-count"')
-                    proposal.notes.append('Useful for capacity planning and licensing tracking')
-                    self.proposals.append(proposal)
+                    proposal.notes.extend((
+                        'MAC address allocation for the firewall',
+                        'Hardware firewalls report as "mac_count", VM firewalls as "vm-mac-count"',
+                        'Useful for capacity planning and licensing tracking',
+                    ))
+                    yield proposal
             
             # CPU Usage
-            if 'resource_usage' in data:
-                resources = data['resource_usage']
-                
-                proposal = InfluxDBSchemaProposal(
+            if resources is not None:
+                proposal = _new_proposal(
                     'palo_alto_cpu_usage',
                     'CPU utilization breakdown by type',
-                    'system'
+                    'system',
+                    hostname
                 )
-                proposal.add_tag('hostname', system.get('hostname'))
                 
-                proposal.add_field('cpu_user', resources.get('cpu_user'), '%', 'User CPU time')
-                proposal.add_field('cpu_system', resources.get('cpu_system'), '%', 'System CPU time')
-                proposal.add_field('cpu_nice', resources.get('cpu_nice'), '%', 'Nice CPU time')
-                proposal.add_field('cpu_idle', resources.get('cpu_idle'), '%', 'Idle CPU time')
-                proposal.add_field('cpu_iowait', resources.get('cpu_iowait'), '%', 'IO wait time')
-                proposal.add_field('cpu_hardware_interrupt', resources.get('cpu_hardware_interrupt'), '%', 'Hardware interrupt time')
-                proposal.add_field('cpu_software_interrupt', resources.get('cpu_software_interrupt'), '%', 'Software interrupt time')
-                proposal.add_field('cpu_steal', resources.get('cpu_steal'), '%', 'Steal time')
+                proposal.add_fields_bulk(
+                    (field, resources.get(key), unit, description)
+                    for field, key, unit, description in _CPU_USAGE_FIELDS
+                )
                 
                 # Add computed total
                 cpu_total = 100 - resources.get('cpu_idle', 0)
                 proposal.add_field('cpu_total_used', round(cpu_total, 2), '%', 'Total CPU used (100 - idle)')
                 
-                proposal.notes.append('All CPU values are percentages (0-100)')
-                proposal.notes.append('cpu_total_used is a computed field for easier graphing')
-                self.proposals.append(proposal)
+                proposal.notes.extend((
+                    'All CPU values are percentages (0-100)',
+                    'cpu_total_used is a computed field for easier graphing',
+                ))
+                yield proposal
             
             # Memory Usage
-            if 'resource_usage' in data:
-                resources = data['resource_usage']
-                
-                proposal = InfluxDBSchemaProposal(
+            if resources is not None:
+                proposal = _new_proposal(
                     'palo_alto_memory_usage',
                     'Memory utilization metrics',
-                    'system'
+                    'system',
+                    hostname
                 )
-                proposal.add_tag('hostname', system.get('hostname'))
                 
-                proposal.add_field('memory_total_mib', resources.get('memory_total_mib'), 'MiB', 'Total memory')
-                proposal.add_field('memory_free_mib', resources.get('memory_free_mib'), 'MiB', 'Free memory')
-                proposal.add_field('memory_used_mib', resources.get('memory_used_mib'), 'MiB', 'Used memory')
-                proposal.add_field('memory_buff_cache_mib', resources.get('memory_buff_cache_mib'), 'MiB', 'Buffer/cache memory')
-                proposal.add_field('memory_available_mib', resources.get('memory_available_mib'), 'MiB', 'Available memory')
-                proposal.add_field('memory_usage_percent', round(resources.get('memory_usage_percent', 0), 2), '%', 'Memory usage percentage')
+                proposal.add_fields_bulk(
+                    (field, resources.get(key), unit, description)
+                    for field, key, unit, description in _MEMORY_USAGE_FIELDS
+                )
+                proposal.add_field('memory_usage_percent', _scale(resources.get('memory_usage_percent'), 1), '%', 'Memory usage percentage')
                 
                 proposal.notes.append('Memory values in MiB, percentage is 0-100')
-                self.proposals.append(proposal)
+                yield proposal
             
             # Swap Usage
-            if 'resource_usage' in data:
-                resources = data['resource_usage']
-                
-                proposal = InfluxDBSchemaProposal(
+            if resources is not None:
+                proposal = _new_proposal(
                     'palo_alto_swap_usage',
                     'Swap space utilization',
-                    'system'
+                    'system',
+                    hostname
                 )
-                proposal.add_tag('hostname', system.get('hostname'))
                 
-                proposal.add_field('swap_total_mib', resources.get('swap_total_mib'), 'MiB', 'Total swap')
-                proposal.add_field('swap_free_mib', resources.get('swap_free_mib'), 'MiB', 'Free swap')
-                proposal.add_field('swap_used_mib', resources.get('swap_used_mib'), 'MiB', 'Used swap')
-                proposal.add_field('swap_usage_percent', resources.get('swap_usage_percent'), '%', 'Swap usage percentage')
+                proposal.add_fields_bulk(
+                    (field, resources.get(key), unit, description)
+                    for field, key, unit, description in _SWAP_USAGE_FIELDS
+                )
                 
-                self.proposals.append(proposal)
+                yield proposal
             
             # Load Average
-            if 'resource_usage' in data:
-                resources = data['resource_usage']
-                
-                proposal = InfluxDBSchemaProposal(
+            if resources is not None:
+                proposal = _new_proposal(
                     'palo_alto_load_average',
                     'System load averages',
-                    'system'
+                    'system',
+                    hostname
                 )
-                proposal.add_tag('hostname', system.get('hostname'))
                 
-                proposal.add_field('load_1min', resources.get('load_average_1min'), '', '1 minute load average')
-                proposal.add_field('load_5min', resources.get('load_average_5min'), '', '5 minute load average')
-                proposal.add_field('load_15min', resources.get('load_average_15min'), '', '15 minute load average')
+                proposal.add_fields_bulk((
+                    ('load_1min', resources.get('load_average_1min'), '', '1 minute load average'),
+                    ('load_5min', resources.get('load_average_5min'), '', '5 minute load average'),
+                    ('load_15min', resources.get('load_average_15min'), '', '15 minute load average'),
+                ))
                 
-                self.proposals.append(proposal)
+                yield proposal
             
             # Task Statistics
-            if 'resource_usage' in data:
-                resources = data['resource_usage']
-                
-                proposal = InfluxDBSchemaProposal(
+            if resources is not None:
+                proposal = _new_proposal(
                     'palo_alto_task_stats',
                     'Process and task statistics',
-                    'system'
+                    'system',
+                    hostname
                 )
-                proposal.add_tag('hostname', system.get('hostname'))
                 
-                proposal.add_field('tasks_total', resources.get('tasks_total'), '', 'Total tasks')
-                proposal.add_field('tasks_running', resources.get('tasks_running'), '', 'Running tasks')
-                proposal.add_field('tasks_sleeping', resources.get('tasks_sleeping'), '', 'Sleeping tasks')
-                proposal.add_field('tasks_stopped', resources.get('tasks_stopped'), '', 'Stopped tasks')
-                proposal.add_field('tasks_zombie', resources.get('tasks_zombie'), '', 'Zombie tasks')
+                proposal.add_fields_bulk(
+                    (field, resources.get(key), unit, description)
+                    for field, key, unit, description in _TASK_STATS_FIELDS
+                )
                 
-                self.proposals.append(proposal)
+                yield proposal
             
             # Disk Usage (per mount point)
             if 'disk_usage' in data:
-                proposal = InfluxDBSchemaProposal(
+                proposal = _new_proposal(
                     'palo_alto_disk_usage',
                     'Disk usage per mount point',
-                    'system'
+                    'system',
+                    hostname
                 )
-                proposal.add_tag('hostname', system.get('hostname'))
                 proposal.add_tag('mount_point', '/', 'Mount point path')
                 proposal.add_tag('device', '/dev/root', 'Device name')
                 
                 # Take first mount as example
                 first_mount = next(iter(data['disk_usage'].values()))
-                proposal.add_field('use_percent', first_mount.get('use_percent'), '%', 'Disk usage percentage')
-                proposal.add_field('size', first_mount.get('size'), '', 'Total size (needs parsing)')
-                proposal.add_field('used', first_mount.get('used'), '', 'Used space (needs parsing)')
-                proposal.add_field('available', first_mount.get('available'), '', 'Available space (needs parsing)')
+                proposal.add_fields_bulk((
+                    ('use_percent', first_mount.get('use_percent'), '%', 'Disk usage percentage'),
+                    ('size', first_mount.get('size'), '', 'Total size (needs parsing)'),
+                    ('used', first_mount.get('used'), '', 'Used space (needs parsing)'),
+                    ('available', first_mount.get('available'), '', 'Available space (needs parsing)'),
+                ))
                 
                 proposal.cardinality = 'medium'
                 proposal.data_points_per_collection = len(data['disk_usage'])
-                proposal.notes.append(f'Multiple data points per collection (one per mount)')
-                proposal.notes.append(f'Example has {len(data["disk_usage"])} mount points')
-                proposal.notes.append('Size values need parsing from strings (12G, 6.9G, etc.)')
-                self.proposals.append(proposal)
+                proposal.notes.extend((
+                    f'Multiple data points per collection (one per mount)',
+                    f'Example has {len(data["disk_usage"])} mount points',
+                    'Size values need parsing from strings (12G, 6.9G, etc.)',
+                ))
+                yield proposal
             
             # HA Status
             if 'ha_status' in data:
                 ha = data['ha_status']
                 
-                proposal = InfluxDBSchemaProposal(
+                proposal = _new_proposal(
                     'palo_alto_ha_status',
                     'High Availability configuration and status',
-                    'system'
+                    'system',
+                    hostname
                 )
-                proposal.add_tag('hostname', system.get('hostname'))
                 
                 proposal.add_field('enabled', ha.get('enabled'), '', 'HA enabled status')
                 
@@ -492,38 +1085,42 @@ class ComprehensiveDataAnalyzer:
                     
                     if 'local-info' in group:
                         local_info = group['local-info']
-                        proposal.add_field('local_state', local_info.get('state'), '', 'Local firewall state (active, passive, suspended)')
-                        proposal.add_field('local_state_duration', local_info.get('state-duration'), 's', 'Time in current state (seconds)')
-                        proposal.add_field('local_priority', local_info.get('priority'), '', 'Local priority value (higher = preferred active)')
-                        proposal.add_field('preempt_flap_cnt', local_info.get('preempt-flap-cnt'), '', 'Preemptive failover count')
-                        proposal.add_field('nonfunc_flap_cnt', local_info.get('nonfunc-flap-cnt'), '', 'Non-functional device failover count')
-                        proposal.add_field('max_flaps', local_info.get('max-flaps'), '', 'Maximum flaps threshold')
-                        
-                        # Synchronization Status
-                        proposal.add_field('state_sync', local_info.get('state-sync'), '', 'Config sync status (Complete, Incomplete)')
-                        proposal.add_field('state_sync_type', local_info.get('state-sync-type'), '', 'Sync type (ethernet, ip)')
-                        
-                        # Version Compatibility (11 fields)
-                        proposal.add_field('dlp_compat', local_info.get('DLP'), '', 'DLP version compatibility (Match, Mismatch)')
-                        proposal.add_field('nd_compat', local_info.get('ND'), '', 'Network Discovery version compatibility')
-                        proposal.add_field('oc_compat', local_info.get('OC'), '', 'OpenConfig version compatibility')
-                        proposal.add_field('build_compat', local_info.get('build-compat'), '', 'Software build compatibility')
-                        proposal.add_field('url_compat', local_info.get('url-compat'), '', 'URL filtering compatibility')
-                        proposal.add_field('app_compat', local_info.get('app-compat'), '', 'App/threat content compatibility')
-                        proposal.add_field('iot_compat', local_info.get('iot-compat'), '', 'IoT content compatibility')
-                        proposal.add_field('av_compat', local_info.get('av-compat'), '', 'Antivirus content compatibility')
-                        proposal.add_field('threat_compat', local_info.get('threat-compat'), '', 'Threat content compatibility')
-                        proposal.add_field('vpnclient_compat', local_info.get('vpnclient-compat'), '', 'VPN client compatibility')
-                        proposal.add_field('gpclient_compat', local_info.get('gpclient-compat'), '', 'GlobalProtect client compatibility')
+                        proposal.add_fields_bulk([
+                            ('local_state', local_info.get('state'), '', 'Local firewall state (active, passive, suspended)'),
+                            ('local_state_duration', local_info.get('state-duration'), 's', 'Time in current state (seconds)'),
+                            ('local_priority', local_info.get('priority'), '', 'Local priority value (higher = preferred active)'),
+                            ('preempt_flap_cnt', local_info.get('preempt-flap-cnt'), '', 'Preemptive failover count'),
+                            ('nonfunc_flap_cnt', local_info.get('nonfunc-flap-cnt'), '', 'Non-functional device failover count'),
+                            ('max_flaps', local_info.get('max-flaps'), '', 'Maximum flaps threshold'),
+
+                            # Synchronization Status
+                            ('state_sync', local_info.get('state-sync'), '', 'Config sync status (Complete, Incomplete)'),
+                            ('state_sync_type', local_info.get('state-sync-type'), '', 'Sync type (ethernet, ip)'),
+
+                            # Version Compatibility (11 fields)
+                            ('dlp_compat', local_info.get('DLP'), '', 'DLP version compatibility (Match, Mismatch)'),
+                            ('nd_compat', local_info.get('ND'), '', 'Network Discovery version compatibility'),
+                            ('oc_compat', local_info.get('OC'), '', 'OpenConfig version compatibility'),
+                            ('build_compat', local_info.get('build-compat'), '', 'Software build compatibility'),
+                            ('url_compat', local_info.get('url-compat'), '', 'URL filtering compatibility'),
+                            ('app_compat', local_info.get('app-compat'), '', 'App/threat content compatibility'),
+                            ('iot_compat', local_info.get('iot-compat'), '', 'IoT content compatibility'),
+                            ('av_compat', local_info.get('av-compat'), '', 'Antivirus content compatibility'),
+                            ('threat_compat', local_info.get('threat-compat'), '', 'Threat content compatibility'),
+                            ('vpnclient_compat', local_info.get('vpnclient-compat'), '', 'VPN client compatibility'),
+                            ('gpclient_compat', local_info.get('gpclient-compat'), '', 'GlobalProtect client compatibility'),
+                        ])
                     
                     if 'peer-info' in group:
                         peer_info = group['peer-info']
-                        proposal.add_field('peer_state', peer_info.get('state'), '', 'Peer firewall state')
-                        proposal.add_field('peer_state_duration', peer_info.get('state-duration'), 's', 'Peer time in current state')
-                        proposal.add_field('peer_priority', peer_info.get('priority'), '', 'Peer priority value')
-                        
-                        # Connection Health
-                        proposal.add_field('peer_conn_status', peer_info.get('conn-status'), '', 'Overall peer connection status (up, down)')
+                        proposal.add_fields_bulk([
+                            ('peer_state', peer_info.get('state'), '', 'Peer firewall state'),
+                            ('peer_state_duration', peer_info.get('state-duration'), 's', 'Peer time in current state'),
+                            ('peer_priority', peer_info.get('priority'), '', 'Peer priority value'),
+
+                            # Connection Health
+                            ('peer_conn_status', peer_info.get('conn-status'), '', 'Overall peer connection status (up, down)'),
+                        ])
                         if 'conn-ha1' in peer_info:
                             proposal.add_field('peer_conn_ha1_status', peer_info['conn-ha1'].get('conn-status'), '', 'HA1 control link status')
                         if 'conn-ha2' in peer_info:
@@ -534,283 +1131,158 @@ class ComprehensiveDataAnalyzer:
                     proposal.add_field('running_sync_enabled', group.get('running-sync-enabled'), '', 'Running config sync enabled')
                 
                 proposal.update_frequency = 'frequently (every collection)'
-                proposal.notes.append('Limited data when HA is disabled (only "enabled" field)')
-                proposal.notes.append('Comprehensive metrics when HA is enabled')
-                proposal.notes.append('Critical for monitoring HA health, failovers, and configuration sync')
-                proposal.notes.append('Alert on state changes, sync failures, or version mismatches')
-                self.proposals.append(proposal)
+                proposal.notes.extend((
+                    'Limited data when HA is disabled (only "enabled" field)',
+                    'Comprehensive metrics when HA is enabled',
+                    'Critical for monitoring HA health, failovers, and configuration sync',
+                    'Alert on state changes, sync failures, or version mismatches',
+                ))
+                yield proposal
             
-            # CPU Dataplane Tasks
+            # CPU Dataplane Tasks and Cores (both read the dp0 per-second data)
             if 'extended_cpu' in data:
                 extended_cpu = data['extended_cpu']
                 
                 # Navigate to resource monitor data
-                resource_monitor = extended_cpu.get('resource-monitor', {})
+                resource_monitor = extended_cpu.get('resource-monitor', _EMPTY)
                 data_processors = resource_monitor.get('data-processors', resource_monitor)
-                dp0 = data_processors.get('dp0', {})
-                second_data = dp0.get('second', {})
+                second_data = _dig(data_processors, 'dp0', 'second', default=_EMPTY)
                 
+                cpu_load = second_data.get('cpu-load-average') or _EMPTY
+                core_entries = _as_list(cpu_load['entry']) if 'entry' in cpu_load else None
+                
+                # Dataplane tasks
                 if second_data:
-                    proposal = InfluxDBSchemaProposal(
+                    proposal = _new_proposal(
                         'palo_alto_cpu_dataplane_tasks',
                         'Dataplane task CPU utilization and resource utilization',
-                        'system'
+                        'system',
+                        hostname
                     )
-                    proposal.add_tag('hostname', system.get('hostname'))
                     proposal.add_tag('dp_id', 'dp0', 'Dataplane processor ID')
                     
                     # Task CPU percentages
                     if 'task' in second_data and second_data['task']:
                         task_data = second_data['task']
-                        proposal.add_field('task_flow_lookup', task_data.get('flow_lookup'), '%', 'Flow lookup task CPU')
-                        proposal.add_field('task_flow_fastpath', task_data.get('flow_fastpath'), '%', 'Flow fastpath task CPU')
-                        proposal.add_field('task_flow_slowpath', task_data.get('flow_slowpath'), '%', 'Flow slowpath task CPU')
-                        proposal.add_field('task_flow_forwarding', task_data.get('flow_forwarding'), '%', 'Flow forwarding task CPU')
-                        proposal.add_field('task_flow_mgmt', task_data.get('flow_mgmt'), '%', 'Flow management task CPU')
-                        proposal.add_field('task_flow_ctrl', task_data.get('flow_ctrl'), '%', 'Flow control task CPU')
-                        proposal.add_field('task_nac_result', task_data.get('nac_result'), '%', 'NAC result task CPU')
-                        proposal.add_field('task_flow_np', task_data.get('flow_np'), '%', 'Flow network processor task CPU')
-                        proposal.add_field('task_dfa_result', task_data.get('dfa_result'), '%', 'DFA result task CPU')
-                        proposal.add_field('task_module_internal', task_data.get('module_internal'), '%', 'Module internal task CPU')
-                        proposal.add_field('task_aho_result', task_data.get('aho_result'), '%', 'Aho-Corasick result task CPU')
-                        proposal.add_field('task_zip_result', task_data.get('zip_result'), '%', 'Compression result task CPU')
-                        proposal.add_field('task_pktlog_forwarding', task_data.get('pktlog_forwarding'), '%', 'Packet log forwarding task CPU')
-                        proposal.add_field('task_send_out', task_data.get('send_out'), '%', 'Send out task CPU')
-                        proposal.add_field('task_flow_host', task_data.get('flow_host'), '%', 'Flow host task CPU')
-                        proposal.add_field('task_send_host', task_data.get('send_host'), '%', 'Send host task CPU')
-                        proposal.add_field('task_fpga_result', task_data.get('fpga_result'), '%', 'FPGA result task CPU')
+                        proposal.add_fields_bulk(
+                            (field, task_data.get(key), unit, description)
+                            for field, key, unit, description in _DATAPLANE_TASK_FIELDS
+                        )
                     
                     # Resource utilization (averaged over 60 seconds)
                     if 'resource-utilization' in second_data:
-                        proposal.add_field('resource_session_avg', 0, '%', 'Session resource utilization (60s avg)')
-                        proposal.add_field('resource_packet_buffer_avg', 0, '%', 'Packet buffer utilization (60s avg)')
-                        proposal.add_field('resource_packet_descriptor_avg', 0, '%', 'Packet descriptor utilization (60s avg)')
-                        proposal.add_field('resource_sw_tags_descriptor_avg', 0, '%', 'SW tags descriptor utilization (60s avg)')
+                        proposal.add_fields_bulk(
+                            (field, 0, '%', description) for field, description in _DATAPLANE_RESOURCE_FIELDS
+                        )
                     
                     # CPU core count
-                    if 'cpu-load-average' in second_data:
-                        cpu_load = second_data['cpu-load-average']
-                        if 'entry' in cpu_load:
-                            entries = cpu_load['entry']
-                            if not isinstance(entries, list):
-                                entries = [entries]
-                            proposal.add_field('cpu_cores', len(entries), 'cores', 'Number of dataplane CPU cores')
+                    if core_entries is not None:
+                        proposal.add_field('cpu_cores', len(core_entries), 'cores', 'Number of dataplane CPU cores')
                     
                     proposal.update_frequency = 'frequently (every collection)'
                     proposal.cardinality = 'low'
                     proposal.data_points_per_collection = 1
-                    proposal.notes.append('Task CPU percentages are instantaneous (current second)')
-                    proposal.notes.append('Resource utilization values are averaged over 60 seconds')
-                    proposal.notes.append('Provides detailed visibility into dataplane processing tasks')
-                    proposal.notes.append('Alert on high task CPU (>80%) or resource exhaustion (>85%)')
-                    self.proposals.append(proposal)
-            
-            # CPU Dataplane Cores (per-core metrics)
-            if 'extended_cpu' in data:
-                extended_cpu = data['extended_cpu']
+                    proposal.notes.extend((
+                        'Task CPU percentages are instantaneous (current second)',
+                        'Resource utilization values are averaged over 60 seconds',
+                        'Provides detailed visibility into dataplane processing tasks',
+                        'Alert on high task CPU (>80%) or resource exhaustion (>85%)',
+                    ))
+                    yield proposal
                 
-                # Navigate to resource monitor data
-                resource_monitor = extended_cpu.get('resource-monitor', {})
-                data_processors = resource_monitor.get('data-processors', resource_monitor)
-                dp0 = data_processors.get('dp0', {})
-                second_data = dp0.get('second', {})
-                
-                if 'cpu-load-average' in second_data:
-                    cpu_load = second_data['cpu-load-average']
-                    if 'entry' in cpu_load:
-                        entries = cpu_load['entry']
-                        if not isinstance(entries, list):
-                            entries = [entries]
-                        
-                        # Use first core as example
-                        first_core = entries[0] if entries else {}
-                        
-                        proposal = InfluxDBSchemaProposal(
-                            'palo_alto_cpu_dataplane_cores',
-                            'Per-core dataplane CPU utilization',
-                            'system'
-                        )
-                        proposal.add_tag('hostname', system.get('hostname'))
-                        proposal.add_tag('dp_id', 'dp0', 'Dataplane processor ID')
-                        proposal.add_tag('core_id', str(first_core.get('coreid', 0)), 'Core ID')
-                        
-                        proposal.add_field('cpu_utilization_avg', 0, '%', 'Average CPU utilization over 60 seconds')
-                        
-                        proposal.update_frequency = 'frequently (every collection)'
-                        proposal.cardinality = 'medium'
-                        proposal.data_points_per_collection = len(entries)
-                        proposal.notes.append(f'One data point per dataplane core ({len(entries)} cores detected)')
-                        proposal.notes.append('CPU utilization is averaged over 60 seconds')
-                        proposal.notes.append('Useful for detecting core imbalance or hot cores')
-                        proposal.notes.append('Alert on individual core >90% or imbalance >50% between cores')
-                        self.proposals.append(proposal)
+                # Dataplane cores (per-core metrics)
+                if core_entries is not None:
+                    # Use first core as example
+                    first_core = core_entries[0] if core_entries else {}
+                    
+                    proposal = _new_proposal(
+                        'palo_alto_cpu_dataplane_cores',
+                        'Per-core dataplane CPU utilization',
+                        'system',
+                        hostname
+                    )
+                    proposal.add_tag('dp_id', 'dp0', 'Dataplane processor ID')
+                    proposal.add_tag('core_id', str(first_core.get('coreid', 0)), 'Core ID')
+                    
+                    proposal.add_field('cpu_utilization_avg', 0, '%', 'Average CPU utilization over 60 seconds')
+                    
+                    proposal.update_frequency = 'frequently (every collection)'
+                    proposal.cardinality = 'medium'
+                    proposal.data_points_per_collection = len(core_entries)
+                    proposal.notes.extend((
+                        f'One data point per dataplane core ({len(core_entries)} cores detected)',
+                        'CPU utilization is averaged over 60 seconds',
+                        'Useful for detecting core imbalance or hot cores',
+                        'Alert on individual core >90% or imbalance >50% between cores',
+                    ))
+                    yield proposal
     
     # ==================== ENVIRONMENTAL MODULE ====================
     
     def analyze_environmental_module(self):
         """Analyze the environmental module (hardware firewalls only)."""
+        self.proposals.extend(self.iter_environmental_proposals())
+    
+    def iter_environmental_proposals(self) -> Iterator[InfluxDBSchemaProposal]:
+        """Yield the environmental module's schema proposals."""
         if 'system' not in self.data:
             return
         
-        for firewall_name, fw_data in self.data['system'].items():
-            if not fw_data.get('success'):
-                continue
-            
-            data = fw_data['data']
-            
-            # Environmental data is only available on hardware firewalls
-            if 'environmental' not in data:
-                continue
-            
+        # Environmental data is only available on hardware firewalls. Filtered
+        # lazily (not into a list) so --stream still holds one firewall at a time.
+        hw_firewalls = (
+            (firewall_name, fw_data['data'])
+            for firewall_name, fw_data in self.data['system'].items()
+            if fw_data.get('success') and 'environmental' in fw_data['data']
+        )
+        
+        for firewall_name, data in hw_firewalls:
             env_data = data['environmental']
-            hostname = data.get('system_info', {}).get('system', {}).get('hostname', firewall_name)
-            
-            # Thermal Sensors
-            if 'thermal' in env_data:
-                thermal = env_data['thermal']
-                # Find first slot with entries to use as example
-                for slot_name, slot_data in thermal.items():
-                    if 'entry' in slot_data and slot_data['entry']:
-                        entries = slot_data['entry']
-                        # Handle both single entry (dict) and multiple entries (list)
-                        if isinstance(entries, dict):
-                            entries = [entries]
-                        first_entry = entries[0]
-                        
-                        proposal = InfluxDBSchemaProposal(
-                            'palo_alto_env_thermal',
-                            'Thermal sensor temperature readings',
-                            'environmental'
-                        )
-                        proposal.add_tag('hostname', hostname, 'Device hostname')
-                        proposal.add_tag('slot', first_entry.get('slot'), 'Hardware slot number')
-                        proposal.add_tag('description', first_entry.get('description'), 'Sensor description/location')
-                        
-                        proposal.add_field('temperature_c', first_entry.get('DegreesC'), '°C', 'Current temperature')
-                        proposal.add_field('min_temp_c', first_entry.get('min'), '°C', 'Minimum threshold')
-                        proposal.add_field('max_temp_c', first_entry.get('max'), '°C', 'Maximum threshold')
-                        proposal.add_field('alarm', first_entry.get('alarm'), '', 'Alarm status')
-                        
-                        proposal.update_frequency = 'frequently (every collection)'
-                        proposal.cardinality = 'medium'
-                        proposal.data_points_per_collection = len(entries)
-                        proposal.notes.append(f'One data point per thermal sensor ({len(entries)} sensors detected)')
-                        proposal.notes.append('Hardware firewalls only - not available on VM firewalls')
-                        proposal.notes.append('Monitor for temperature approaching max threshold')
-                        proposal.notes.append('Alert on alarm=true or temperature >90% of max threshold')
-                        self.proposals.append(proposal)
-                        break
-            
-            # Fan Sensors
-            if 'fan' in env_data:
-                fan = env_data['fan']
-                # Find first slot with entries to use as example
-                for slot_name, slot_data in fan.items():
-                    if 'entry' in slot_data and slot_data['entry']:
-                        entries = slot_data['entry']
-                        # Handle both single entry (dict) and multiple entries (list)
-                        if isinstance(entries, dict):
-                            entries = [entries]
-                        first_entry = entries[0]
-                        
-                        proposal = InfluxDBSchemaProposal(
-                            'palo_alto_env_fan',
-                            'Fan speed measurements',
-                            'environmental'
-                        )
-                        proposal.add_tag('hostname', hostname, 'Device hostname')
-                        proposal.add_tag('slot', first_entry.get('slot'), 'Hardware slot number')
-                        proposal.add_tag('description', first_entry.get('description'), 'Fan description/location')
-                        
-                        proposal.add_field('rpm', first_entry.get('RPMs'), 'RPM', 'Current fan speed')
-                        proposal.add_field('min_rpm', first_entry.get('min'), 'RPM', 'Minimum threshold')
-                        proposal.add_field('alarm', first_entry.get('alarm'), '', 'Alarm status')
-                        
-                        proposal.update_frequency = 'frequently (every collection)'
-                        proposal.cardinality = 'medium'
-                        proposal.data_points_per_collection = len(entries)
-                        proposal.notes.append(f'One data point per fan ({len(entries)} fans detected)')
-                        proposal.notes.append('Hardware firewalls only - not available on VM firewalls')
-                        proposal.notes.append('Monitor for RPM falling below minimum threshold')
-                        proposal.notes.append('Alert on alarm=true or RPM below minimum')
-                        self.proposals.append(proposal)
-                        break
+            hostname = _dig(data, 'system_info', 'system', 'hostname', default=firewall_name)
             
-            # Power/Voltage Sensors
-            if 'power' in env_data:
-                power = env_data['power']
-                # Find first slot with entries to use as example
-                for slot_name, slot_data in power.items():
-                    if 'entry' in slot_data and slot_data['entry']:
-                        entries = slot_data['entry']
-                        # Handle both single entry (dict) and multiple entries (list)
-                        if isinstance(entries, dict):
-                            entries = [entries]
-                        first_entry = entries[0]
-                        
-                        proposal = InfluxDBSchemaProposal(
-                            'palo_alto_env_power',
-                            'Voltage sensor readings',
-                            'environmental'
-                        )
-                        proposal.add_tag('hostname', hostname, 'Device hostname')
-                        proposal.add_tag('slot', first_entry.get('slot'), 'Hardware slot number')
-                        proposal.add_tag('description', first_entry.get('description'), 'Voltage sensor description')
-                        
-                        proposal.add_field('volts', first_entry.get('Volts'), 'V', 'Current voltage')
-                        proposal.add_field('min_volts', first_entry.get('min'), 'V', 'Minimum threshold')
-                        proposal.add_field('max_volts', first_entry.get('max'), 'V', 'Maximum threshold')
-                        proposal.add_field('alarm', first_entry.get('alarm'), '', 'Alarm status')
-                        
-                        proposal.update_frequency = 'frequently (every collection)'
-                        proposal.cardinality = 'medium'
-                        proposal.data_points_per_collection = len(entries)
-                        proposal.notes.append(f'One data point per voltage sensor ({len(entries)} sensors detected)')
-                        proposal.notes.append('Hardware firewalls only - not available on VM firewalls')
-                        proposal.notes.append('Monitor for voltage outside min/max range')
-                        proposal.notes.append('Alert on alarm=true or voltage out of range')
-                        self.proposals.append(proposal)
-                        break
-            
-            # Power Supply Status
-            if 'power-supply' in env_data:
-                ps = env_data['power-supply']
-                # Find first slot with entries to use as example
-                for slot_name, slot_data in ps.items():
-                    if 'entry' in slot_data and slot_data['entry']:
-                        entries = slot_data['entry']
-                        # Handle both single entry (dict) and multiple entries (list)
-                        if isinstance(entries, dict):
-                            entries = [entries]
-                        first_entry = entries[0]
-                        
-                        proposal = InfluxDBSchemaProposal(
-                            'palo_alto_env_power_supply',
-                            'Power supply status and presence',
-                            'environmental'
-                        )
-                        proposal.add_tag('hostname', hostname, 'Device hostname')
-                        proposal.add_tag('slot', first_entry.get('slot'), 'Hardware slot number')
-                        proposal.add_tag('description', first_entry.get('description'), 'Power supply description')
-                        
-                        proposal.add_field('inserted', first_entry.get('Inserted'), '', 'Power supply inserted/present')
-                        proposal.add_field('min_required', first_entry.get('min'), '', 'Minimum required status')
-                        proposal.add_field('alarm', first_entry.get('alarm'), '', 'Alarm status')
-                        
-                        proposal.update_frequency = 'frequently (every collection)'
-                        proposal.cardinality = 'low'
-                        proposal.data_points_per_collection = len(entries)
-                        proposal.notes.append(f'One data point per power supply ({len(entries)} supplies detected)')
-                        proposal.notes.append('Hardware firewalls only - not available on VM firewalls')
-                        proposal.notes.append('Monitor for power supply removal or failure')
-                        proposal.notes.append('Alert on alarm=true or inserted=false')
-                        self.proposals.append(proposal)
-                        break
+            for schema in _ENV_SENSOR_SCHEMAS:
+                section = env_data.get(schema['section'])
+                if not section:
+                    continue
+                # First slot with entries serves as the example
+                entries = next(
+                    (slot_data['entry'] for slot_data in section.values()
+                     if 'entry' in slot_data and slot_data['entry']),
+                    None
+                )
+                if entries is None:
+                    continue
+                entries = _as_list(entries)
+                first_entry = entries[0]
+                
+                yield InfluxDBSchemaProposal.build(
+                    schema['measurement'], schema['description'], 'environmental',
+                    tags=(
+                        ('hostname', hostname, 'Device hostname'),
+                        ('slot', first_entry.get('slot'), 'Hardware slot number'),
+                        ('description', first_entry.get('description'), schema['sensor_description']),
+                    ),
+                    fields=[
+                        (field, first_entry.get(key), unit, description)
+                        for field, key, unit, description in schema['fields']
+                    ],
+                    notes=(
+                        schema['count_note'].format(count=len(entries)),
+                        'Hardware firewalls only - not available on VM firewalls',
+                        *schema['notes'],
+                    ),
+                    cardinality=schema['cardinality'],
+                    data_points_per_collection=len(entries),
+                )
     
     # ==================== INTERFACE MODULE ====================
     
     def analyze_interface_module(self):
         """Analyze the interface module."""
+        self.proposals.extend(self.iter_interface_proposals())
+    
+    def iter_interface_proposals(self) -> Iterator[InfluxDBSchemaProposal]:
+        """Yield the interface module's schema proposals."""
         if 'interfaces' not in self.data:
             return
         
@@ -819,197 +1291,140 @@ class ComprehensiveDataAnalyzer:
                 continue
             
             data = fw_data['data']
+            # Resolved once and shared by all interface proposals for this firewall
+            hostname = self._resolve_hostname(firewall_name) or firewall_name
             
             # Interface Info
-            if 'interface_info' in data and data['interface_info'] and 'hw' in data['interface_info']:
-                hw = data['interface_info']['hw']
-                if 'entry' in hw and hw['entry']:
-                    first_int = hw['entry'][0]
-                    
-                    proposal = InfluxDBSchemaProposal(
-                        'palo_alto_interface_info',
-                        'Interface hardware information and status',
-                        'interfaces'
-                    )
-                    # Get hostname from system data if available
-                    hostname = None
-                    if firewall_name in self.data.get('system', {}):
-                        sys_data = self.data['system'][firewall_name]
-                        if sys_data.get('success') and 'system_info' in sys_data.get('data', {}):
-                            hostname = sys_data['data']['system_info'].get('system', {}).get('hostname', firewall_name)
-                    proposal.add_tag('hostname', hostname or firewall_name)
-                    proposal.add_tag('interface', first_int.get('name'), 'Interface name')
-                    proposal.add_tag('type', str(first_int.get('type')), 'Interface type')
-                    
-                    proposal.add_field('state', first_int.get('state'), '', 'Interface state (up/down)')
-                    proposal.add_field('speed', first_int.get('speed'), 'Mbps', 'Interface speed')
-                    proposal.add_field('duplex', first_int.get('duplex'), '', 'Duplex mode')
-                    proposal.add_field('mac', first_int.get('mac'), '', 'MAC address')
-                    proposal.add_field('mode', first_int.get('mode'), '', 'Interface mode')
-                    proposal.add_field('fec', first_int.get('fec'), '', 'FEC status')
-                    
-                    proposal.cardinality = 'medium'
-                    proposal.data_points_per_collection = len(hw['entry'])
-                    proposal.notes.append(f'One data point per physical interface ({len(hw["entry"])} interfaces)')
-                    self.proposals.append(proposal)
+            hw_entries = _dig(data, 'interface_info', 'hw', 'entry')
+            if hw_entries:
+                first_int = hw_entries[0]
+                
+                proposal = _new_proposal(
+                    'palo_alto_interface_info',
+                    'Interface hardware information and status',
+                    'interfaces',
+                    hostname
+                )
+                proposal.add_tag('interface', first_int.get('name'), 'Interface name')
+                proposal.add_tag('type', str(first_int.get('type')), 'Interface type')
+                
+                proposal.add_fields_bulk(
+                    (field, first_int.get(key), unit, description)
+                    for field, key, unit, description in _INTERFACE_INFO_FIELDS
+                )
+                
+                proposal.cardinality = 'medium'
+                proposal.data_points_per_collection = len(hw_entries)
+                proposal.notes.append(f'One data point per physical interface ({len(hw_entries)} interfaces)')
+                yield proposal
             
             # Interface Logical Info (ifnet)
-            if 'interface_info' in data and data['interface_info'] and 'ifnet' in data['interface_info']:
-                ifnet = data['interface_info']['ifnet']
-                if 'entry' in ifnet and ifnet['entry']:
-                    first_int = ifnet['entry'][0]
-                    
-                    proposal = InfluxDBSchemaProposal(
-                        'palo_alto_interface_logical',
-                        'Interface logical configuration (zones, IPs, routing)',
-                        'interfaces'
-                    )
-                    # Get hostname from system data if available
-                    hostname = None
-                    if firewall_name in self.data.get('system', {}):
-                        sys_data = self.data['system'][firewall_name]
-                        if sys_data.get('success') and 'system_info' in sys_data.get('data', {}):
-                            hostname = sys_data['data']['system_info'].get('system', {}).get('hostname', firewall_name)
-                    proposal.add_tag('hostname', hostname or firewall_name)
-                    proposal.add_tag('interface', first_int.get('name'), 'Interface name')
-                    proposal.add_tag('zone', first_int.get('zone'), 'Security zone')
-                    proposal.add_tag('vsys', str(first_int.get('vsys')), 'Virtual system')
-                    
-                    proposal.add_field('ip', first_int.get('ip'), '', 'IP address/mask')
-                    proposal.add_field('fwd', first_int.get('fwd'), '', 'Forwarding (routing) info')
-                    proposal.add_field('tag', first_int.get('tag'), '', 'VLAN tag')
-                    
-                    proposal.cardinality = 'medium'
-                    proposal.data_points_per_collection = len(ifnet['entry'])
-                    proposal.notes.append(f'Logical interface configuration')
-                    self.proposals.append(proposal)
+            ifnet_entries = _dig(data, 'interface_info', 'ifnet', 'entry')
+            if ifnet_entries:
+                first_int = ifnet_entries[0]
+                
+                proposal = _new_proposal(
+                    'palo_alto_interface_logical',
+                    'Interface logical configuration (zones, IPs, routing)',
+                    'interfaces',
+                    hostname
+                )
+                proposal.add_tags_bulk((
+                    ('interface', first_int.get('name'), 'Interface name'),
+                    ('zone', first_int.get('zone'), 'Security zone'),
+                    ('vsys', str(first_int.get('vsys')), 'Virtual system'),
+                ))
+                
+                proposal.add_fields_bulk(
+                    (field, first_int.get(key), unit, description)
+                    for field, key, unit, description in _INTERFACE_IFNET_FIELDS
+                )
+                
+                proposal.cardinality = 'medium'
+                proposal.data_points_per_collection = len(ifnet_entries)
+                proposal.notes.append('Logical interface configuration')
+                yield proposal
             
             # Interface Hardware Counters
-            if 'interface_counters' in data and data['interface_counters'] and 'hw' in data['interface_counters']:
-                hw = data['interface_counters']['hw']
-                if 'entry' in hw and hw['entry']:
-                    first_int = hw['entry'][0]
-                    port = first_int.get('port', {})
-                    
-                    proposal = InfluxDBSchemaProposal(
-                        'palo_alto_interface_counters_hw',
-                        'Interface hardware/port traffic counters (physical layer)',
-                        'interfaces'
-                    )
-                    # Get hostname from system data if available
-                    hostname = None
-                    if firewall_name in self.data.get('system', {}):
-                        sys_data = self.data['system'][firewall_name]
-                        if sys_data.get('success') and 'system_info' in sys_data.get('data', {}):
-                            hostname = sys_data['data']['system_info'].get('system', {}).get('hostname', firewall_name)
-                    proposal.add_tag('hostname', hostname or firewall_name)
-                    proposal.add_tag('interface', first_int.get('name'), 'Interface name')
-                    
-                    # Port-level RX counters
-                    proposal.add_field('rx_bytes', port.get('rx-bytes'), 'bytes', 'Received bytes (port level)')
-                    proposal.add_field('rx_unicast', port.get('rx-unicast'), 'packets', 'Received unicast packets')
-                    proposal.add_field('rx_multicast', port.get('rx-multicast'), 'packets', 'Received multicast packets')
-                    proposal.add_field('rx_broadcast', port.get('rx-broadcast'), 'packets', 'Received broadcast packets')
-                    proposal.add_field('rx_error', port.get('rx-error'), 'packets', 'Receive errors')
-                    proposal.add_field('rx_discards', port.get('rx-discards'), 'packets', 'Receive discards')
-                    
-                    # Port-level TX counters
-                    proposal.add_field('tx_bytes', port.get('tx-bytes'), 'bytes', 'Transmitted bytes (port level)')
-                    proposal.add_field('tx_unicast', port.get('tx-unicast'), 'packets', 'Transmitted unicast packets')
-                    proposal.add_field('tx_multicast', port.get('tx-multicast'), 'packets', 'Transmitted multicast packets')
-                    proposal.add_field('tx_broadcast', port.get('tx-broadcast'), 'packets', 'Transmitted broadcast packets')
-                    proposal.add_field('tx_error', port.get('tx-error'), 'packets', 'Transmit errors')
-                    proposal.add_field('tx_discards', port.get('tx-discards'), 'packets', 'Transmit discards')
-                    
-                    proposal.add_field('link_down_count', port.get('link-down'), '', 'Link down count')
-                    
-                    # Interface-level counters
-                    proposal.add_field('ibytes', first_int.get('ibytes'), 'bytes', 'Input bytes')
-                    proposal.add_field('obytes', first_int.get('obytes'), 'bytes', 'Output bytes')
-                    proposal.add_field('ipackets', first_int.get('ipackets'), 'packets', 'Input packets')
-                    proposal.add_field('opackets', first_int.get('opackets'), 'packets', 'Output packets')
-                    proposal.add_field('ierrors', first_int.get('ierrors'), 'packets', 'Input errors')
-                    proposal.add_field('idrops', first_int.get('idrops'), 'packets', 'Input drops')
-                    
-                    proposal.cardinality = 'medium'
-                    proposal.data_points_per_collection = len(hw['entry'])
-                    proposal.notes.append('Physical port statistics for network performance monitoring')
-                    proposal.notes.append('Counter values are cumulative (use derivative in Grafana)')
-                    proposal.notes.append('One data point per physical interface')
-                    self.proposals.append(proposal)
+            hw_entries = _dig(data, 'interface_counters', 'hw', 'entry')
+            if hw_entries:
+                first_int = hw_entries[0]
+                port = first_int.get('port', _EMPTY)
+                
+                proposal = _new_proposal(
+                    'palo_alto_interface_counters_hw',
+                    'Interface hardware/port traffic counters (physical layer)',
+                    'interfaces',
+                    hostname
+                )
+                proposal.add_tag('interface', first_int.get('name'), 'Interface name')
+                
+                # Port-level counters
+                proposal.add_fields_bulk(
+                    (field, port.get(key), unit, description)
+                    for field, key, unit, description in _INTERFACE_PORT_COUNTER_FIELDS
+                )
+                
+                # Interface-level counters
+                proposal.add_fields_bulk(
+                    (field, first_int.get(key), unit, description)
+                    for field, key, unit, description in _INTERFACE_HW_COUNTER_FIELDS
+                )
+                
+                proposal.cardinality = 'medium'
+                proposal.data_points_per_collection = len(hw_entries)
+                proposal.notes.extend((
+                    'Physical port statistics for network performance monitoring',
+                    'Counter values are cumulative (use derivative in Grafana)',
+                    'One data point per physical interface',
+                ))
+                yield proposal
             
             # Interface Logical Counters
-            if 'interface_counters' in data and data['interface_counters'] and 'ifnet' in data['interface_counters']:
-                ifnet = data['interface_counters']['ifnet']
-                if 'ifnet' in ifnet and 'entry' in ifnet['ifnet']:
-                    entries = ifnet['ifnet']['entry']
-                    if entries:
-                        first_int = entries[0]
-                        
-                        proposal = InfluxDBSchemaProposal(
-                            'palo_alto_interface_counters_logical',
-                            'Interface logical/firewall-level counters (security processing)',
-                            'interfaces'
-                        )
-                        # Get hostname from system data if available
-                        hostname = None
-                        if firewall_name in self.data.get('system', {}):
-                            sys_data = self.data['system'][firewall_name]
-                            if sys_data.get('success') and 'system_info' in sys_data.get('data', {}):
-                                hostname = sys_data['data']['system_info'].get('system', {}).get('hostname', firewall_name)
-                        proposal.add_tag('hostname', hostname or firewall_name)
-                        proposal.add_tag('interface', first_int.get('name'), 'Interface name')
-                        
-                        # Basic traffic counters
-                        proposal.add_field('ibytes', first_int.get('ibytes'), 'bytes', 'Input bytes (firewall level)')
-                        proposal.add_field('obytes', first_int.get('obytes'), 'bytes', 'Output bytes (firewall level)')
-                        proposal.add_field('ipackets', first_int.get('ipackets'), 'packets', 'Input packets')
-                        proposal.add_field('opackets', first_int.get('opackets'), 'packets', 'Output packets')
-                        proposal.add_field('ierrors', first_int.get('ierrors'), 'packets', 'Input errors')
-                        proposal.add_field('idrops', first_int.get('idrops'), 'packets', 'Input drops')
-                        
-                        # Firewall processing counters
-                        proposal.add_field('flowstate', first_int.get('flowstate'), 'packets', 'Flow state drops')
-                        proposal.add_field('ifwderrors', first_int.get('ifwderrors'), 'packets', 'Forwarding errors')
-                        
-                        # Routing/forwarding drops
-                        proposal.add_field('noroute', first_int.get('noroute'), 'packets', 'No route drops')
-                        proposal.add_field('noarp', first_int.get('noarp'), 'packets', 'No ARP entry drops')
-                        proposal.add_field('noneigh', first_int.get('noneigh'), 'packets', 'No neighbor drops')
-                        proposal.add_field('neighpend', first_int.get('neighpend'), 'packets', 'Neighbor pending drops')
-                        proposal.add_field('nomac', first_int.get('nomac'), 'packets', 'No MAC drops')
-                        
-                        # Security drops
-                        proposal.add_field('zonechange', first_int.get('zonechange'), 'packets', 'Zone change drops')
-                        proposal.add_field('land', first_int.get('land'), 'packets', 'LAND attack drops')
-                        proposal.add_field('pod', first_int.get('pod'), 'packets', 'Ping of death drops')
-                        proposal.add_field('teardrop', first_int.get('teardrop'), 'packets', 'Teardrop attack drops')
-                        proposal.add_field('ipspoof', first_int.get('ipspoof'), 'packets', 'IP spoofing drops')
-                        proposal.add_field('macspoof', first_int.get('macspoof'), 'packets', 'MAC spoofing drops')
-                        proposal.add_field('icmp_frag', first_int.get('icmp_frag'), 'packets', 'ICMP fragment drops')
-                        
-                        # Encapsulation
-                        proposal.add_field('l2_encap', first_int.get('l2_encap'), 'packets', 'L2 encapsulation')
-                        proposal.add_field('l2_decap', first_int.get('l2_decap'), 'packets', 'L2 decapsulation')
-                        
-                        # Connection counters
-                        proposal.add_field('tcp_conn', first_int.get('tcp_conn'), 'connections', 'TCP connections')
-                        proposal.add_field('udp_conn', first_int.get('udp_conn'), 'connections', 'UDP connections')
-                        proposal.add_field('sctp_conn', first_int.get('sctp_conn'), 'connections', 'SCTP connections')
-                        proposal.add_field('other_conn', first_int.get('other_conn'), 'connections', 'Other connections')
-                        
-                        proposal.cardinality = 'medium'
-                        proposal.data_points_per_collection = len(entries)
-                        proposal.notes.append('Firewall/security processing statistics')
-                        proposal.notes.append('Includes logical interfaces (subinterfaces like tunnel.10)')
-                        proposal.notes.append('Critical for troubleshooting security policy drops and routing issues')
-                        proposal.notes.append('Counter values are cumulative (use derivative in Grafana)')
-                        self.proposals.append(proposal)
+            entries = _dig(data, 'interface_counters', 'ifnet', 'ifnet', 'entry')
+            if entries:
+                first_int = entries[0]
+                
+                proposal = _new_proposal(
+                    'palo_alto_interface_counters_logical',
+                    'Interface logical/firewall-level counters (security processing)',
+                    'interfaces',
+                    hostname
+                )
+                proposal.add_tag('interface', first_int.get('name'), 'Interface name')
+                
+                proposal.add_fields_bulk(
+                    (field, first_int.get(key), unit, description)
+                    for field, key, unit, description in _INTERFACE_LOGICAL_COUNTER_FIELDS
+                )
+                
+                proposal.cardinality = 'medium'
+                proposal.data_points_per_collection = len(entries)
+                proposal.notes.extend((
+                    'Firewall/security processing statistics',
+                    'Includes logical interfaces (subinterfaces like tunnel.10)',
+                    'Critical for troubleshooting security policy drops and routing issues',
+                    'Counter values are cumulative (use derivative in Grafana)',
+                ))
+                yield proposal
     
     # ==================== ROUTING MODULE ====================
     
     def analyze_routing_module(self):
         """Analyze the routing module."""
+        self.proposals.extend(self.iter_routing_proposals())
+    
+    def iter_routing_proposals(self, route_counts_emitted: bool = False) -> Iterator[InfluxDBSchemaProposal]:
+        """
+        Yield the routing module's schema proposals.
+        
+        The routing_table counts proposal is a schema example shared by all
+        firewalls, so it is emitted once; per-firewall proposals are not limited.
+        
+        Args:
+            route_counts_emitted: Skip the routing_table counts example, as
+                analyze_parallel() does for firewalls after the one emitting it
+        """
         if 'routing' not in self.data:
             return
         
@@ -1020,8 +1435,8 @@ class ComprehensiveDataAnalyzer:
             data = fw_data['data']
             
             # BGP Summary (only if operational statistics are present, not just config)
-            if 'bgp_summary' in data and data['bgp_summary']:
-                summary = data['bgp_summary']
+            summary = data.get('bgp_summary')
+            if summary:
                 # Check if this is operational data (has stats) vs config data (per-VRF settings)
                 # Operational data has: total_peers, peers_established, peers_down, total_prefixes
                 # Config data has: router-id, local-as, graceful-restart (per VRF)
@@ -1032,215 +1447,226 @@ class ComprehensiveDataAnalyzer:
                 )
                 
                 if has_operational_stats:
-                    proposal = InfluxDBSchemaProposal(
+                    proposal = _new_proposal(
                         'palo_alto_bgp_summary',
                         'BGP routing protocol summary (operational statistics)',
-                        'routing'
+                        'routing',
+                        self._resolve_hostname(firewall_name) or firewall_name
                     )
-                    # Get hostname from system data if available  
-                    hostname = firewall_name
-                    if firewall_name in self.data.get('system', {}):
-                        sys_data = self.data['system'][firewall_name]
-                        if sys_data.get('success') and 'system_info' in sys_data.get('data', {}):
-                            hostname = sys_data['data']['system_info'].get('system', {}).get('hostname', firewall_name)
-                    proposal.add_tag('hostname', hostname)
                     proposal.add_tag('router_id', summary.get('router_id'), 'BGP router ID')
                     proposal.add_tag('local_as', str(summary.get('local_as')), 'Local AS number')
                     
-                    proposal.add_field('total_peers', summary.get('total_peers'), '', 'Total BGP peers')
-                    proposal.add_field('peers_established', summary.get('peers_established'), '', 'Established peers')
-                    proposal.add_field('peers_down', summary.get('peers_down'), '', 'Down peers')
-                    proposal.add_field('total_prefixes', summary.get('total_prefixes'), '', 'Total prefixes received')
+                    proposal.add_fields_bulk((
+                        ('total_peers', summary.get('total_peers'), '', 'Total BGP peers'),
+                        ('peers_established', summary.get('peers_established'), '', 'Established peers'),
+                        ('peers_down', summary.get('peers_down'), '', 'Down peers'),
+                        ('total_prefixes', summary.get('total_prefixes'), '', 'Total prefixes received'),
+                    ))
                     
-                    proposal.notes.append('High-level BGP operational status')
-                    proposal.notes.append('Note: This is different from per-VRF BGP configuration')
-                    self.proposals.append(proposal)
+                    proposal.notes.extend((
+                        'High-level BGP operational status',
+                        'Note: This is different from per-VRF BGP configuration',
+                    ))
+                    yield proposal
             
             # BGP Peer Status (per peer)
-            if 'bgp_peer_status' in data and data['bgp_peer_status']:
-                first_peer_name = next(iter(data['bgp_peer_status']))
-                first_peer = data['bgp_peer_status'][first_peer_name]
-                
-                proposal = InfluxDBSchemaProposal(
-                    'palo_alto_bgp_peer',
-                    'BGP peer status and statistics',
-                    'routing'
-                )
-                proposal.add_tag('hostname', firewall_name)
-                proposal.add_tag('peer_name', first_peer_name, 'BGP peer name')
-                proposal.add_tag('peer_ip', first_peer.get('peer-ip'), 'Peer IP address')
-                proposal.add_tag('peer_group', first_peer.get('peer-group-name'), 'Peer group name')
-                proposal.add_tag('state', first_peer.get('state'), 'BGP session state')
-                
-                proposal.add_field('remote_as', first_peer.get('remote-as'), '', 'Remote AS number')
-                proposal.add_field('local_as', first_peer.get('local-as'), '', 'Local AS number')
-                proposal.add_field('status_time', first_peer.get('status-time'), 's', 'Time in current state')
-                proposal.add_field('state_up', 1 if first_peer.get('state') == 'Established' else 0, 'boolean', 'Peer is up')
-                
-                # Message statistics if available
-                if 'detail' in first_peer and 'messageStats' in first_peer['detail']:
-                    stats = first_peer['detail']['messageStats']
-                    proposal.add_field('messages_sent', stats.get('totalSent'), '', 'Total messages sent')
-                    proposal.add_field('messages_received', stats.get('totalRecv'), '', 'Total messages received')
-                    proposal.add_field('updates_sent', stats.get('updatesSent'), '', 'Update messages sent')
-                    proposal.add_field('updates_received', stats.get('updatesRecv'), '', 'Update messages received')
-                    proposal.add_field('keepalives_sent', stats.get('keepalivesSent'), '', 'Keepalives sent')
-                    proposal.add_field('keepalives_received', stats.get('keepalivesRecv'), '', 'Keepalives received')
-                    proposal.add_field('notifications_sent', stats.get('notificationsSent'), '', 'Notifications sent')
-                    proposal.add_field('notifications_received', stats.get('notificationsRecv'), '', 'Notifications received')
+            peers = data.get('bgp_peer_status')
+            if peers:
+                first_peer_name, first_peer = next(iter(peers.items()))
                 
-                proposal.cardinality = 'medium'
-                proposal.data_points_per_collection = len(data['bgp_peer_status'])
-                proposal.notes.append(f'One data point per BGP peer ({len(data["bgp_peer_status"])} peers)')
-                proposal.notes.append('Critical for BGP monitoring and alerting')
-                proposal.notes.append('state_up field makes it easy to alert on peer down')
-                self.proposals.append(proposal)
-            
-            # BGP Path Monitor (per monitored destination)
-            if 'bgp_path_monitor' in data and data['bgp_path_monitor'] and 'entry' in data['bgp_path_monitor']:
-                entries = data['bgp_path_monitor']['entry']
-                if entries:
-                    first_entry = entries[0]
-                    
-                    proposal = InfluxDBSchemaProposal(
-                        'palo_alto_bgp_path_monitor',
-                        'BGP path monitoring status per destination',
-                        'routing'
+                if first_peer.get('peer-ip'):  # Skip placeholder entries
+                    proposal = _new_proposal(
+                        'palo_alto_bgp_peer',
+                        'BGP peer status and statistics',
+                        'routing',
+                        firewall_name
                     )
-                    proposal.add_tag('hostname', firewall_name)
-                    proposal.add_tag('destination', first_entry.get('destination'), 'Monitored destination prefix')
-                    proposal.add_tag('nexthop', first_entry.get('nexthop'), 'Next hop')
-                    proposal.add_tag('interface', first_entry.get('interface'), 'Egress interface')
-                    proposal.add_tag('pathmonitor_status', first_entry.get('pathmonitor-status'), 'Path monitor status (Up/Down)')
+                    state = first_peer.get('state')
+                    proposal.add_tags_bulk((
+                        ('peer_name', first_peer_name, 'BGP peer name'),
+                        ('peer_ip', first_peer.get('peer-ip'), 'Peer IP address'),
+                        ('peer_group', first_peer.get('peer-group-name'), 'Peer group name'),
+                        ('state', state, 'BGP session state'),
+                    ))
                     
-                    proposal.add_field('metric', first_entry.get('metric'), '', 'Route metric')
-                    proposal.add_field('pathmonitor_condition', first_entry.get('pathmonitor-cond'), '', 'Monitor condition (All/Any)')
-                    proposal.add_field('path_up', 1 if first_entry.get('pathmonitor-status') == 'Up' else 0, 'boolean', 'Path is up')
+                    proposal.add_fields_bulk((
+                        ('remote_as', first_peer.get('remote-as'), '', 'Remote AS number'),
+                        ('local_as', first_peer.get('local-as'), '', 'Local AS number'),
+                        ('status_time', first_peer.get('status-time'), 's', 'Time in current state'),
+                        ('state_up', 1 if state == 'Established' else 0, 'boolean', 'Peer is up'),
+                    ))
                     
-                    # Monitor destination statuses (can have multiple monitors per path)
-                    monitor_count = 0
-                    for i in range(10):  # Check up to 10 possible monitors
-                        if f'monitordst-{i}' in first_entry:
-                            monitor_count += 1
-                            proposal.add_field(f'monitor_{i}_destination', first_entry.get(f'monitordst-{i}'), '', f'Monitor destination {i}')
-                            proposal.add_field(f'monitor_{i}_status', first_entry.get(f'monitorstatus-{i}'), '', f'Monitor {i} status')
-                            proposal.add_field(f'monitor_{i}_interval_count', first_entry.get(f'interval-count-{i}'), '', f'Monitor {i} success/total')
-                        else:
-                            break
+                    # Message statistics if available
+                    stats = _dig(first_peer, 'detail', 'messageStats')
+                    if stats is not None:
+                        proposal.add_fields_bulk(
+                            (field, stats.get(key), unit, description)
+                            for field, key, unit, description in _BGP_MESSAGE_STATS_FIELDS
+                        )
                     
                     proposal.cardinality = 'medium'
-                    proposal.data_points_per_collection = len(entries)
-                    proposal.notes.append(f'One data point per monitored path ({len(entries)} paths)')
-                    proposal.notes.append('Critical for monitoring route failover capability')
-                    proposal.notes.append('path_up field makes it easy to alert on path down')
-                    proposal.notes.append(f'Example shows {monitor_count} health check monitors per path')
-                    self.proposals.append(proposal)
+                    proposal.data_points_per_collection = len(peers)
+                    proposal.notes.extend((
+                        f'One data point per BGP peer ({len(peers)} peers)',
+                        'Critical for BGP monitoring and alerting',
+                        'state_up field makes it easy to alert on peer down',
+                    ))
+                    yield proposal
+            
+            # BGP Path Monitor (per monitored destination)
+            entries = _dig(data, 'bgp_path_monitor', 'entry')
+            if entries and entries[0].get('destination'):  # Skip placeholder entries
+                first_entry = entries[0]
+                
+                proposal = _new_proposal(
+                    'palo_alto_bgp_path_monitor',
+                    'BGP path monitoring status per destination',
+                    'routing',
+                    firewall_name
+                )
+                path_status = first_entry.get('pathmonitor-status')
+                proposal.add_tags_bulk((
+                    ('destination', first_entry.get('destination'), 'Monitored destination prefix'),
+                    ('nexthop', first_entry.get('nexthop'), 'Next hop'),
+                    ('interface', first_entry.get('interface'), 'Egress interface'),
+                    ('pathmonitor_status', path_status, 'Path monitor status (Up/Down)'),
+                ))
+                
+                proposal.add_fields_bulk((
+                    ('metric', first_entry.get('metric'), '', 'Route metric'),
+                    ('pathmonitor_condition', first_entry.get('pathmonitor-cond'), '', 'Monitor condition (All/Any)'),
+                    ('path_up', 1 if path_status == 'Up' else 0, 'boolean', 'Path is up'),
+                ))
+                
+                # Monitor destination statuses (can have multiple monitors per path),
+                # found with one pass over the keys; indices need not be contiguous.
+                # Built field names are interned so every firewall shares one copy
+                monitor_ids = sorted(
+                    int(index)
+                    for key in first_entry if key.startswith('monitordst-')
+                    for index in (key[len('monitordst-'):],) if index.isdigit()
+                )
+                entry_get = first_entry.get
+                for i in monitor_ids:
+                    proposal.add_fields_bulk((
+                        (_intern(f'monitor_{i}_destination'), entry_get(f'monitordst-{i}'), '', f'Monitor destination {i}'),
+                        (_intern(f'monitor_{i}_status'), entry_get(f'monitorstatus-{i}'), '', f'Monitor {i} status'),
+                        (_intern(f'monitor_{i}_interval_count'), entry_get(f'interval-count-{i}'), '', f'Monitor {i} success/total'),
+                    ))
+                monitor_count = len(monitor_ids)
+                
+                proposal.cardinality = 'medium'
+                proposal.data_points_per_collection = len(entries)
+                proposal.notes.extend((
+                    f'One data point per monitored path ({len(entries)} paths)',
+                    'Critical for monitoring route failover capability',
+                    'path_up field makes it easy to alert on path down',
+                    f'Example shows {monitor_count} health check monitors per path',
+                ))
+                yield proposal
             
             # Route Counts from Routing Table (preferred method)
-            if 'routing_table' in data and data['routing_table']:
-                # Count routes per protocol and per VRF
-                protocol_counts = defaultdict(int)
-                vrf_counts = {}
-                total_routes = 0
-                
-                for vrf_name, vrf_routes in data['routing_table'].items():
-                    vrf_protocol_counts = defaultdict(int)
-                    for prefix, route_list in vrf_routes.items():
-                        if isinstance(route_list, list):
-                            for route in route_list:
-                                protocol = route.get('protocol', 'unknown')
-                                # Normalize protocol name: lowercase, strip whitespace, replace spaces with underscores
-                                protocol_normalized = str(protocol).lower().strip().replace(' ', '_')
-                                protocol_counts[protocol_normalized] += 1
-                                vrf_protocol_counts[protocol_normalized] += 1
-                                total_routes += 1
-                    vrf_counts[vrf_name] = dict(vrf_protocol_counts)
+            has_routing_table = 'routing_table' in data and data['routing_table']
+            if has_routing_table and not route_counts_emitted:
+                # Count routes per protocol over all VRFs in one pass, keeping only
+                # the first VRF's breakdown for the example fields
+                routing_table = data['routing_table']
+                vrf_names = list(routing_table)
+                protocol_counts = Counter()
+                first_vrf_counts = None
+                
+                for vrf_routes in routing_table.values():
+                    vrf_protocol_counts = _count_protocols(vrf_routes)
+                    if first_vrf_counts is None:
+                        first_vrf_counts = vrf_protocol_counts
+                    protocol_counts.update(vrf_protocol_counts)
                 
                 # Create ONE measurement proposal showing the first VRF as example
                 # This is a single measurement with VRF as a tag, not multiple measurements
-                first_vrf_name = next(iter(vrf_counts))
-                first_vrf_counts = vrf_counts[first_vrf_name]
+                first_vrf_name = vrf_names[0]
                 
-                proposal = InfluxDBSchemaProposal(
+                proposal = _new_proposal(
                     'palo_alto_routing_table_counts',
                     'Route counts per protocol and VRF from routing table',
-                    'routing'
+                    'routing',
+                    firewall_name
                 )
-                proposal.add_tag('hostname', firewall_name)
                 proposal.add_tag('vrf', first_vrf_name, 'Virtual Router / VRF name')
                 
                 # Add counts per protocol
-                for protocol, count in first_vrf_counts.items():
-                    proposal.add_field(f'routes_{protocol}', count, 'routes', f'Number of {protocol} routes')
+                proposal.add_fields_bulk(
+                    (f'routes_{protocol}', count, 'routes', f'Number of {protocol} routes')
+                    for protocol, count in first_vrf_counts.items()
+                )
                 
                 proposal.add_field('routes_total', sum(first_vrf_counts.values()), 'routes', 'Total routes in VRF')
                 
                 proposal.cardinality = 'low to medium'
-                proposal.data_points_per_collection = len(vrf_counts)
-                proposal.notes.append(f'One data point per VRF ({len(vrf_counts)} VRFs found: {", ".join(vrf_counts.keys())})')
-                proposal.notes.append('Primary source for route counts')
-                proposal.notes.append('Protocols found: ' + ', '.join(protocol_counts.keys()))
-                proposal.notes.append('Protocol names are normalized: lowercase, no spaces (e.g., "Local" becomes "local")')
-                proposal.notes.append('Use for monitoring routing table growth and protocol distribution')
-                proposal.notes.append('This is a SINGLE measurement with multiple data points (one per VRF)')
-                self.proposals.append(proposal)
-                
-                # Don't process other firewalls since we're just showing schema
-                break
+                proposal.data_points_per_collection = len(vrf_names)
+                proposal.notes.extend((
+                    f'One data point per VRF ({len(vrf_names)} VRFs found: {", ".join(vrf_names)})',
+                    'Primary source for route counts',
+                    f'Protocols found: {", ".join(protocol_counts)}',
+                    'Protocol names are normalized: lowercase, no spaces (e.g., "Local" becomes "local")',
+                    'Use for monitoring routing table growth and protocol distribution',
+                    'This is a SINGLE measurement with multiple data points (one per VRF)',
+                ))
+                yield proposal
+                route_counts_emitted = True
             
             # Fallback: Route Counts from Individual Protocol Modules
             # This is used when routing_table is disabled but individual modules are enabled
-            else:
+            elif not has_routing_table:
                 # Check for static_routes
-                if 'static_routes' in data and data['static_routes']:
-                    static_count = 0
-                    vrf_list = []
-                    for vrf_name, vrf_routes in data['static_routes'].items():
-                        vrf_list.append(vrf_name)
-                        for prefix, route_list in vrf_routes.items():
-                            if isinstance(route_list, list):
-                                static_count += len(route_list)
+                static_routes = data.get('static_routes')
+                if static_routes:
+                    static_count = _count_routes(static_routes)
+                    vrf_list = list(static_routes)
                     
-                    proposal = InfluxDBSchemaProposal(
+                    proposal = _new_proposal(
                         'palo_alto_static_routes_count',
                         'Static route counts (fallback when routing_table disabled)',
-                        'routing'
+                        'routing',
+                        firewall_name
                     )
-                    proposal.add_tag('hostname', firewall_name)
                     proposal.add_field('static_routes', static_count, 'routes', 'Number of static routes')
                     
                     proposal.cardinality = 'low'
-                    proposal.notes.append('Fallback measurement when routing_table is disabled')
-                    proposal.notes.append(f'Covers VRFs: {", ".join(vrf_list)}')
-                    self.proposals.append(proposal)
+                    proposal.notes.extend((
+                        'Fallback measurement when routing_table is disabled',
+                        f'Covers VRFs: {", ".join(vrf_list)}',
+                    ))
+                    yield proposal
                 
                 # Check for bgp_routes
-                if 'bgp_routes' in data and data['bgp_routes']:
-                    bgp_count = 0
-                    vrf_list = []
-                    for vrf_name, vrf_routes in data['bgp_routes'].items():
-                        vrf_list.append(vrf_name)
-                        for prefix, route_list in vrf_routes.items():
-                            if isinstance(route_list, list):
-                                bgp_count += len(route_list)
+                bgp_routes = data.get('bgp_routes')
+                if bgp_routes:
+                    bgp_count = _count_routes(bgp_routes)
+                    vrf_list = list(bgp_routes)
                     
-                    proposal = InfluxDBSchemaProposal(
+                    proposal = _new_proposal(
                         'palo_alto_bgp_routes_count',
                         'BGP route counts (fallback when routing_table disabled)',
-                        'routing'
+                        'routing',
+                        firewall_name
                     )
-                    proposal.add_tag('hostname', firewall_name)
                     proposal.add_field('bgp_routes', bgp_count, 'routes', 'Number of BGP routes')
                     
                     proposal.cardinality = 'low'
-                    proposal.notes.append('Fallback measurement when routing_table is disabled')
-                    proposal.notes.append(f'Covers VRFs: {", ".join(vrf_list)}')
-                    self.proposals.append(proposal)
+                    proposal.notes.extend((
+                        'Fallback measurement when routing_table is disabled',
+                        f'Covers VRFs: {", ".join(vrf_list)}',
+                    ))
+                    yield proposal
     
     # ==================== COUNTERS MODULE ====================
     
     def analyze_counters_module(self):
         """Analyze the global counters module."""
+        self.proposals.extend(self.iter_counters_proposals())
+    
+    def iter_counters_proposals(self) -> Iterator[InfluxDBSchemaProposal]:
+        """Yield the counters module's schema proposals."""
         if 'counters' not in self.data:
             return
         
@@ -1251,56 +1677,64 @@ class ComprehensiveDataAnalyzer:
             data = fw_data['data']
             
             # Global Counters
-            if 'global_counters' in data and data['global_counters'] and 'global' in data['global_counters']:
-                global_data = data['global_counters']['global']
-                if global_data and 'counters' in global_data and global_data['counters'] and 'entry' in global_data['counters']:
-                    entries = global_data['counters']['entry']
-                    
-                    # Group counters by category
-                    categories = defaultdict(list)
-                    for entry in entries:
-                        category = entry.get('category', 'other')
-                        categories[category].append(entry)
+            entries = _dig(data, 'global_counters', 'global', 'counters', 'entry')
+            if entries:
+                
+                # Count counters per category, keeping only the first 10 entries
+                # of each significant category as samples
+                category_counts = Counter(entry.get('category', 'other') for entry in entries)
+                samples = {
+                    category: [] for category, count in category_counts.items()
+                    if count > 5  # Only create separate measurement for significant categories
+                }
+                for entry in entries:
+                    category_samples = samples.get(entry.get('category', 'other'))
+                    if category_samples is not None and len(category_samples) < 10:  # Limit to first 10 to avoid clutter
+                        category_samples.append(entry)
+                
+                # Create proposals for each major category
+                for category, category_samples in samples.items():
+                    proposal = _new_proposal(
+                        _intern(f'palo_alto_counters_{category}'),
+                        f'Global {category} counters',
+                        'counters',
+                        firewall_name
+                    )
                     
-                    # Create proposals for each major category
-                    for category, category_entries in categories.items():
-                        if len(category_entries) > 5:  # Only create separate measurement for significant categories
-                            first_entry = category_entries[0]
-                            
-                            proposal = InfluxDBSchemaProposal(
-                                f'palo_alto_counters_{category}',
-                                f'Global {category} counters',
-                                'counters'
+                    # Add sample fields from first few entries (names interned: the
+                    # same counters repeat on every firewall)
+                    for entry in category_samples:
+                        counter_name = _intern(entry.get('name', ''))
+                        proposal.add_field(
+                            counter_name,
+                            entry.get('value'),
+                            '',
+                            entry.get('desc', '')
+                        )
+                        # Also add rate if available
+                        if 'rate' in entry:
+                            proposal.add_field(
+                                _intern(f'{counter_name}_rate'),
+                                entry.get('rate'),
+                                '/s',
+                                f'{entry.get("desc", "")} rate'
                             )
-                            proposal.add_tag('hostname', firewall_name)
-                            
-                            # Add sample fields from first few entries
-                            for entry in category_entries[:10]:  # Limit to first 10 to avoid clutter
-                                counter_name = entry.get('name', '')
-                                proposal.add_field(
-                                    counter_name,
-                                    entry.get('value'),
-                                    '',
-                                    entry.get('desc', '')
-                                )
-                                # Also add rate if available
-                                if 'rate' in entry:
-                                    proposal.add_field(
-                                        f'{counter_name}_rate',
-                                        entry.get('rate'),
-                                        '/s',
-                                        f'{entry.get("desc", "")} rate'
-                                    )
-                            
-                            proposal.notes.append(f'{len(category_entries)} counters in this category')
-                            proposal.notes.append('Counter values are cumulative')
-                            proposal.notes.append('Rate values show current rate per second')
-                            self.proposals.append(proposal)
+                    
+                    proposal.notes.extend((
+                        f'{category_counts[category]} counters in this category',
+                        'Counter values are cumulative',
+                        'Rate values show current rate per second',
+                    ))
+                    yield proposal
     
     # ==================== GLOBALPROTECT MODULE ====================
     
     def analyze_globalprotect_module(self):
         """Analyze the GlobalProtect module."""
+        self.proposals.extend(self.iter_globalprotect_proposals())
+    
+    def iter_globalprotect_proposals(self) -> Iterator[InfluxDBSchemaProposal]:
+        """Yield the globalprotect module's schema proposals."""
         if 'global_protect' not in self.data:
             return
         
@@ -1310,55 +1744,36 @@ class ComprehensiveDataAnalyzer:
             
             data = fw_data['data']
             
-            # Gateway Summary
-            if 'gateway_summary' in data and data['gateway_summary'] and 'entry' in data['gateway_summary']:
-                entries = data['gateway_summary']['entry']
-                if entries:
-                    first_gw = entries[0]
-                    
-                    proposal = InfluxDBSchemaProposal(
-                        'palo_alto_gp_gateway',
-                        'GlobalProtect gateway statistics',
-                        'globalprotect'
-                    )
-                    proposal.add_tag('hostname', firewall_name)
-                    proposal.add_tag('gateway_name', first_gw.get('name'), 'Gateway name')
-                    
-                    proposal.add_field('current_users', first_gw.get('CurrentUsers'), '', 'Current connected users')
-                    proposal.add_field('previous_users', first_gw.get('PreviousUsers'), '', 'Previous user count')
-                    proposal.add_field('max_concurrent_tunnels', first_gw.get('gateway_max_concurrent_tunnel'), '', 'Max concurrent tunnels')
-                    proposal.add_field('successful_ipsec_connections', first_gw.get('gateway_successful_ip_sec_connections'), '', 'Successful IPsec connections')
-                    proposal.add_field('total_tunnel_count', first_gw.get('record_gateway_tunnel_count'), '', 'Total tunnel count')
-                    
-                    proposal.cardinality = 'low to medium'
-                    proposal.data_points_per_collection = len(entries)
-                    proposal.notes.append('One data point per GlobalProtect gateway')
-                    self.proposals.append(proposal)
-            
-            # Portal Summary
-            if 'portal_summary' in data and data['portal_summary'] and 'entry' in data['portal_summary']:
-                entries = data['portal_summary']['entry']
-                if entries:
-                    first_portal = entries[0]
-                    
-                    proposal = InfluxDBSchemaProposal(
-                        'palo_alto_gp_portal',
-                        'GlobalProtect portal statistics',
-                        'globalprotect'
-                    )
-                    proposal.add_tag('hostname', firewall_name)
-                    proposal.add_tag('portal_name', first_portal.get('name'), 'Portal name')
-                    
-                    proposal.add_field('successful_connections', first_portal.get('successful_connections'), '', 'Successful connections')
-                    
-                    proposal.cardinality = 'low'
-                    proposal.data_points_per_collection = len(entries)
-                    self.proposals.append(proposal)
+            for schema in _GLOBALPROTECT_SCHEMAS:
+                section = data.get(schema['section'])
+                if not section or 'entry' not in section or not section['entry']:
+                    continue
+                entries = section['entry']
+                first_entry = entries[0]
+                
+                yield InfluxDBSchemaProposal.build(
+                    schema['measurement'], schema['description'], 'globalprotect',
+                    tags=(
+                        ('hostname', firewall_name, ''),
+                        *((tag, first_entry.get(key), description) for tag, key, description in schema['tags']),
+                    ),
+                    fields=[
+                        (field, first_entry.get(key), unit, description)
+                        for field, key, unit, description in schema['fields']
+                    ],
+                    notes=schema['notes'],
+                    cardinality=schema['cardinality'],
+                    data_points_per_collection=len(entries),
+                )
     
     # ==================== VPN MODULE ====================
     
     def analyze_vpn_module(self):
         """Analyze the VPN tunnels module."""
+        self.proposals.extend(self.iter_vpn_proposals())
+    
+    def iter_vpn_proposals(self) -> Iterator[InfluxDBSchemaProposal]:
+        """Yield the vpn module's schema proposals."""
         if 'vpn' not in self.data:
             return
         
@@ -1372,235 +1787,307 @@ class ComprehensiveDataAnalyzer:
             if 'vpn_flows' in data:
                 flows = data['vpn_flows']
                 
-                proposal = InfluxDBSchemaProposal(
+                proposal = _new_proposal(
                     'palo_alto_vpn_flows',
                     'VPN flow summary statistics',
-                    'vpn'
+                    'vpn',
+                    firewall_name
                 )
-                proposal.add_tag('hostname', firewall_name)
                 
-                proposal.add_field('num_ipsec', flows.get('num_ipsec'), '', 'Number of IPsec flows')
-                proposal.add_field('num_sslvpn', flows.get('num_sslvpn'), '', 'Number of SSL VPN flows')
-                proposal.add_field('total_flows', flows.get('total'), '', 'Total VPN flows')
+                proposal.add_fields_bulk((
+                    ('num_ipsec', flows.get('num_ipsec'), '', 'Number of IPsec flows'),
+                    ('num_sslvpn', flows.get('num_sslvpn'), '', 'Number of SSL VPN flows'),
+                    ('total_flows', flows.get('total'), '', 'Total VPN flows'),
+                ))
                 
                 proposal.cardinality = 'low'
                 proposal.notes.append('Summary of all VPN flows')
-                self.proposals.append(proposal)
+                yield proposal
             
             # IPsec Flow Operational State (from vpn_flows.IPSec.entry)
-            if 'vpn_flows' in data and data['vpn_flows'] and data['vpn_flows'].get('IPSec'):
-                ipsec_data = data['vpn_flows']['IPSec']
-                flow_entries = []
-                if isinstance(ipsec_data, dict) and 'entry' in ipsec_data:
-                    flow_entries = ipsec_data['entry']
-                    # Ensure it's a list
-                    if not isinstance(flow_entries, list):
-                        flow_entries = [flow_entries]
-                
-                if flow_entries:
-                    first_flow = flow_entries[0]
-                    
-                    proposal = InfluxDBSchemaProposal(
-                        'palo_alto_ipsec_flow',
-                        'Active IPsec flow operational state',
-                        'vpn'
-                    )
-                    proposal.add_tag('hostname', firewall_name)
-                    proposal.add_tag('flow_name', first_flow.get('name'), 'Flow/tunnel name')
-                    
-                    proposal.add_field('flow_id', first_flow.get('id'), '', 'Flow ID')
-                    proposal.add_field('gateway_id', first_flow.get('gwid'), '', 'Associated gateway ID')
-                    proposal.add_field('inner_interface', first_flow.get('inner-if'), '', 'Inner (logical) interface')
-                    proposal.add_field('outer_interface', first_flow.get('outer-if'), '', 'Outer (physical) interface')
-                    proposal.add_field('state', first_flow.get('state'), '', 'Flow state (active/down)')
-                    proposal.add_field('ipsec_mode', first_flow.get('ipsec-mode'), '', 'IPsec mode (tunnel/transport)')
-                    proposal.add_field('local_ip', first_flow.get('localip'), '', 'Local endpoint IP address')
-                    proposal.add_field('peer_ip', first_flow.get('peerip'), '', 'Peer endpoint IP address')
-                    proposal.add_field('monitoring', first_flow.get('mon'), '', 'Path monitoring status (on/off)')
-                    proposal.add_field('owner', first_flow.get('owner'), '', 'Owner ID')
-                    proposal.add_field('state_up', 1 if first_flow.get('state') == 'active' else 0, 'boolean', 'Flow is active (1=active, 0=down)')
-                    
-                    proposal.cardinality = 'medium'
-                    proposal.data_points_per_collection = len(flow_entries)
-                    proposal.notes.append(f'One data point per active IPsec flow ({len(flow_entries)} flows)')
-                    proposal.notes.append('Captures operational state from vpn_flows.IPSec.entry')
-                    proposal.notes.append('Different from palo_alto_vpn_tunnel which shows configuration')
-                    proposal.notes.append('Critical for real-time flow state monitoring')
-                    self.proposals.append(proposal)
+            flow_entries = _as_list(_dig(data, 'vpn_flows', 'IPSec', 'entry'))
+            if flow_entries and flow_entries[0].get('name'):  # Skip placeholder entries
+                first_flow = flow_entries[0]
+                flow_count = len(flow_entries)
+                
+                proposal = _new_proposal(
+                    'palo_alto_ipsec_flow',
+                    'Active IPsec flow operational state',
+                    'vpn',
+                    firewall_name
+                )
+                proposal.add_tag('flow_name', first_flow.get('name'), 'Flow/tunnel name')
+                
+                proposal.add_fields_bulk(
+                    (field, first_flow.get(key), unit, description)
+                    for field, key, unit, description in _IPSEC_FLOW_FIELDS
+                )
+                proposal.add_field('state_up', 1 if first_flow.get('state') == 'active' else 0, 'boolean', 'Flow is active (1=active, 0=down)')
+                
+                proposal.cardinality = 'medium'
+                proposal.data_points_per_collection = flow_count
+                proposal.notes.extend((
+                    f'One data point per active IPsec flow ({flow_count} flows)',
+                    'Captures operational state from vpn_flows.IPSec.entry',
+                    'Different from palo_alto_vpn_tunnel which shows configuration',
+                    'Critical for real-time flow state monitoring',
+                ))
+                yield proposal
             
             # VPN Tunnels (per tunnel from active_tunnels or vpn_tunnels)
             tunnel_data = data.get('active_tunnels') or data.get('vpn_tunnels')
-            if tunnel_data and tunnel_data.get('entries'):
-                entries = tunnel_data['entries']
-                if isinstance(entries, dict) and 'entry' in entries:
-                    tunnel_entries = entries['entry']
-                    # Ensure it's a list
-                    if not isinstance(tunnel_entries, list):
-                        tunnel_entries = [tunnel_entries]
-                    
-                    if tunnel_entries:
-                        first_tunnel = tunnel_entries[0]
-                        
-                        proposal = InfluxDBSchemaProposal(
-                            'palo_alto_vpn_tunnel',
-                            'Individual VPN tunnel configuration and status',
-                            'vpn'
-                        )
-                        proposal.add_tag('hostname', firewall_name)
-                        proposal.add_tag('tunnel_name', first_tunnel.get('name'), 'Tunnel name')
-                        proposal.add_tag('gateway', first_tunnel.get('gw'), 'Associated gateway name')
-                        
-                        proposal.add_field('tunnel_id', first_tunnel.get('id'), '', 'Tunnel ID')
-                        proposal.add_field('protocol', first_tunnel.get('proto'), '', 'IPsec protocol (ESP/AH)')
-                        proposal.add_field('mode', first_tunnel.get('mode'), '', 'Tunnel mode')
-                        proposal.add_field('dh_group', first_tunnel.get('dh'), '', 'Diffie-Hellman group for PFS')
-                        proposal.add_field('encryption', first_tunnel.get('enc'), '', 'Encryption algorithm')
-                        proposal.add_field('hash', first_tunnel.get('hash'), '', 'Hash algorithm')
-                        proposal.add_field('lifetime', first_tunnel.get('life'), 's', 'SA lifetime in seconds')
-                        proposal.add_field('kb_limit', first_tunnel.get('kb'), 'KB', 'KB limit (0 = unlimited)')
-                        
-                        proposal.cardinality = 'medium'
-                        proposal.data_points_per_collection = len(tunnel_entries)
-                        proposal.notes.append(f'One data point per VPN tunnel ({len(tunnel_entries)} tunnels)')
-                        proposal.notes.append('Tracks tunnel configuration parameters')
-                        self.proposals.append(proposal)
+            tunnel_entries = _entries(tunnel_data)
+            if tunnel_entries and tunnel_entries[0].get('name'):  # Skip placeholder entries
+                first_tunnel = tunnel_entries[0]
+                tunnel_count = len(tunnel_entries)
+                
+                proposal = _new_proposal(
+                    'palo_alto_vpn_tunnel',
+                    'Individual VPN tunnel configuration and status',
+                    'vpn',
+                    firewall_name
+                )
+                proposal.add_tag('tunnel_name', first_tunnel.get('name'), 'Tunnel name')
+                proposal.add_tag('gateway', first_tunnel.get('gw'), 'Associated gateway name')
+                
+                proposal.add_fields_bulk(
+                    (field, first_tunnel.get(key), unit, description)
+                    for field, key, unit, description in _VPN_TUNNEL_FIELDS
+                )
+                
+                proposal.cardinality = 'medium'
+                proposal.data_points_per_collection = tunnel_count
+                proposal.notes.extend((
+                    f'One data point per VPN tunnel ({tunnel_count} tunnels)',
+                    'Tracks tunnel configuration parameters',
+                ))
+                yield proposal
             
             # VPN Gateways (per gateway)
-            if 'vpn_gateways' in data and data['vpn_gateways'] and data['vpn_gateways'].get('entries'):
-                gateways_data = data['vpn_gateways']
-                if isinstance(gateways_data, dict) and 'entries' in gateways_data:
-                    entries = gateways_data['entries']
-                    if isinstance(entries, dict) and 'entry' in entries:
-                        gateway_entries = entries['entry']
-                        # Ensure it's a list
-                        if not isinstance(gateway_entries, list):
-                            gateway_entries = [gateway_entries]
-                        
-                        if gateway_entries:
-                            first_gw = gateway_entries[0]
-                            
-                            # Prefer v2 (IKEv2) over v1
-                            ike_version = first_gw.get('v2') if first_gw.get('v2') else first_gw.get('v1')
-                            
-                            # Extract peer and local IPs from ID strings
-                            peer_id = ike_version.get('peer-id', '') if ike_version else ''
-                            local_id = ike_version.get('local-id', '') if ike_version else ''
-                            peer_ip = peer_id.split('ipaddr:')[-1].rstrip(')') if 'ipaddr:' in peer_id else peer_id
-                            local_ip = local_id.split('ipaddr:')[-1].rstrip(')') if 'ipaddr:' in local_id else local_id
-                            
-                            proposal = InfluxDBSchemaProposal(
-                                'palo_alto_vpn_gateway',
-                                'VPN gateway (IKE) configuration and parameters',
-                                'vpn'
-                            )
-                            proposal.add_tag('hostname', firewall_name)
-                            proposal.add_tag('gateway_name', first_gw.get('name'), 'Gateway name')
-                            
-                            proposal.add_field('gateway_id', first_gw.get('id'), '', 'Gateway ID')
-                            proposal.add_field('socket', first_gw.get('sock'), '', 'Socket number')
-                            proposal.add_field('nat_t', first_gw.get('natt'), '', 'NAT traversal (0=disabled, 1=enabled)')
-                            proposal.add_field('peer_ip', peer_ip, '', 'Peer gateway IP address')
-                            proposal.add_field('local_ip', local_ip, '', 'Local gateway IP address')
-                            proposal.add_field('ike_version', 2 if first_gw.get('v2') else 1, '', 'IKE version (1 or 2)')
-                            proposal.add_field('authentication', ike_version.get('auth') if ike_version else None, '', 'Authentication method')
-                            proposal.add_field('dh_group', ike_version.get('dh') if ike_version else None, '', 'Diffie-Hellman group')
-                            proposal.add_field('encryption', ike_version.get('enc') if ike_version else None, '', 'Encryption algorithm')
-                            proposal.add_field('hash', ike_version.get('hash') if ike_version else None, '', 'Hash algorithm')
-                            proposal.add_field('prf', ike_version.get('prf') if ike_version and 'prf' in ike_version else None, '', 'Pseudo-Random Function (IKEv2 only)')
-                            proposal.add_field('lifetime', ike_version.get('life') if ike_version else None, 's', 'IKE SA lifetime in seconds')
-                            
-                            proposal.cardinality = 'medium'
-                            proposal.data_points_per_collection = len(gateway_entries)
-                            proposal.notes.append(f'One data point per VPN gateway ({len(gateway_entries)} gateways)')
-                            proposal.notes.append('Contains IKE (Phase 1) parameters')
-                            proposal.notes.append('Prefers IKEv2 settings over IKEv1 when both are configured')
-                            self.proposals.append(proposal)
+            gateway_entries = _entries(data.get('vpn_gateways'))
+            if gateway_entries and gateway_entries[0].get('name'):  # Skip placeholder entries
+                first_gw = gateway_entries[0]
+                gateway_count = len(gateway_entries)
+                
+                # Prefer v2 (IKEv2) over v1; _EMPTY when neither is configured
+                ike_v2 = first_gw.get('v2')
+                ike_version = ike_v2 or first_gw.get('v1') or _EMPTY
+                
+                # Extract peer and local IPs from ID strings
+                peer_id = ike_version.get('peer-id', '')
+                local_id = ike_version.get('local-id', '')
+                peer_ip = peer_id.split('ipaddr:')[-1].rstrip(')') if 'ipaddr:' in peer_id else peer_id
+                local_ip = local_id.split('ipaddr:')[-1].rstrip(')') if 'ipaddr:' in local_id else local_id
+                
+                proposal = _new_proposal(
+                    'palo_alto_vpn_gateway',
+                    'VPN gateway (IKE) configuration and parameters',
+                    'vpn',
+                    firewall_name
+                )
+                proposal.add_tag('gateway_name', first_gw.get('name'), 'Gateway name')
+                
+                proposal.add_fields_bulk((
+                    ('gateway_id', first_gw.get('id'), '', 'Gateway ID'),
+                    ('socket', first_gw.get('sock'), '', 'Socket number'),
+                    ('nat_t', first_gw.get('natt'), '', 'NAT traversal (0=disabled, 1=enabled)'),
+                    ('peer_ip', peer_ip, '', 'Peer gateway IP address'),
+                    ('local_ip', local_ip, '', 'Local gateway IP address'),
+                    ('ike_version', 2 if ike_v2 else 1, '', 'IKE version (1 or 2)'),
+                    ('authentication', ike_version.get('auth'), '', 'Authentication method'),
+                    ('dh_group', ike_version.get('dh'), '', 'Diffie-Hellman group'),
+                    ('encryption', ike_version.get('enc'), '', 'Encryption algorithm'),
+                    ('hash', ike_version.get('hash'), '', 'Hash algorithm'),
+                    ('prf', ike_version.get('prf'), '', 'Pseudo-Random Function (IKEv2 only)'),
+                    ('lifetime', ike_version.get('life'), 's', 'IKE SA lifetime in seconds'),
+                ))
+                
+                proposal.cardinality = 'medium'
+                proposal.data_points_per_collection = gateway_count
+                proposal.notes.extend((
+                    f'One data point per VPN gateway ({gateway_count} gateways)',
+                    'Contains IKE (Phase 1) parameters',
+                    'Prefers IKEv2 settings over IKEv1 when both are configured',
+                ))
+                yield proposal
             
             # IPsec Security Associations (per SA)
-            if 'ipsec_sa' in data and data['ipsec_sa'] and data['ipsec_sa'].get('entries'):
-                sa_data = data['ipsec_sa']
-                if isinstance(sa_data, dict) and 'entries' in sa_data:
-                    entries = sa_data['entries']
-                    if isinstance(entries, dict) and 'entry' in entries:
-                        sa_entries = entries['entry']
-                        # Ensure it's a list
-                        if not isinstance(sa_entries, list):
-                            sa_entries = [sa_entries]
-                        
-                        if sa_entries:
-                            first_sa = sa_entries[0]
-                            
-                            # Calculate percentage of lifetime remaining
-                            lifetime = first_sa.get('life')
-                            remain = first_sa.get('remain')
-                            remain_percent = None
-                            if lifetime and remain and lifetime > 0:
-                                remain_percent = round((remain / lifetime) * 100, 2)
-                            
-                            proposal = InfluxDBSchemaProposal(
-                                'palo_alto_ipsec_sa',
-                                'Active IPsec Security Associations with lifetime tracking',
-                                'vpn'
-                            )
-                            proposal.add_tag('hostname', firewall_name)
-                            proposal.add_tag('tunnel_name', first_sa.get('name'), 'Tunnel name')
-                            proposal.add_tag('gateway', first_sa.get('gateway'), 'Gateway name')
-                            
-                            proposal.add_field('gateway_id', first_sa.get('gwid'), '', 'Gateway ID')
-                            proposal.add_field('tunnel_id', first_sa.get('tid'), '', 'Tunnel ID')
-                            proposal.add_field('remote_ip', first_sa.get('remote'), '', 'Remote peer IP address')
-                            proposal.add_field('protocol', first_sa.get('proto'), '', 'IPsec protocol')
-                            proposal.add_field('encryption', first_sa.get('enc'), '', 'Encryption algorithm')
-                            proposal.add_field('hash', first_sa.get('hash'), '', 'Hash algorithm')
-                            proposal.add_field('inbound_spi', first_sa.get('i_spi'), '', 'Inbound SPI (Security Parameter Index)')
-                            proposal.add_field('outbound_spi', first_sa.get('o_spi'), '', 'Outbound SPI')
-                            proposal.add_field('lifetime_seconds', lifetime, 's', 'SA lifetime')
-                            proposal.add_field('remaining_seconds', remain, 's', 'Time remaining until rekey')
-                            proposal.add_field('remaining_percent', remain_percent, '%', 'Percentage of lifetime remaining')
-                            
-                            proposal.cardinality = 'medium'
-                            proposal.data_points_per_collection = len(sa_entries)
-                            proposal.notes.append(f'One data point per active IPsec SA ({len(sa_entries)} SAs)')
-                            proposal.notes.append('Critical for monitoring tunnel health and rekey timing')
-                            proposal.notes.append('Alert when remaining_seconds < 300 (5 minutes)')
-                            self.proposals.append(proposal)
+            sa_entries = _entries(data.get('ipsec_sa'))
+            if sa_entries and sa_entries[0].get('name'):  # Skip placeholder entries
+                first_sa = sa_entries[0]
+                sa_count = len(sa_entries)
+                
+                # Calculate percentage of lifetime remaining
+                lifetime = first_sa.get('life')
+                remain = first_sa.get('remain')
+                remain_percent = None
+                if lifetime and remain and lifetime > 0:
+                    remain_percent = round((remain / lifetime) * 100, 2)
+                
+                proposal = _new_proposal(
+                    'palo_alto_ipsec_sa',
+                    'Active IPsec Security Associations with lifetime tracking',
+                    'vpn',
+                    firewall_name
+                )
+                proposal.add_tag('tunnel_name', first_sa.get('name'), 'Tunnel name')
+                proposal.add_tag('gateway', first_sa.get('gateway'), 'Gateway name')
+                
+                proposal.add_fields_bulk(
+                    (field, first_sa.get(key), unit, description)
+                    for field, key, unit, description in _IPSEC_SA_FIELDS
+                )
+                proposal.add_fields_bulk((
+                    ('lifetime_seconds', lifetime, 's', 'SA lifetime'),
+                    ('remaining_seconds', remain, 's', 'Time remaining until rekey'),
+                    ('remaining_percent', remain_percent, '%', 'Percentage of lifetime remaining'),
+                ))
+                
+                proposal.cardinality = 'medium'
+                proposal.data_points_per_collection = sa_count
+                proposal.notes.extend((
+                    f'One data point per active IPsec SA ({sa_count} SAs)',
+                    'Critical for monitoring tunnel health and rekey timing',
+                    'Alert when remaining_seconds < 300 (5 minutes)',
+                ))
+                yield proposal
     
     # ==================== ANALYSIS AND REPORTING ====================
     
     def analyze_all(self):
         """Perform complete analysis of all modules."""
-        self.analyze_system_module()
-        self.analyze_environmental_module()
-        self.analyze_interface_module()
-        self.analyze_routing_module()
-        self.analyze_counters_module()
-        self.analyze_globalprotect_module()
-        self.analyze_vpn_module()
+        self.proposals.extend(self.iter_proposals())
+        self._finalize_proposals()
+    
+    def _finalize_proposals(self):
+        """Finalize every collected proposal (see InfluxDBSchemaProposal.finalize)."""
+        for proposal in self.proposals:
+            proposal.finalize()
+    
+    def iter_proposals(self) -> Iterator[InfluxDBSchemaProposal]:
+        """Yield proposals for all modules lazily, in analyze_all() order."""
+        return chain.from_iterable(getattr(self, method)() for _, method in self.MODULE_ANALYZERS)
+    
+    def analyze_stream(self, input_file: str):
+        """
+        Analyze an all-stats JSON file one firewall at a time (requires ijson).
+        
+        Each analyzer makes its own pass over the file, so proposals come out in
+        the same order as analyze_all() while only one firewall's data is held
+        in memory. The analyzer sees the whole module in a single call (its
+        firewalls are parsed as it iterates), so analyzers that stop after the
+        first suitable firewall behave as they do on loaded data. A minimal
+        per-firewall system entry is kept so other modules can still resolve
+        hostnames.
+        
+        Args:
+            input_file: Path to JSON output from pa_query.py all-stats
+        """
+        system_stubs = {}
+        
+        for module, method in self.MODULE_ANALYZERS:
+            with open(input_file, 'rb') as f:
+                firewalls = _StreamedModule(self._stream_firewalls(f, module, system_stubs))
+                self.data = {'system': system_stubs, module: firewalls}
+                self._hostnames = None
+                self.proposals.extend(getattr(self, method)())
+        
+        self.data = {}
+        self._hostnames = None
+        self._finalize_proposals()
+    
+    def _stream_firewalls(self, f, module: str, system_stubs: Dict[str, Any]):
+        """Yield (firewall_name, result) pairs for one module, normalized as __init__ would."""
+        for firewall_name, fw_data in ijson.kvitems(f, module, use_float=True):
+            if module == 'system':
+                system_stubs[firewall_name] = self._system_stub(firewall_name, fw_data)
+            elif module == 'routing':
+                self._normalize_routing_data({module: {firewall_name: fw_data}})
+            yield firewall_name, fw_data
+    
+    def analyze_parallel(self, workers: int):
+        """
+        Analyze all modules with per-firewall work spread over a worker pool.
+        
+        Each (analyzer, firewall) pair becomes a task carrying only that
+        firewall's module result and system stub (for hostname lookups).
+        Routing tasks after the first firewall with a routing table are told
+        the route counts example was already emitted. executor.map keeps the
+        task order, so proposals come out exactly as with analyze_all().
+        Routing normalization already happened in __init__.
+        
+        The analyzers are pure-Python dict walks, so threads only run them in
+        parallel on free-threaded (no-GIL) builds; otherwise processes are used.
+        
+        Args:
+            workers: Number of worker processes (or threads)
+        """
+        system_stubs = {
+            firewall_name: self._system_stub(firewall_name, fw_data)
+            for firewall_name, fw_data in self.data.get('system', _EMPTY).items()
+        }
+        tasks = []
+        for module, method in self.MODULE_ANALYZERS:
+            route_counts_emitted = False
+            for firewall_name, fw_data in self.data.get(module, {}).items():
+                options = {}
+                if method == 'iter_routing_proposals':
+                    options['route_counts_emitted'] = route_counts_emitted
+                    route_counts_emitted = route_counts_emitted or bool(
+                        fw_data.get('success') and fw_data['data'].get('routing_table')
+                    )
+                tasks.append((
+                    method, module, {firewall_name: fw_data},
+                    {firewall_name: system_stubs[firewall_name]} if firewall_name in system_stubs else {},
+                    options,
+                ))
+        
+        # Batch small tasks per process round trip (ignored by threads)
+        chunksize, extra = divmod(len(tasks), workers * 4)
+        chunksize += 1 if extra else 0
+        
+        if getattr(sys, '_is_gil_enabled', lambda: True)():
+            executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+        
+        with executor:
+            for proposals in executor.map(_analyze_firewalls, tasks, chunksize=max(chunksize, 1)):
+                self.proposals.extend(proposals)
+        
+        self._finalize_proposals()
+    
+    @staticmethod
+    def _system_stub(firewall_name: str, fw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a firewall's system module result to what hostname lookups need."""
+        data = fw_data.get('data') or _EMPTY
+        if not fw_data.get('success') or 'system_info' not in data:
+            return {'success': False}
+        hostname = _dig(data['system_info'], 'system', 'hostname', default=firewall_name)
+        return {'success': True, 'data': {'system_info': {'system': {'hostname': hostname}}}}
     
     def generate_summary(self) -> Dict[str, Any]:
         """Generate a summary of all proposals."""
-        # Count unique measurement names
         unique_measurements = set()
-        measurements_by_category = defaultdict(list)
+        # Insertion-ordered dicts act as ordered sets: O(1) membership, first-seen order
+        measurements_by_category = defaultdict(dict)
         total_tags = 0
         total_fields = 0
-        cardinality_distribution = defaultdict(int)
+        cardinality_distribution = Counter()
         
         for proposal in self.proposals:
-            measurement_name = proposal.measurement
-            unique_measurements.add(measurement_name)
-            
-            category = proposal.category
-            if measurement_name not in measurements_by_category[category]:
-                measurements_by_category[category].append(measurement_name)
-            
-            total_tags += len([t for t in proposal.tags.values() if t is not None])
-            total_fields += len([f for f in proposal.fields.values() if f is not None])
+            unique_measurements.add(proposal.measurement)
+            measurements_by_category[proposal.category][proposal.measurement] = None
+            # tags/fields map names to spec dicts (never None), so len() is the count
+            total_tags += len(proposal.tags)
+            total_fields += len(proposal.fields)
             cardinality_distribution[proposal.cardinality] += 1
         
         summary = {
             'total_measurements': len(unique_measurements),
-            'measurements_by_category': dict(measurements_by_category),
+            'measurements_by_category': {
+                category: list(measurements) for category, measurements in measurements_by_category.items()
+            },
             'total_tags': total_tags,
             'total_fields': total_fields,
             'cardinality_distribution': dict(cardinality_distribution),
@@ -1608,11 +2095,14 @@ class ComprehensiveDataAnalyzer:
         
         return summary
     
-    def print_summary(self):
-        """Print analysis summary."""
-        summary = self.generate_summary()
+    def print_summary(self, summary: Dict[str, Any] = None):
+        """Print analysis summary (generated from the proposals unless given)."""
+        if summary is None:
+            summary = self.generate_summary()
         
         if RICH_AVAILABLE:
+            from rich.panel import Panel
+            
             # Summary panel
             summary_text = f"[bold]Total Unique Measurements:[/bold] {summary['total_measurements']}\n\n"
             summary_text += "[bold]By Category:[/bold]\n"
@@ -1623,9 +2113,9 @@ class ComprehensiveDataAnalyzer:
             self.console.print("\n")
             self.console.print(panel)
         else:
-            print("\n" + "="*80)
+            print(f"\n{_SEP_EQ}")
             print("ANALYSIS SUMMARY")
-            print("="*80)
+            print(_SEP_EQ)
             print(f"Total Unique Measurements: {summary['total_measurements']}")
             print("\nBy Category:")
             for category, measurements in sorted(summary['measurements_by_category'].items()):
@@ -1640,6 +2130,10 @@ class ComprehensiveDataAnalyzer:
     
     def _print_proposal_rich(self, proposal: InfluxDBSchemaProposal, index: int):
         """Print proposal using Rich formatting."""
+        from rich import box
+        from rich.console import Group
+        from rich.table import Table
+        
         # Main info table
         table = Table(
             title=f"[bold cyan]{index}. {proposal.measurement}[/bold cyan]",
@@ -1655,7 +2149,8 @@ class ComprehensiveDataAnalyzer:
         table.add_row("Update Frequency", proposal.update_frequency)
         table.add_row("Data Points", str(proposal.data_points_per_collection))
         
-        self.console.print(table)
+        # Collect every renderable and print once per proposal
+        parts = [table]
         
         # Tags table
         if proposal.tags:
@@ -1673,7 +2168,7 @@ class ComprehensiveDataAnalyzer:
                     info.get('description', '')[:40]
                 )
             
-            self.console.print(tags_table)
+            parts.append(tags_table)
         
         # Fields table
         if proposal.fields:
@@ -1693,86 +2188,117 @@ class ComprehensiveDataAnalyzer:
                     info.get('description', '')[:40]
                 )
             
-            self.console.print(fields_table)
+            parts.append(fields_table)
         
         # Notes
         if proposal.notes:
-            self.console.print(f"\n[dim]Notes:[/dim]")
-            for note in proposal.notes:
-                self.console.print(f"  [dim]• {note}[/dim]")
+            parts.append("\n[dim]Notes:[/dim]\n" + "\n".join(f"  [dim]• {note}[/dim]" for note in proposal.notes))
         
-        self.console.print("\n")
+        parts.append("\n")
+        self.console.print(Group(*parts))
     
     def _print_proposal_plain(self, proposal: InfluxDBSchemaProposal, index: int):
         """Print proposal using plain text."""
-        print(f"\n{'='*80}")
-        print(f"{index}. {proposal.measurement}")
-        print(f"{'='*80}")
-        print(f"Category: {proposal.category}")
-        print(f"Description: {proposal.description}")
-        print(f"Cardinality: {proposal.cardinality}")
-        print(f"Update Frequency: {proposal.update_frequency}")
-        print(f"Data Points per Collection: {proposal.data_points_per_collection}")
+        buf = [
+            f"\n{_SEP_EQ}\n{index}. {proposal.measurement}\n{_SEP_EQ}\n"
+            f"Category: {proposal.category}\n"
+            f"Description: {proposal.description}\n"
+            f"Cardinality: {proposal.cardinality}\n"
+            f"Update Frequency: {proposal.update_frequency}\n"
+            f"Data Points per Collection: {proposal.data_points_per_collection}\n"
+        ]
         
         if proposal.tags:
-            print(f"\nTags (Dimensions):")
-            print(f"{'-'*80}")
+            buf.append(f"\nTags (Dimensions):\n{_SEP_DASH}\n")
             for key, info in proposal.tags.items():
-                print(f"  {key:25} = {str(info['example'])[:30]:30} ({info['type']})")
+                buf.append(f"  {key:25} = {str(info['example'])[:30]:30} ({info['type']})\n")
         
         if proposal.fields:
-            print(f"\nFields (Metrics):")
-            print(f"{'-'*80}")
+            buf.append(f"\nFields (Metrics):\n{_SEP_DASH}\n")
             for key, info in proposal.fields.items():
                 unit = f" {info.get('unit')}" if info.get('unit') else ""
-                print(f"  {key:25} = {str(info['example'])[:15]:15} ({info['type']}{unit})")
+                buf.append(f"  {key:25} = {str(info['example'])[:15]:15} ({info['type']}{unit})\n")
         
         if proposal.notes:
-            print(f"\nNotes:")
+            buf.append("\nNotes:\n")
             for note in proposal.notes:
-                print(f"  • {note}")
+                buf.append(f"  • {note}\n")
+        
+        # One write per proposal rather than one per line
+        sys.stdout.write("".join(buf))
     
-    def export_schema(self, output_file: str):
-        """Export schema proposals to JSON."""
-        summary = self.generate_summary()
+    def export_schema(self, output_file: str, compress: bool = False, summary: Dict[str, Any] = None):
+        """
+        Export schema proposals to JSON (gzip-compressed if compress or a .gz name).
+        
+        summary is generate_summary()'s result when the caller already has it.
+        """
+        if summary is None:
+            summary = self.generate_summary()
         
         schema = {
             'version': '1.0',
             'generated_for': 'Palo Alto Networks Firewall Monitoring',
             'total_unique_measurements': summary['total_measurements'],
             'total_proposals': len(self.proposals),
-            'note': 'total_proposals may be higher than unique measurements due to per-VRF examples',
+            'note': (
+                'total_proposals may be higher than unique measurements due to per-VRF examples; '
+                'tags are listed in sorted key order (the canonical InfluxDB write order)'
+            ),
             'measurements': [p.to_dict() for p in self.proposals]
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(schema, f, indent=2)
+        _json_dump(schema, output_file, compress)
         
         print(f"\n✅ Schema proposals exported to: {output_file}")
     
-    def run_analysis(self, export_file: str = None):
-        """Run complete analysis and display results."""
-        print("\n" + "="*80)
-        print("PALO ALTO FIREWALL - COMPREHENSIVE DATA ANALYSIS")
-        print("InfluxDB Schema Design")
-        print("="*80 + "\n")
+    def run_analysis(self, export_file: str = None, stream_file: str = None, workers: int = None,
+                     compress: bool = False, quiet: bool = False):
+        """Run complete analysis and display results.
         
-        # Perform analysis
-        self.analyze_all()
+        If stream_file is given, the data is read incrementally from that file
+        (see analyze_stream) instead of using the data passed to __init__.
+        With workers > 1 the analysis runs in a worker pool (see analyze_parallel).
+        compress gzips the exported schema (see export_schema).
+        quiet skips the report (banner, summary, proposals and note) and only
+        exports, for automated runs that just need the schema file.
+        """
+        if not quiet:
+            print("\n" + "="*80)
+            print("PALO ALTO FIREWALL - COMPREHENSIVE DATA ANALYSIS")
+            print("InfluxDB Schema Design")
+            print("="*80 + "\n")
         
-        # Print summary first
-        self.print_summary()
+        # Perform analysis
+        if stream_file:
+            self.analyze_stream(stream_file)
+        elif workers and workers > 1:
+            self.analyze_parallel(workers)
+        else:
+            self.analyze_all()
         
-        # Print all proposals
-        for idx, proposal in enumerate(self.proposals, 1):
-            self.print_proposal(proposal, idx)
+        summary = None
+        if not quiet:
+            # Print summary first; the proposals don't change after analysis,
+            # so the export reuses it instead of scanning them again
+            summary = self.generate_summary()
+            self.print_summary(summary)
+            
+            # Print all proposals
+            for idx, proposal in enumerate(self.proposals, 1):
+                self.print_proposal(proposal, idx)
         
         # Export if requested
         if export_file:
-            self.export_schema(export_file)
+            self.export_schema(export_file, compress, summary)
+        
+        if quiet:
+            return
         
         # Final note
         if RICH_AVAILABLE:
+            from rich.panel import Panel
+            
             note = Panel(
                 self.firewall_tag_note,
                 title="[bold yellow]Important Note[/bold yellow]",
@@ -1786,6 +2312,15 @@ class ComprehensiveDataAnalyzer:
             print(self.firewall_tag_note)
 
 
+def _analyze_firewalls(task: Tuple[str, str, Dict[str, Any], Dict[str, Any], Dict[str, Any]]) -> List[InfluxDBSchemaProposal]:
+    """Run one proposal generator over a slice of one module (analyze_parallel worker)."""
+    method, module, firewalls, system_stubs, options = task
+    analyzer = ComprehensiveDataAnalyzer({})
+    # Already normalized by the parent analyzer, so bypass __init__'s pass
+    analyzer.data = {'system': system_stubs, module: firewalls}
+    return list(getattr(analyzer, method)(**options))
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -1814,6 +2349,19 @@ Examples:
   
   # Pipe and export in one command
   python pa_query.py -o json all-stats | python data_analyzer.py --export schema.json
+  
+  # Gzip the exported schema (also implied by a .gz filename)
+  python data_analyzer.py stats.json --export schema.json.gz
+  python data_analyzer.py stats.json --export schema.json --compress
+  
+  # Automation: export only, without the printed report
+  python data_analyzer.py stats.json --export schema.json --quiet
+  
+  # Large files: parse one firewall at a time (requires ijson)
+  python data_analyzer.py stats.json --stream --export schema.json
+  
+  # Large fleets: analyze firewalls in parallel worker processes
+  python data_analyzer.py stats.json --workers 4
 
 Note: This analyzer expects the specific JSON structure produced by pa_query.py.
       Using other data sources may result in analysis errors.
@@ -1841,6 +2389,33 @@ Note: This analyzer expects the specific JSON structure produced by pa_query.py.
         help='Export schema to JSON file'
     )
     
+    parser.add_argument(
+        '--compress',
+        action='store_true',
+        help='Gzip the exported schema (implied when the --export file name ends in .gz)'
+    )
+    
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Skip the printed report; only export the schema (use with --export)'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Parse the input file incrementally, one firewall at a time, to keep memory low '
+             'on large files (requires ijson; not supported with stdin)'
+    )
+    
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        metavar='N',
+        help='Analyze firewalls in N worker processes (default: single process; '
+             'not supported with --stream)'
+    )
+    
     args = parser.parse_args()
     
     # Determine input source (prioritize positional argument, then flag, then stdin)
@@ -1853,14 +2428,43 @@ Note: This analyzer expects the specific JSON structure produced by pa_query.py.
         print("\nError: No input provided. Provide a file path or pipe JSON data via stdin.", file=sys.stderr)
         sys.exit(1)
     
+    if args.workers is not None and args.workers < 1:
+        print("❌ Error: --workers must be at least 1", file=sys.stderr)
+        sys.exit(1)
+    
+    # Streaming mode reads the file itself, one firewall at a time
+    if args.stream:
+        if args.workers and args.workers > 1:
+            print("❌ Error: --workers cannot be combined with --stream", file=sys.stderr)
+            sys.exit(1)
+        if not IJSON_AVAILABLE:
+            print("❌ Error: --stream requires ijson: pip install ijson", file=sys.stderr)
+            sys.exit(1)
+        if not input_file:
+            print("❌ Error: --stream requires an input file (stdin cannot be re-read)", file=sys.stderr)
+            sys.exit(1)
+        if not Path(input_file).is_file():
+            print(f"❌ Error: Input file '{input_file}' not found", file=sys.stderr)
+            sys.exit(1)
+        
+        analyzer = ComprehensiveDataAnalyzer({})
+        try:
+            analyzer.run_analysis(export_file=args.export, stream_file=input_file, compress=args.compress,
+                                  quiet=args.quiet)
+        except ijson.JSONError as e:
+            print(f"❌ Error: Invalid JSON in '{input_file}': {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
     # Load the data
     data = None
     try:
         if input_file:
-            with open(input_file, 'r') as f:
-                data = json.load(f)
+            data = _json_loads(Path(input_file).read_bytes())
         else:
-            data = json.load(sys.stdin)
+            # Read raw bytes where possible; orjson parses them without decoding first
+            stdin = getattr(sys.stdin, 'buffer', sys.stdin)
+            data = _json_loads(stdin.read())
     except FileNotFoundError:
         print(f"❌ Error: Input file '{input_file}' not found", file=sys.stderr)
         sys.exit(1)
@@ -1879,7 +2483,8 @@ Note: This analyzer expects the specific JSON structure produced by pa_query.py.
     
     # Run analysis (data will always be defined here if we reach this point)
     analyzer = ComprehensiveDataAnalyzer(data)
-    analyzer.run_analysis(export_file=args.export)
+    analyzer.run_analysis(export_file=args.export, workers=args.workers, compress=args.compress,
+                          quiet=args.quiet)
 
 
 if __name__ == '__main__':
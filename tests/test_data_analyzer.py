@@ -1,6 +1,7 @@
 """Comprehensive tests for data_analyzer.py."""
 
 import pytest
+import gzip
 import json
 import tempfile
 from pathlib import Path
@@ -11,6 +12,10 @@ import io
 from data_analyzer import (
     InfluxDBSchemaProposal,
     ComprehensiveDataAnalyzer,
+    _count_protocols,
+    _dig,
+    _entries,
+    _new_proposal,
     main
 )
 
@@ -34,6 +39,15 @@ class TestInfluxDBSchemaProposal:
         assert proposal.fields == {}
         assert proposal.cardinality == "low"
     
+    @pytest.mark.unit
+    def test_slots(self):
+        """Test proposals carry no per-instance __dict__."""
+        proposal = InfluxDBSchemaProposal('m', 'd', 'c')
+        
+        assert not hasattr(proposal, '__dict__')
+        with pytest.raises(AttributeError):
+            proposal.example_values = {}
+    
     @pytest.mark.unit
     def test_add_tag(self):
         """Test adding tag to schema proposal."""
@@ -56,7 +70,77 @@ class TestInfluxDBSchemaProposal:
         assert proposal.fields['cpu_usage']['type'] == 'float'
         assert proposal.fields['cpu_usage']['unit'] == '%'
         assert proposal.fields['cpu_usage']['description'] == 'CPU usage percentage'
-    
+
+    @pytest.mark.unit
+    def test_add_fields_bulk(self):
+        """Test that bulk field adds match individual add_field calls."""
+        specs = [
+            ('cpu_usage', 45.5, '%', 'CPU usage percentage'),
+            ('state', 'active', '', 'HA state'),
+            ('enabled', True, '', 'Enabled flag'),
+        ]
+        single = InfluxDBSchemaProposal('test', 'desc', 'cat')
+        for spec in specs:
+            single.add_field(*spec)
+
+        bulk = InfluxDBSchemaProposal('test', 'desc', 'cat')
+        bulk.add_fields_bulk(specs)
+
+        assert bulk.fields == single.fields
+        assert list(bulk.fields) == ['cpu_usage', 'state', 'enabled']
+
+    @pytest.mark.unit
+    def test_add_tags_bulk(self):
+        """Test that bulk tag adds match individual add_tag calls."""
+        specs = [
+            ('hostname', 'fw-01', ''),
+            ('slot', 1, 'Hardware slot number'),
+        ]
+        single = InfluxDBSchemaProposal('test', 'desc', 'cat')
+        for spec in specs:
+            single.add_tag(*spec)
+
+        bulk = InfluxDBSchemaProposal('test', 'desc', 'cat')
+        bulk.add_tags_bulk(specs)
+
+        assert bulk.tags == single.tags
+        assert list(bulk.tags) == ['hostname', 'slot']
+
+    @pytest.mark.unit
+    def test_finalize_sorts_tags(self):
+        """Test that finalize puts tags in sorted key order."""
+        proposal = InfluxDBSchemaProposal('test', 'desc', 'cat')
+        proposal.add_tag('hostname', 'fw-01')
+        proposal.add_tag('vrf', 'default')
+        proposal.add_tag('afi', 'ipv4')
+
+        proposal.finalize()
+
+        assert list(proposal.tags) == ['afi', 'hostname', 'vrf']
+        assert list(proposal.to_dict()['tags']) == ['afi', 'hostname', 'vrf']
+
+    @pytest.mark.unit
+    def test_build(self):
+        """Test that build() matches a proposal assembled step by step."""
+        manual = InfluxDBSchemaProposal('test', 'desc', 'cat')
+        manual.add_tag('host', 'server1', 'Server hostname')
+        manual.add_field('value', 100, 'count', 'A value')
+        manual.notes.append('Test note')
+        manual.cardinality = 'medium'
+        manual.data_points_per_collection = 4
+
+        built = InfluxDBSchemaProposal.build(
+            'test', 'desc', 'cat',
+            tags=[('host', 'server1', 'Server hostname')],
+            fields=[('value', 100, 'count', 'A value')],
+            notes=('Test note',),
+            cardinality='medium',
+            data_points_per_collection=4,
+        )
+
+        assert built.to_dict() == manual.to_dict()
+        assert InfluxDBSchemaProposal.build('t', 'd', 'c').cardinality == 'low'
+
     @pytest.mark.unit
     def test_get_data_type_boolean(self):
         """Test data type detection for boolean."""
@@ -271,7 +355,129 @@ class TestComprehensiveDataAnalyzer:
         # Check for BGP peer proposal
         peer_proposal = [p for p in analyzer.proposals if 'bgp_peer' in p.measurement]
         assert len(peer_proposal) > 0
-    
+
+    @pytest.mark.unit
+    def test_analyze_routing_multiple_firewalls(self):
+        """Test that route counts are emitted once while later firewalls still get peer proposals."""
+        routing_data = {
+            'routing': {
+                f'fw{i}': {
+                    'success': True,
+                    'data': {
+                        'bgp_peer_status': {'peer1': {'peer-ip': f'192.168.{i}.2'}},
+                        'routing_table': {'default': {'0.0.0.0/0': [{'protocol': 'static'}]}},
+                    }
+                }
+                for i in range(2)
+            }
+        }
+        
+        analyzer = ComprehensiveDataAnalyzer(routing_data)
+        analyzer.analyze_routing_module()
+        
+        measurements = [p.measurement for p in analyzer.proposals]
+        assert measurements.count('palo_alto_routing_table_counts') == 1
+        assert measurements.count('palo_alto_bgp_peer') == 2
+
+    @pytest.mark.unit
+    def test_analyze_routing_skips_placeholder_entries(self):
+        """Test that peers and paths without their identifying key yield no proposal."""
+        routing_data = {
+            'routing': {
+                'test-fw': {
+                    'success': True,
+                    'data': {
+                        'bgp_peer_status': {'peer1': {'state': None}},
+                        'bgp_path_monitor': {'entry': [{'metric': None}]},
+                    }
+                }
+            }
+        }
+        
+        analyzer = ComprehensiveDataAnalyzer(routing_data)
+        analyzer.analyze_routing_module()
+        
+        measurements = [p.measurement for p in analyzer.proposals]
+        assert 'palo_alto_bgp_peer' not in measurements
+        assert 'palo_alto_bgp_path_monitor' not in measurements
+
+    @pytest.mark.unit
+    def test_analyze_routing_path_monitor_ids(self):
+        """Test path monitor fields cover every monitor index, contiguous or not."""
+        routing_data = {
+            'routing': {
+                'test-fw': {
+                    'success': True,
+                    'data': {
+                        'bgp_path_monitor': {
+                            'entry': [{
+                                'destination': '0.0.0.0/0',
+                                'pathmonitor-status': 'Up',
+                                'monitordst-0': '8.8.8.8',
+                                'monitorstatus-0': 'Up',
+                                'monitordst-2': '1.1.1.1',
+                                'monitorstatus-2': 'Down',
+                            }]
+                        }
+                    }
+                }
+            }
+        }
+        
+        analyzer = ComprehensiveDataAnalyzer(routing_data)
+        analyzer.analyze_routing_module()
+        
+        proposal = next(p for p in analyzer.proposals if p.measurement == 'palo_alto_bgp_path_monitor')
+        assert proposal.fields['monitor_0_destination']['example'] == '8.8.8.8'
+        assert proposal.fields['monitor_2_status']['example'] == 'Down'
+        assert 'monitor_1_destination' not in proposal.fields
+        assert 'Example shows 2 health check monitors per path' in proposal.notes
+
+    @pytest.mark.unit
+    def test_normalize_legacy_routing_data(self):
+        """Test that legacy routing data is converted to the advanced format."""
+        routing_data = {
+            'routing': {
+                'test-fw': {
+                    'success': True,
+                    'data': {
+                        'routing_mode': 'legacy',
+                        'bgp_summary': {
+                            'entry': {'@virtual-router': 'vr1', 'router-id': '1.1.1.1'}
+                        },
+                        'bgp_peer_status': {
+                            'entry': {
+                                '@peer': 'peer1',
+                                'status': 'Established',
+                                'peer-address': '192.168.1.2',
+                                'remote-as': 65001
+                            }
+                        },
+                        'routing_table': {
+                            'entry': [
+                                {'virtual-router': 'vr1', 'destination': '0.0.0.0/0', 'flags': 'A S'},
+                                {'virtual-router': 'vr1', 'destination': '0.0.0.0/0', 'flags': 'S'}
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+
+        analyzer = ComprehensiveDataAnalyzer(routing_data)
+        data = analyzer.data['routing']['test-fw']['data']
+
+        assert data['bgp_summary'] == {'vr1': {'router-id': '1.1.1.1'}}
+        assert data['bgp_peer_status'] == {
+            'peer1': {'state': 'Established', 'peer-ip': '192.168.1.2', 'remote-as': 65001}
+        }
+        assert data['routing_table'] == {
+            'vr1': {'0.0.0.0/0': [
+                {'destination': '0.0.0.0/0', 'flags': 'A S'},
+                {'destination': '0.0.0.0/0', 'flags': 'S'}
+            ]}
+        }
+
     @pytest.mark.unit
     def test_analyze_counters_module(self):
         """Test analyzing counters module."""
@@ -373,6 +579,54 @@ class TestComprehensiveDataAnalyzer:
         # Check for VPN flows proposal
         flows_proposal = [p for p in analyzer.proposals if 'vpn_flows' in p.measurement]
         assert len(flows_proposal) > 0
+
+    @pytest.mark.unit
+    def test_analyze_vpn_module_empty_entry(self):
+        """Test that an empty XML entry (parsed as None) yields no tunnel proposal."""
+        vpn_data = {
+            'vpn': {
+                'test-fw': {
+                    'success': True,
+                    'data': {'vpn_tunnels': {'entries': {'entry': None}}}
+                }
+            }
+        }
+
+        analyzer = ComprehensiveDataAnalyzer(vpn_data)
+        analyzer.analyze_vpn_module()
+
+        assert not [p for p in analyzer.proposals if p.measurement == 'palo_alto_vpn_tunnel']
+
+    @pytest.mark.unit
+    def test_analyze_environmental_module(self):
+        """Test analyzing environmental sensors, using the first slot with entries."""
+        env_data = {
+            'system': {
+                'test-fw': {
+                    'success': True,
+                    'data': {
+                        'environmental': {
+                            'thermal': {
+                                'Slot1': {'entry': []},
+                                'Slot2': {'entry': {'slot': 2, 'description': 'CPU', 'DegreesC': 45.0,
+                                                    'min': 0.0, 'max': 90.0, 'alarm': False}}
+                            },
+                            'fan': {}
+                        }
+                    }
+                }
+            }
+        }
+
+        analyzer = ComprehensiveDataAnalyzer(env_data)
+        analyzer.analyze_environmental_module()
+
+        assert [p.measurement for p in analyzer.proposals] == ['palo_alto_env_thermal']
+        thermal = analyzer.proposals[0]
+        assert thermal.tags['slot']['example'] == 2
+        assert thermal.fields['temperature_c']['example'] == 45.0
+        assert thermal.data_points_per_collection == 1
+        assert thermal.notes[0] == 'One data point per thermal sensor (1 sensors detected)'
     
     @pytest.mark.unit
     def test_analyze_all(self, sample_system_data):
@@ -382,7 +636,19 @@ class TestComprehensiveDataAnalyzer:
         
         # Should analyze system module at minimum
         assert len(analyzer.proposals) > 0
-    
+
+    @pytest.mark.unit
+    def test_iter_proposals(self, sample_system_data, sample_interface_data):
+        """Test that iter_proposals yields analyze_all's proposals without storing them."""
+        data = {**sample_system_data, **sample_interface_data}
+        analyzer = ComprehensiveDataAnalyzer(data)
+
+        yielded = [p.to_dict() for p in analyzer.iter_proposals()]
+        assert analyzer.proposals == []
+
+        analyzer.analyze_all()
+        assert yielded == [p.to_dict() for p in analyzer.proposals]
+
     @pytest.mark.unit
     def test_generate_summary(self, sample_system_data):
         """Test generating analysis summary."""
@@ -397,6 +663,24 @@ class TestComprehensiveDataAnalyzer:
         assert 'total_fields' in summary
         assert summary['total_measurements'] > 0
     
+    @pytest.mark.unit
+    def test_generate_summary_counts(self):
+        """Test summary totals and de-duplicated, first-seen measurement lists."""
+        analyzer = ComprehensiveDataAnalyzer({})
+        for measurement, category in (('m_b', 'cat'), ('m_a', 'cat'), ('m_b', 'cat'), ('m_c', 'other')):
+            proposal = InfluxDBSchemaProposal(measurement, 'desc', category)
+            proposal.add_tag('hostname', 'fw')
+            proposal.add_field('value', None)
+            analyzer.proposals.append(proposal)
+        
+        summary = analyzer.generate_summary()
+        
+        assert summary['total_measurements'] == 3
+        assert summary['measurements_by_category'] == {'cat': ['m_b', 'm_a'], 'other': ['m_c']}
+        assert summary['total_tags'] == 4
+        assert summary['total_fields'] == 4
+        assert summary['cardinality_distribution'] == {'low': 4}
+    
     @pytest.mark.unit
     def test_export_schema(self, sample_system_data, tmp_path):
         """Test exporting schema to JSON."""
@@ -417,6 +701,21 @@ class TestComprehensiveDataAnalyzer:
         assert 'total_unique_measurements' in schema
         assert len(schema['measurements']) > 0
     
+    @pytest.mark.unit
+    @pytest.mark.parametrize('name,compress', [('schema.json.gz', False), ('schema.json', True)])
+    def test_export_schema_gzip(self, sample_system_data, tmp_path, name, compress):
+        """Test gzip export for a .gz file name or an explicit compress flag."""
+        analyzer = ComprehensiveDataAnalyzer(sample_system_data)
+        analyzer.analyze_all()
+        
+        output_file = tmp_path / name
+        analyzer.export_schema(str(output_file), compress=compress)
+        
+        with gzip.open(output_file, 'rt', encoding='utf-8') as f:
+            schema = json.load(f)
+        
+        assert len(schema['measurements']) == len(analyzer.proposals)
+    
     @pytest.mark.unit
     @patch('data_analyzer.RICH_AVAILABLE', False)
     def test_print_summary_without_rich(self, sample_system_data, capsys):
@@ -468,6 +767,110 @@ class TestComprehensiveDataAnalyzer:
         captured = capsys.readouterr()
         assert len(captured.out) > 0
 
+    @pytest.mark.unit
+    def test_run_analysis_generates_summary_once(self, sample_system_data, tmp_path, capsys):
+        """Test that the printed summary is reused for the export."""
+        analyzer = ComprehensiveDataAnalyzer(sample_system_data)
+        
+        with patch.object(analyzer, 'generate_summary', wraps=analyzer.generate_summary) as generate:
+            analyzer.run_analysis(export_file=str(tmp_path / "schema.json"))
+        
+        assert generate.call_count == 1
+
+    @pytest.mark.unit
+    def test_run_analysis_quiet(self, sample_system_data, tmp_path, capsys):
+        """Test that quiet mode exports without printing the report."""
+        analyzer = ComprehensiveDataAnalyzer(sample_system_data)
+        output_file = tmp_path / "schema.json"
+        
+        analyzer.run_analysis(export_file=str(output_file), quiet=True)
+        
+        assert output_file.exists()
+        captured = capsys.readouterr()
+        assert 'exported to' in captured.out
+        assert 'COMPREHENSIVE DATA ANALYSIS' not in captured.out
+        assert analyzer.proposals[0].measurement not in captured.out
+
+    @pytest.mark.unit
+    def test_analyze_stream_matches_analyze_all(self, sample_system_data, sample_interface_data, tmp_path):
+        """Test that streaming analysis yields the same proposals as a full load."""
+        pytest.importorskip('ijson')
+        data = {**sample_system_data, **sample_interface_data}
+        data['system']['test-fw']['data']['system_info']['system']['hostname'] = 'fw-actual'
+        input_file = tmp_path / "stats.json"
+        input_file.write_text(json.dumps(data))
+
+        full = ComprehensiveDataAnalyzer(json.loads(input_file.read_text()))
+        full.analyze_all()
+
+        streamed = ComprehensiveDataAnalyzer({})
+        streamed.analyze_stream(str(input_file))
+
+        assert len(streamed.proposals) > 0
+        assert [p.to_dict() for p in streamed.proposals] == [p.to_dict() for p in full.proposals]
+        assert streamed.data == {}
+        # Interface proposals still resolve the hostname from the system module
+        interface_proposal = next(p for p in streamed.proposals if p.category == 'interfaces')
+        assert interface_proposal.tags['hostname']['example'] == 'fw-actual'
+
+    @pytest.mark.unit
+    def test_analyze_stream_multiple_routing_firewalls(self, tmp_path):
+        """Test that streaming keeps the routing analyzer's first-firewall-only route counts."""
+        pytest.importorskip('ijson')
+        routing_table = {'default': {'0.0.0.0/0': [{'protocol': 'static'}]}}
+        data = {
+            'routing': {
+                f'fw{i}': {'success': True, 'data': {'routing_table': routing_table}}
+                for i in range(3)
+            }
+        }
+        input_file = tmp_path / "stats.json"
+        input_file.write_text(json.dumps(data))
+
+        full = ComprehensiveDataAnalyzer(json.loads(input_file.read_text()))
+        full.analyze_all()
+
+        streamed = ComprehensiveDataAnalyzer({})
+        streamed.analyze_stream(str(input_file))
+
+        assert [p.to_dict() for p in streamed.proposals] == [p.to_dict() for p in full.proposals]
+
+    @pytest.mark.unit
+    def test_analyze_parallel_matches_analyze_all(self, sample_system_data, sample_interface_data):
+        """Test that process-pool analysis yields the same proposals in the same order."""
+        data = {**sample_system_data, **sample_interface_data}
+        data['routing'] = {
+            f'fw{i}': {
+                'success': True,
+                'data': {'routing_table': {'default': {'0.0.0.0/0': [{'protocol': 'static'}]}}}
+            }
+            for i in range(2)
+        }
+
+        full = ComprehensiveDataAnalyzer(json.loads(json.dumps(data)))
+        full.analyze_all()
+
+        parallel = ComprehensiveDataAnalyzer(data)
+        parallel.analyze_parallel(2)
+
+        assert [p.to_dict() for p in parallel.proposals] == [p.to_dict() for p in full.proposals]
+
+    @pytest.mark.unit
+    def test_analyze_parallel_threads_without_gil(self, sample_system_data, sample_interface_data, monkeypatch):
+        """Test that free-threaded builds analyze in threads with the same output."""
+        monkeypatch.setattr(sys, '_is_gil_enabled', lambda: False, raising=False)
+        data = {**sample_system_data, **sample_interface_data}
+
+        full = ComprehensiveDataAnalyzer(json.loads(json.dumps(data)))
+        full.analyze_all()
+
+        with patch('data_analyzer.ProcessPoolExecutor') as process_pool:
+            threaded = ComprehensiveDataAnalyzer(data)
+            threaded.analyze_parallel(2)
+
+        process_pool.assert_not_called()
+        assert [p.to_dict() for p in threaded.proposals] == [p.to_dict() for p in full.proposals]
+
 
 class TestMainFunction:
     """Test cases for main CLI function."""
@@ -631,7 +1034,92 @@ class TestDataAnalyzerEdgeCases:
         
         # Should handle partial data
         assert len(analyzer.proposals) > 0
-    
+
+    @pytest.mark.unit
+    def test_analyze_resources_without_system_info(self):
+        """Test that resource proposals don't depend on system_info being present."""
+        data = {
+            'system': {
+                'test-fw': {
+                    'success': True,
+                    'data': {
+                        'resource_usage': {'cpu_idle': 90.0}
+                    }
+                }
+            }
+        }
+
+        analyzer = ComprehensiveDataAnalyzer(data)
+        analyzer.analyze_system_module()
+
+        cpu = next(p for p in analyzer.proposals if p.measurement == 'palo_alto_cpu_usage')
+        assert cpu.tags['hostname']['example'] is None
+
+    @pytest.mark.unit
+    def test_missing_scaled_values_stay_none(self):
+        """Test that missing uptime/memory values are reported as None rather than 0.0."""
+        data = {
+            'system': {
+                'test-fw': {
+                    'success': True,
+                    'data': {
+                        'system_info': {'system': {'hostname': 'test-fw'}},
+                        'resource_usage': {'memory_total_mib': 4096}
+                    }
+                }
+            }
+        }
+
+        analyzer = ComprehensiveDataAnalyzer(data)
+        analyzer.analyze_system_module()
+        by_name = {p.measurement: p for p in analyzer.proposals}
+
+        assert by_name['palo_alto_system_identity'].fields['vm_mem_mb']['example'] is None
+        assert by_name['palo_alto_system_uptime'].fields['uptime_days']['example'] is None
+        assert by_name['palo_alto_memory_usage'].fields['memory_usage_percent']['example'] is None
+
+    @pytest.mark.unit
+    def test_dig_nested_lookup(self):
+        """Test nested lookups stop at missing, None or non-dict steps."""
+        data = {'a': {'b': {'c': 1}, 'n': None, 's': 'text'}}
+
+        assert _dig(data, 'a', 'b', 'c') == 1
+        assert _dig(data, 'a', 'missing', 'c', default='x') == 'x'
+        assert _dig(data, 'a', 'n', default={}) == {}
+        assert _dig(data, 'a', 's', 'c') is None
+
+    @pytest.mark.unit
+    def test_entries_normalizes_tables(self):
+        """Test entries/entry unwrapping for single, multiple and empty tables."""
+        assert _entries({'entries': {'entry': {'name': 'gw1'}}}) == [{'name': 'gw1'}]
+        assert _entries({'entries': {'entry': [{'name': 'a'}, {'name': 'b'}]}}) == [{'name': 'a'}, {'name': 'b'}]
+        assert _entries({'entries': None}) == []
+        assert _entries(None) == []
+
+    @pytest.mark.unit
+    def test_count_protocols_merges_normalized_names(self):
+        """Test protocol counts merge names that normalize to the same key."""
+        vrf_routes = {
+            '10.0.0.0/24': [{'protocol': 'BGP'}, {'protocol': 'bgp '}],
+            '10.0.1.0/24': [{'protocol': 'OSPF Intra'}, {}],
+            'not-a-list': {'protocol': 'static'},
+        }
+
+        counts = _count_protocols(vrf_routes)
+
+        assert counts == {'bgp': 2, 'ospf_intra': 1, 'unknown': 1}
+        assert list(counts) == ['bgp', 'ospf_intra', 'unknown']
+
+    @pytest.mark.unit
+    def test_new_proposal_has_hostname_tag(self):
+        """Test proposals from _new_proposal start with the hostname tag."""
+        proposal = _new_proposal('m', 'desc', 'cat', 'fw-01', 'Device hostname')
+
+        assert proposal.measurement == 'm'
+        assert list(proposal.tags) == ['hostname']
+        assert proposal.tags['hostname']['example'] == 'fw-01'
+        assert proposal.tags['hostname']['description'] == 'Device hostname'
+
     @pytest.mark.unit
     def test_proposal_with_none_values(self):
         """Test proposal with None values in tags and fields."""
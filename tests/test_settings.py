@@ -10,6 +10,12 @@ import tempfile
 from config.settings import Settings
 
 
+@pytest.fixture(autouse=True)
+def no_disk_config_cache(monkeypatch):
+    """Keep tests from leaving pickled config caches next to their temp files."""
+    monkeypatch.setenv('PA_DISABLE_CONFIG_CACHE', 'true')
+
+
 class TestSettingsEnabledParameter:
     """Test cases for the firewall enabled parameter functionality."""
 
@@ -465,3 +471,178 @@ query:
             finally:
                 os.unlink(f.name)
 
+    @pytest.mark.unit
+    def test_get_cache_reset_on_config_reassignment(self):
+        """Test that memoized get() lookups are dropped when config is replaced."""
+        settings = Settings(config_file='/nonexistent/config.yaml')
+        assert settings.get('logging.level') == 'INFO'
+        
+        settings.config = {'logging': {'level': 'DEBUG'}}
+        assert settings.get('logging.level') == 'DEBUG'
+        assert settings.get('logging.missing', 'fallback') == 'fallback'
+
+    @pytest.mark.unit
+    def test_environment_overrides(self):
+        """Test that environment variables override YAML values and are cast."""
+        config_yaml = """
+logging:
+  level: "DEBUG"
+  max_bytes: 1024
+query:
+  max_retries: 5
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write(config_yaml)
+            f.flush()
+            
+            try:
+                env = {'LOG_MAX_BYTES': '2048', 'PA_RETRY_DELAY': '7'}
+                with patch.dict(os.environ, env):
+                    settings = Settings(config_file=f.name)
+                
+                assert settings.get('logging.level') == 'DEBUG'
+                assert settings.get('logging.max_bytes') == 2048
+                assert settings.get('logging.backup_count') == 5
+                assert settings.get('query.max_retries') == 5
+                assert settings.get('query.retry_delay') == 7
+            finally:
+                os.unlink(f.name)
+
+    @pytest.mark.unit
+    def test_firewalls_normalized_on_first_access(self):
+        """Test that listing firewalls does not normalize their configs."""
+        config_yaml = """
+firewalls:
+  fw1:
+    host: "192.168.1.1"
+    port: "8443"
+  fw2:
+    host: "192.168.1.2"
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write(config_yaml)
+            f.flush()
+
+            try:
+                settings = Settings(config_file=f.name)
+                firewalls = settings.get_firewalls()
+
+                assert list(settings.get_firewall_names()) == ['fw1', 'fw2']
+                assert 'fw2' in firewalls
+                assert firewalls._resolved == {}
+
+                fw1 = settings.get_firewall('fw1')
+                assert fw1['port'] == 8443
+                assert fw1['routing_mode'] == 'auto'
+                assert list(firewalls._resolved) == ['fw1']
+
+                # Dotted lookups below the firewall table resolve on demand
+                assert settings.get('firewalls.fw2.routing_mode') == 'auto'
+                assert settings.get('firewalls.fw3.host', 'missing') == 'missing'
+            finally:
+                os.unlink(f.name)
+
+    @pytest.mark.unit
+    def test_parse_bool_handles_unhashable_values(self):
+        """Test that the memoized bool parser falls back for unhashable values."""
+        settings = Settings(config_file='/nonexistent/config.yaml')
+        assert settings._parse_bool('Yes') is True
+        assert settings._parse_bool(0) is False
+        assert settings._parse_bool(['true']) is False
+
+
+class TestSettingsConfigCache:
+    """Test cases for the parsed-YAML cache used by Settings."""
+
+    @pytest.mark.unit
+    def test_cached_config_is_not_shared_between_instances(self):
+        """Test that overrides applied during one load do not leak into the next."""
+        config_yaml = """
+firewalls:
+  test-fw:
+    host: "192.168.1.1"
+    api_key: "test_key"
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write(config_yaml)
+            f.flush()
+            
+            try:
+                with patch.dict(os.environ, {'PA_HOST': '10.0.0.1'}):
+                    first = Settings(config_file=f.name)
+                assert first.get_firewall('test-fw')['host'] == '10.0.0.1'
+                
+                second = Settings(config_file=f.name)
+                assert second.get_firewall('test-fw')['host'] == '192.168.1.1'
+            finally:
+                os.unlink(f.name)
+
+    @pytest.mark.unit
+    def test_loaded_config_is_read_only(self):
+        """Test that the loaded configuration cannot be mutated."""
+        settings = Settings(config_file='/nonexistent/config.yaml')
+        
+        with pytest.raises(TypeError):
+            settings.config['logging']['level'] = 'DEBUG'
+
+    @pytest.mark.unit
+    def test_modified_file_is_reparsed(self):
+        """Test that a changed config file is parsed again instead of served from cache."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write('firewalls:\n  fw1:\n    host: "192.168.1.1"\n')
+            f.flush()
+            
+            try:
+                assert list(Settings(config_file=f.name).get_firewall_names()) == ['fw1']
+                
+                with open(f.name, 'w') as rewritten:
+                    rewritten.write('firewalls:\n  fw1:\n    host: "192.168.1.1"\n  fw2:\n    host: "192.168.1.2"\n')
+                
+                assert set(Settings(config_file=f.name).get_firewall_names()) == {'fw1', 'fw2'}
+            finally:
+                os.unlink(f.name)
+
+    @pytest.mark.unit
+    def test_disk_cache_written_and_reused(self, tmp_path, monkeypatch):
+        """Test that the pickled config is reused by a fresh process-level cache."""
+        monkeypatch.delenv('PA_DISABLE_CONFIG_CACHE')
+        config_file = tmp_path / 'config.yaml'
+        config_file.write_text('firewalls:\n  fw1:\n    host: "192.168.1.1"\n')
+        
+        assert Settings(config_file=str(config_file)).get_firewall('fw1')['host'] == '192.168.1.1'
+        assert (tmp_path / 'config.yaml.pkl').exists()
+        
+        with patch.dict('config.settings._PARSE_CACHE', clear=True):
+            with patch('config.settings.yaml.load') as mock_load:
+                settings = Settings(config_file=str(config_file))
+                mock_load.assert_not_called()
+        
+        assert settings.get_firewall('fw1')['host'] == '192.168.1.1'
+
+    @pytest.mark.unit
+    def test_disk_cache_disabled_by_env(self, tmp_path):
+        """Test that PA_DISABLE_CONFIG_CACHE prevents writing the pickled config."""
+        config_file = tmp_path / 'config.yaml'
+        config_file.write_text('firewalls:\n  fw1:\n    host: "192.168.1.1"\n')
+        
+        Settings(config_file=str(config_file))
+        
+        assert not (tmp_path / 'config.yaml.pkl').exists()
+
+
+class TestLazySettings:
+    """Test cases for the lazily-initialized global settings proxy."""
+
+    @pytest.mark.unit
+    def test_settings_loaded_on_first_access(self):
+        """Test that the proxy builds Settings once, on first attribute access."""
+        from config.settings import _LazySettings
+        
+        with patch('config.settings.Settings') as mock_settings_cls:
+            mock_settings_cls.return_value.get.return_value = 'INFO'
+            proxy = _LazySettings()
+            
+            mock_settings_cls.assert_not_called()
+            assert proxy.get('logging.level') == 'INFO'
+            assert proxy.get('logging.level') == 'INFO'
+            mock_settings_cls.assert_called_once_with()